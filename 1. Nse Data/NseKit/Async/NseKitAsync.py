@@ -56,6 +56,7 @@ from typing import Any, AsyncIterator, Callable, Final, Iterator, TypeVar, Param
 
 import aiohttp
 import feedparser
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
 from rich.text import Text
@@ -332,31 +333,114 @@ def _cache_key(name: str, args: tuple, kwargs: dict) -> str:
     return f"{name}#{hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()}"
 
 
+class _LeaderCancelled(Exception):
+    """Set on an in-flight future whose leading call was cancelled; followers then retry."""
+
+
 def nse_api(
     *,
     ttl: float = 15.0,
     cache: CachePolicy = CachePolicy.READWRITE,
     retries: int = 3,
 ) -> Callable:
-    """Rate-limit + cache decorator for async NSE methods."""
+    """
+    Rate-limit + cache decorator for async NSE methods.
+
+    Identical calls that arrive while one is already in flight await that
+    call's future instead of spending another rate-limit token (single-flight).
+    The result is cached before the in-flight entry is dropped, so a later
+    caller always finds one or the other.  If the leading call is cancelled,
+    a waiting follower takes over the download.
+    """
     def decorator(fn: Callable) -> Callable:
         @functools.wraps(fn)
         async def wrapper(self: "AsyncNse", *args: Any, **kwargs: Any) -> Any:
             policy = _CACHE_POLICY_CTX.get(cache)
             key    = _cache_key(fn.__qualname__, args, kwargs)
-            if policy & CachePolicy.READ:
-                hit = await self._cache.get(key)
-                if hit is not _MISS:
-                    return hit
-            await self._rate_limiter.acquire()
-            result = await fn(self, *args, **kwargs)
-            if (policy & CachePolicy.WRITE) and result is not None:
-                await self._cache.set(key, result, ttl)
-            return result
+            while True:
+                if policy & CachePolicy.READ:
+                    hit = await self._cache.get(key)
+                    if hit is not _MISS:
+                        return hit
+                pending = self._inflight.get(key)
+                if pending is None:
+                    break
+                self._coalesced += 1
+                try:
+                    return await asyncio.shield(pending)
+                except _LeaderCancelled:
+                    continue
+            fut = asyncio.get_running_loop().create_future()
+            self._inflight[key] = fut
+            try:
+                await self._rate_limiter.acquire()
+                result = await fn(self, *args, **kwargs)
+                if (policy & CachePolicy.WRITE) and result is not None:
+                    await self._cache.set(key, result, ttl)
+            except asyncio.CancelledError:
+                fut.set_exception(_LeaderCancelled())
+                fut.exception()          # mark retrieved when nobody else waits
+                raise
+            except BaseException as exc:
+                fut.set_exception(exc)
+                fut.exception()
+                raise
+            else:
+                fut.set_result(result)
+                return result
+            finally:
+                self._inflight.pop(key, None)
         return wrapper
     return decorator
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Option-chain builder (columnar — same algorithm as NseKit._option_chain_frame)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_OC_LEG_FIELDS: Final = {"openInterest": "OI", "changeinOpenInterest": "Chng_in_OI",
+                         "totalTradedVolume": "Volume", "impliedVolatility": "IV",
+                         "lastPrice": "LTP", "change": "Net_Chng"}
+_OC_FULL_COLS: Final = ["Fetch_Time","Symbol","Expiry_Date","CALLS_OI","CALLS_Chng_in_OI","CALLS_Volume",
+                        "CALLS_IV","CALLS_LTP","CALLS_Net_Chng","CALLS_Bid_Qty","CALLS_Bid_Price",
+                        "CALLS_Ask_Price","CALLS_Ask_Qty","Strike_Price","PUTS_Bid_Qty","PUTS_Bid_Price",
+                        "PUTS_Ask_Price","PUTS_Ask_Qty","PUTS_Net_Chng","PUTS_LTP","PUTS_IV","PUTS_Volume",
+                        "PUTS_Chng_in_OI","PUTS_OI","Underlying_Value"]
+_OC_COMPACT_COLS: Final = ["Fetch_Time","Symbol","Expiry_Date","CALLS_OI","CALLS_Chng_in_OI","CALLS_Volume",
+                           "CALLS_IV","CALLS_LTP","CALLS_Net_Chng","Strike_Price",
+                           "PUTS_OI","PUTS_Chng_in_OI","PUTS_Volume","PUTS_IV","PUTS_LTP","PUTS_Net_Chng",
+                           "Underlying_Value"]
+
+
+def _leg_col(legs: list, key: str) -> np.ndarray:
+    """One CE/PE field across *legs* → ``float64`` array (missing → 0, ``None`` → NaN)."""
+    return np.asarray([leg.get(key, 0) for leg in legs], dtype="float64")
+
+
+def _option_chain_frame(records: list, symbol: str = "", expiry: str = "", fetch_time: str = "",
+                        underlying: float | None = 0, oi_mode: str = "full") -> pd.DataFrame:
+    """payload["data"] → option-chain frame, one float64 array per CE/PE field, built in one shot."""
+    cols = _OC_COMPACT_COLS if oi_mode == "compact" else _OC_FULL_COLS
+    n    = len(records)
+    data: dict[str, Any] = {"Strike_Price": np.asarray([r.get("strikePrice") for r in records], dtype="float64")}
+    for side, leg in (("CALLS", "CE"), ("PUTS", "PE")):
+        legs = [r.get(leg) or {} for r in records]
+        for key, name in _OC_LEG_FIELDS.items():
+            data[f"{side}_{name}"] = _leg_col(legs, key)
+        if oi_mode != "compact":
+            data[f"{side}_Bid_Price"] = _leg_col(legs, "buyPrice1")
+            data[f"{side}_Ask_Price"] = _leg_col(legs, "sellPrice1")
+            for out, tot, lvl1 in ((f"{side}_Bid_Qty", "totalBuyQuantity", "buyQuantity1"),
+                                   (f"{side}_Ask_Qty", "totalSellQuantity", "sellQuantity1")):
+                t = _leg_col(legs, tot)
+                data[out] = np.where(np.nan_to_num(t) != 0, t, _leg_col(legs, lvl1))
+    data["Underlying_Value"] = np.full(n, np.nan if underlying is None else underlying, dtype="float64")
+    index = pd.RangeIndex(n)
+    for name, value in (("Fetch_Time", fetch_time), ("Symbol", symbol), ("Expiry_Date", expiry)):
+        data[name] = pd.Series([value] * n, index=index, dtype="object")
+    return pd.DataFrame(data, index=index, columns=cols)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Date helpers (pure, module-level)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -454,6 +538,8 @@ class AsyncNse:
         self._cookie_vault = _AsyncCookieVault()
         self._session: aiohttp.ClientSession | None = None
         self._call_count   = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._coalesced    = 0
 
     # ── property wrapping private _rate_limiter ───────────────────────────────
 
@@ -690,7 +776,7 @@ class AsyncNse:
         log.debug("[AsyncNse] cache cleared")
 
     def cache_stats(self) -> dict:
-        return self._cache.stats()
+        return {**self._cache.stats(), "coalesced": self._coalesced}
 
     def no_cache(self) -> _AsyncNoCacheCtx:
         """Async context manager — bypass cache for enclosed block."""
@@ -1220,6 +1306,50 @@ class AsyncNse:
                                   f"https://www.nseindia.com/api/quote-equity?symbol={enc}&section=trade_info")
         return data if isinstance(data, dict) else None
 
+    _INDEX_QUOTE_COLS: Final = {"previousClose": "PreviousClose", "lastPrice": "LastTradedPrice",
+                                "change": "Change", "pChange": "PercentChange", "open": "Open",
+                                "dayHigh": "High", "dayLow": "Low"}
+
+    async def cm_live_equity_price_info_many(self, symbols: list[str], workers: int = 8, retries: int = 1,
+                                             index: str | list[str] | None = "NIFTY 500") -> pd.DataFrame | None:
+        """
+        Batched cm_live_equity_price_info → one DataFrame indexed by symbol.
+
+        Constituents of *index* come from one index snapshot (Source="index");
+        the rest are quoted concurrently (at most *workers* in flight, all under
+        the shared rate limiter) and failed symbols are retried independently.
+        """
+        wanted = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+        if not wanted: return None
+        rows: dict[str, dict] = {}
+        for name in [index] if isinstance(index, str) else (index or []):
+            pending = [s for s in wanted if s not in rows]
+            if not pending: break
+            snap = await self.index_live_indices_stocks_data(name)
+            if not isinstance(snap, pd.DataFrame) or "symbol" not in snap.columns: continue
+            for rec in snap[snap["symbol"].isin(pending)].to_dict("records"):
+                rows[rec["symbol"]] = {"Symbol": rec["symbol"], "Source": "index",
+                                       **{new: rec.get(old) for old, new in self._INDEX_QUOTE_COLS.items()}}
+
+        sem = asyncio.Semaphore(max(1, workers))
+        async def _one(sym: str) -> tuple[str, dict | None]:
+            async with sem:
+                try:
+                    return sym, await self.cm_live_equity_price_info(sym)
+                except ValueError:
+                    return sym, None
+        pending = [s for s in wanted if s not in rows]
+        for _ in range(max(retries, 0) + 1):
+            if not pending: break
+            for sym, res in await asyncio.gather(*(_one(s) for s in pending)):
+                if res:
+                    rows[sym] = {"Symbol": sym, "Source": "quote", **pd.json_normalize(res).iloc[0].to_dict()}
+            pending = [s for s in pending if s not in rows]
+        if pending:
+            log.warning("[AsyncNse] cm_live_equity_price_info_many: no data for %s", ", ".join(pending))
+        if not rows: return None
+        return pd.DataFrame([rows[s] for s in wanted if s in rows]).set_index("Symbol", drop=False)
+
     async def cm_live_equity_full_info(self, symbol: str) -> dict | None:
         enc  = self._validate_symbol(symbol).replace("&","%26")
         data = await self._fetch(f"https://www.nseindia.com/get-quotes/equity?symbol={enc}",
@@ -1705,16 +1835,7 @@ class AsyncNse:
                                      expiry_date: str | None = None,
                                      oi_mode: str = "full") -> pd.DataFrame:
         sym = self._validate_symbol(symbol)
-        if oi_mode == "compact":
-            col_names = ["Fetch_Time","Symbol","Expiry_Date","CALLS_OI","CALLS_Chng_in_OI","CALLS_Volume",
-                         "CALLS_IV","CALLS_LTP","CALLS_Net_Chng","Strike_Price",
-                         "PUTS_OI","PUTS_Chng_in_OI","PUTS_Volume","PUTS_IV","PUTS_LTP","PUTS_Net_Chng","Underlying_Value"]
-        else:
-            col_names = ["Fetch_Time","Symbol","Expiry_Date","CALLS_OI","CALLS_Chng_in_OI","CALLS_Volume",
-                         "CALLS_IV","CALLS_LTP","CALLS_Net_Chng","CALLS_Bid_Qty","CALLS_Bid_Price",
-                         "CALLS_Ask_Price","CALLS_Ask_Qty","Strike_Price","PUTS_Bid_Qty","PUTS_Bid_Price",
-                         "PUTS_Ask_Price","PUTS_Ask_Qty","PUTS_Net_Chng","PUTS_LTP","PUTS_IV","PUTS_Volume",
-                         "PUTS_Chng_in_OI","PUTS_OI","Underlying_Value"]
+        col_names = _OC_COMPACT_COLS if oi_mode == "compact" else _OC_FULL_COLS
         dtypes = {c:"float64" for c in col_names if any(x in c for x in ["Price","IV","Value","OI","Volume","Chng","Qty"])}
         dtypes.update({"Fetch_Time":"object","Symbol":"object","Expiry_Date":"object","Strike_Price":"float64"})
         resp_d = await self._request("https://www.nseindia.com/api/NextApi/apiClient/GetQuoteApi",
@@ -1737,25 +1858,7 @@ class AsyncNse:
         uv        = payload.get("underlyingValue", 0)
         records   = payload.get("data",[])
         if not records: return pd.DataFrame(columns=col_names).astype(dtypes)
-        rows = []
-        for item in records:
-            ce = item.get("CE",{}); pe = item.get("PE",{}); sp = item.get("strikePrice")
-            row = {"Fetch_Time":timestamp,"Symbol":sym,"Expiry_Date":target,"Strike_Price":sp,
-                   "CALLS_OI":ce.get("openInterest",0),"CALLS_Chng_in_OI":ce.get("changeinOpenInterest",0),
-                   "CALLS_Volume":ce.get("totalTradedVolume",0),"CALLS_IV":ce.get("impliedVolatility",0),
-                   "CALLS_LTP":ce.get("lastPrice",0),"CALLS_Net_Chng":ce.get("change",0),
-                   "PUTS_OI":pe.get("openInterest",0),"PUTS_Chng_in_OI":pe.get("changeinOpenInterest",0),
-                   "PUTS_Volume":pe.get("totalTradedVolume",0),"PUTS_IV":pe.get("impliedVolatility",0),
-                   "PUTS_LTP":pe.get("lastPrice",0),"PUTS_Net_Chng":pe.get("change",0),"Underlying_Value":uv}
-            if oi_mode == "full":
-                row.update({"CALLS_Bid_Qty":ce.get("totalBuyQuantity",0) or ce.get("buyQuantity1",0),
-                             "CALLS_Bid_Price":ce.get("buyPrice1",0),"CALLS_Ask_Price":ce.get("sellPrice1",0),
-                             "CALLS_Ask_Qty":ce.get("totalSellQuantity",0) or ce.get("sellQuantity1",0),
-                             "PUTS_Bid_Qty":pe.get("totalBuyQuantity",0) or pe.get("buyQuantity1",0),
-                             "PUTS_Bid_Price":pe.get("buyPrice1",0),"PUTS_Ask_Price":pe.get("sellPrice1",0),
-                             "PUTS_Ask_Qty":pe.get("totalSellQuantity",0) or pe.get("sellQuantity1",0)})
-            rows.append(row)
-        return pd.DataFrame(rows, columns=col_names).astype(dtypes)
+        return _option_chain_frame(records, sym, target, timestamp, uv, oi_mode)
 
     @nse_api(ttl=15.0)
     async def fno_live_active_contracts(self, symbol: str = "NIFTY", expiry_date: str | None = None) -> list | None:
@@ -454,6 +454,7 @@ asyncio.run(main())
 #     print(await nse.cm_live_equity_price_info("RELIANCE"))
 #     # + Bid Price/Qty 1-5, Ask Price/Qty 1-5, deliveryToTradedQuantity,
 #     #   totalBuyQuantity, totalSellQuantity
+#     print(await nse.cm_live_equity_price_info_many(["RELIANCE", "TCS", "IRCTC"], workers=8))   # Many symbols → one DataFrame
 
 # -- Equity Full Info (New NSE API) ------------------------------------------------
 # async with AsyncNse() as nse:
@@ -12,7 +12,11 @@ Usage::
     nse.cm_live_equity_price_info("RELIANCE")
 """
 
+import copy
 import csv
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import os
@@ -22,6 +26,9 @@ import threading
 import time
 import warnings
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from io import BytesIO, StringIO
 
@@ -29,6 +36,7 @@ import feedparser
 import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
 
 logger = logging.getLogger(__name__)
@@ -55,7 +63,7 @@ _USER_AGENTS: list[str] = [
 # NseConfig — central control panel (read by ALL Nse instances)
 # ══════════════════════════════════════════════════════════════════════════════
 #
-# Three behaviours are controlled here.  Change any field at any point
+# Several behaviours are controlled here.  Change any field at any point
 # before or after creating an Nse() instance — the next request will pick
 # up the new value automatically.
 #
@@ -67,9 +75,22 @@ _USER_AGENTS: list[str] = [
 #   NseConfig.retries        = 4      # up to 5 total attempts per call
 #   NseConfig.retry_delay    = 3.0    # 3 s base delay, doubles each retry
 #   NseConfig.cookie_cache   = False  # always warm-up, never touch disk
+#   NseConfig.archive_dir    = None   # never read/write the EOD archive store
+#   NseConfig.calendar_cache = None   # keep the holiday calendar in memory only
+#   NseConfig.chunk_workers  = 4      # fetch historical date windows in parallel
+#   NseConfig.pool_maxsize   = 32     # keep-alive connections per host (shared by all instances)
+#   NseConfig.http2          = True   # HTTP/2 via httpx when installed (pip install "httpx[http2]")
+#   NseConfig.history_cache  = True   # only download the missing tail of price history
+#   NseConfig.cache_live_ttl = 5.0    # live results are reused for 5 s
+#   NseConfig.cache_ttls     = {"fno_live_option_chain": 0}   # never cache this one
 #
 # All fields have safe defaults so zero-config usage still works:
-#   nse = Nse()   # same behaviour as before
+#   nse = Nse()
+#
+# Note: the response cache is ON by default — public methods reuse a result
+# for cache_live_ttl (15 s) when live and cache_hist_ttl (300 s) otherwise.
+# For the old always-fresh behaviour set NseConfig.response_cache = False,
+# tune single methods through cache_ttls, or wrap calls in nse.no_cache().
 
 class NseConfig:
     """
@@ -98,6 +119,63 @@ class NseConfig:
         if fresh; save after every warm-up.
         ``False`` — always perform a full warm-up; never read or write
         the on-disk cache.
+    archive_dir : str or None
+        Root folder of the on-disk EOD archive store that backs immutable
+        daily reports (bhavcopies).  Default ``~/.nsekit_archive``.
+        ``None`` disables the store — every call goes to the network.
+    archive_max_mb : float
+        Size budget of the archive store in megabytes.  When exceeded, the
+        least-recently-used files are evicted.  Default ``2048``.
+    calendar_cache : str or None
+        JSON file that persists the holiday calendars behind
+        :meth:`Nse.trading_calendar`.  The holiday master is downloaded at
+        most once a day; holidays of past years are kept, so backfills
+        spanning several years stay accurate.  Default
+        ``~/.nsekit_calendar.json``.  ``None`` keeps calendars in memory only.
+    history_cache : bool
+        ``True`` — ``cm_hist_security_wise_data`` and
+        ``index_historical_data`` keep a per-symbol history in the archive
+        store and only download the dates not yet stored.  ``False``
+        (default) — always download the full range.  Each call can
+        override this with ``incremental=``.
+    response_cache : bool
+        ``True`` (default) — results of public methods are kept in a
+        per-instance, thread-safe LRU + TTL cache (mirrors ``AsyncNse``),
+        so a live quote may be up to ``cache_live_ttl`` seconds old.
+        ``False`` — every call hits the network.  Use ``cache_ttls`` to
+        opt single methods out, or ``Nse.no_cache()`` for one block.
+    cache_live_ttl : float
+        Seconds a live / intraday result stays fresh. Default ``15``.
+    cache_hist_ttl : float
+        Seconds a historical / reference result stays fresh. Default ``300``.
+    cache_ttls : dict
+        Per-method TTL overrides, e.g. ``{"fno_live_option_chain": 3}``.
+        A TTL of ``0`` disables caching for that method.
+    cache_max_size : int
+        Maximum number of cached results per ``Nse`` instance. Default ``512``.
+    coalesce : bool
+        ``True`` (default) — identical calls made concurrently from several
+        threads share one HTTP request and one parsed result (single-flight).
+    chunk_workers : int
+        Number of date windows fetched in parallel by chunked historical
+        endpoints (security-wise data, index / VIX history).  ``1``
+        (default) keeps the original sequential walk with a polite pause
+        after every window; ``> 1`` issues the windows concurrently, paced
+        only by ``max_rps``, and backs off solely on HTTP 429 / HTML replies.
+    pool_connections : int
+        Number of hosts (``www.nseindia.com``, ``nsearchives.nseindia.com``
+        …) whose connection pools the shared transport keeps. Default ``4``.
+    pool_maxsize : int
+        Keep-alive connections kept per host.  All ``Nse`` instances in the
+        process share these pools, so TLS connections are reused across
+        instances and threads; size it to the largest thread pool you use
+        (``workers`` / ``chunk_workers``).  Default ``16``.
+    http2 : bool
+        ``True`` — sessions use ``httpx`` with HTTP/2 when ``httpx`` and
+        ``h2`` are installed, multiplexing requests over one connection per
+        host; otherwise the ``requests`` transport is kept.  Default ``False``.
+        Pool settings and ``http2`` apply to ``Nse`` instances created
+        after the change.
 
     Examples
     --------
@@ -112,6 +190,20 @@ class NseConfig:
     retries:     int   = 2
     retry_delay: float = 2.0
     cookie_cache: bool = True
+    archive_dir:    str | None = os.path.join(os.path.expanduser("~"), ".nsekit_archive")
+    archive_max_mb: float      = 2048.0
+    calendar_cache: str | None = os.path.join(os.path.expanduser("~"), ".nsekit_calendar.json")
+    history_cache:  bool       = False
+    response_cache: bool       = True
+    cache_live_ttl: float      = 15.0
+    cache_hist_ttl: float      = 300.0
+    cache_ttls:     dict       = {}
+    cache_max_size: int        = 512
+    coalesce:       bool       = True
+    chunk_workers:  int        = 1
+    pool_connections: int      = 4
+    pool_maxsize:   int        = 16
+    http2:          bool       = False
 
     # ── Internal rate-limit state (not for direct use) ────────────────────
     # A single lock guards _tokens and _last_refill so that all Nse instances
@@ -598,12 +690,17 @@ def _sort_dedup_dates(
     col:       str   = "Date",
     fmt:       str   = "%d-%b-%Y",
     ascending: bool  = False,
+    keep:      str | None = None,
 ) -> pd.DataFrame:
     """
     Parse *col* to datetime, sort, drop duplicates, and reformat to *fmt*.
 
     Centralises the repeated pattern that appeared in ``_get_csv_session``,
-    ``_hist_index_df``, and ``cm_hist_security_wise_data``.
+    ``_hist_index_df``, and ``cm_hist_security_wise_data``, and is the merge
+    point of the incremental history cache.  The sort is stable, so rows
+    sharing a date keep their input order and *keep* picks between them
+    deterministically — ``keep="last"`` lets the later of two concatenated
+    frames win at the seam.
 
     Parameters
     ----------
@@ -615,6 +712,9 @@ def _sort_dedup_dates(
         ``strptime`` / ``strftime`` format string. Default is ``"%d-%b-%Y"``.
     ascending : bool, optional
         Sort order. Default is ``False`` (newest first).
+    keep : str or None, optional
+        ``"first"`` or ``"last"`` duplicate to keep, in input order.
+        Defaults to ``"first"`` when *ascending* else ``"last"``.
 
     Returns
     -------
@@ -624,10 +724,11 @@ def _sort_dedup_dates(
     if col not in df.columns:
         return df
     dates = pd.to_datetime(df[col], format=fmt, errors="coerce")
-    keep = "last" if not ascending else "first"
+    if keep is None:
+        keep = "last" if not ascending else "first"
     df = (df.assign(**{col: dates})
-            .sort_values(col, ascending=ascending)
             .drop_duplicates(subset=[col], keep=keep)
+            .sort_values(col, ascending=ascending, kind="mergesort")
             .reset_index(drop=True))
     df[col] = df[col].dt.strftime(fmt)
     return df
@@ -639,6 +740,79 @@ def _keep_cols(df: pd.DataFrame, cols: list) -> pd.DataFrame:
     return df[existing]
 
 
+_FILTER_OPS = {
+    "==": lambda s, v: s == v,  "=":  lambda s, v: s == v,  "!=": lambda s, v: s != v,
+    "<":  lambda s, v: s < v,   "<=": lambda s, v: s <= v,
+    ">":  lambda s, v: s > v,   ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(list(v)),  "not in": lambda s, v: ~s.isin(list(v)),
+}
+
+
+def _strftime_unique(s: pd.Series, fmt: str) -> pd.Series:
+    """``s.dt.strftime(fmt)``, formatting each distinct date only once (NaT → ``None``)."""
+    codes, uniques = pd.factorize(s)
+    labels = np.append(np.asarray(uniques.strftime(fmt), dtype=object), None)
+    return pd.Series(labels[codes], index=s.index)
+
+
+def _apply_filters(df: pd.DataFrame, filters: list | None) -> pd.DataFrame:
+    """
+    Apply ``pd.read_parquet``-style *filters* to an in-memory frame.
+
+    *filters* is a list of ``(column, op, value)`` tuples (AND-ed) or a list
+    of such lists (OR-ed).  Conditions on columns the frame lacks are ignored.
+    """
+    if not filters or df.empty:
+        return df
+    groups = filters if isinstance(filters[0], list) else [filters]
+    keep   = pd.Series(False, index=df.index)
+    for group in groups:
+        mask = pd.Series(True, index=df.index)
+        for col, op, value in group:
+            if col in df.columns:
+                mask &= _FILTER_OPS[op](df[col], value)
+        keep |= mask
+    return df[keep]
+
+
+def _weekday_dates(
+    from_date: str,
+    to_date:   str,
+    holidays:  list | None = None,
+) -> list[str]:
+    """
+    Enumerate Monday–Friday dates between *from_date* and *to_date*
+    (inclusive, both ``DD-MM-YYYY``), dropping any listed in *holidays*.
+
+    *holidays* uses the ``DD-MMM-YYYY`` strings returned by
+    ``nse_trading_holidays(list_only=True)``.
+    """
+    skip  = {h.upper() for h in holidays or []}
+    start = datetime.strptime(from_date, "%d-%m-%Y")
+    end   = datetime.strptime(to_date,   "%d-%m-%Y")
+    out   = []
+    while start <= end:
+        if start.weekday() < 5 and start.strftime("%d-%b-%Y").upper() not in skip:
+            out.append(start.strftime("%d-%m-%Y"))
+        start += timedelta(days=1)
+    return out
+
+
+def _chunk_windows(from_date: str, to_date: str, chunk: int = 89) -> list[tuple[str, str]]:
+    """
+    Split an inclusive ``DD-MM-YYYY`` range into consecutive
+    ``(start, end)`` windows of at most ``chunk + 1`` days, oldest first.
+    """
+    start = datetime.strptime(from_date, "%d-%m-%Y")
+    end   = datetime.strptime(to_date,   "%d-%m-%Y")
+    out   = []
+    while start <= end:
+        chunk_end = min(start + timedelta(days=chunk), end)
+        out.append((start.strftime("%d-%m-%Y"), chunk_end.strftime("%d-%m-%Y")))
+        start = chunk_end + timedelta(days=1)
+    return out
+
+
 def _fmt_trade_date(trade_date: str, fmt: str = "%d%m%Y") -> str:
     """
     Parse a ``DD-MM-YYYY`` trade-date string and reformat it.
@@ -664,6 +838,809 @@ def _fmt_trade_date(trade_date: str, fmt: str = "%d%m%Y") -> str:
     raise ValueError(f"Invalid date format: {trade_date}")
 
 
+# ── Typed F&O Bhavcopy Parser ─────────────────────────────────────────────────
+
+# Fixed schema of the UDiFF F&O bhavcopy (BhavCopy_NSE_FO_*.csv).
+_FO_BHAV_CATEGORIES = ("Sgmt", "Src", "FinInstrmTp", "TckrSymb", "SctySrs", "OptnTp", "SsnId")
+_FO_BHAV_DATES      = ("TradDt", "BizDt", "XpryDt", "FininstrmActlXpryDt")
+_FO_BHAV_NUMERIC    = (
+    "FinInstrmId", "StrkPric", "OpnPric", "HghPric", "LwPric", "ClsPric", "LastPric",
+    "PrvsClsgPric", "UndrlygPric", "SttlmPric", "OpnIntrst", "ChngInOpnIntrst",
+    "TtlTradgVol", "TtlTrfVal", "TtlNbOfTxsExctd", "NewBrdLotQty",
+)
+
+
+def _pyarrow_csv():
+    """Return ``pyarrow.csv`` when pyarrow is installed, else ``None``."""
+    try:
+        from pyarrow import csv as pa_csv
+        return pa_csv
+    except ImportError:
+        return None
+
+
+def _read_fo_bhav_zip(content: bytes, columns: list | None = None) -> pd.DataFrame:
+    """
+    Parse an F&O bhavcopy ZIP straight from its CSV member with a fixed schema.
+
+    Symbol / instrument / option-type columns become ``category``, prices,
+    OI and volumes ``float64`` and the trade / expiry dates ``datetime64`` —
+    no post-hoc ``pd.to_numeric`` pass is needed.  Only *columns* (those
+    present in the file, in the given order) are decoded when supplied.
+
+    With pyarrow installed the member is streamed through Arrow's
+    multi-threaded CSV reader (categoricals arrive dictionary-encoded);
+    otherwise pandas' C parser is used with the same dtypes.
+
+    Returns an empty ``DataFrame`` if the archive holds no CSV.
+    """
+    with zipfile.ZipFile(BytesIO(content), "r") as zf:
+        name = next((n for n in zf.namelist() if n.lower().endswith(".csv")), None)
+        if name is None:
+            return pd.DataFrame()
+        with zf.open(name) as fh:
+            header = fh.readline().decode("utf-8-sig").strip().split(",")
+        use    = header if columns is None else [c for c in columns if c in header]
+        cats   = [c for c in _FO_BHAV_CATEGORIES if c in use]
+        nums   = [c for c in _FO_BHAV_NUMERIC if c in use]
+        dates  = [c for c in _FO_BHAV_DATES if c in use]
+        pa_csv = _pyarrow_csv()
+
+        with zf.open(name) as fh:
+            if pa_csv is not None:
+                import pyarrow as pa
+                types = {c: pa.dictionary(pa.int32(), pa.string()) for c in cats}
+                types.update({c: pa.float64() for c in nums})
+                types.update({c: pa.timestamp("ns") for c in dates})
+                opts = pa_csv.ConvertOptions(
+                    column_types=types, include_columns=use, strings_can_be_null=True,
+                )
+                df = pa_csv.read_csv(fh, convert_options=opts).to_pandas()
+            else:
+                dtype = {c: "category" for c in cats + dates}
+                dtype.update({c: "float64" for c in nums})
+                df = pd.read_csv(fh, usecols=use, dtype=dtype)
+                for c in dates:         # parse each distinct date once
+                    df[c] = df[c].astype("datetime64[ns]")
+    return df[use]
+
+
+def _type_fo_bhav(df: pd.DataFrame, columns: list | None = None) -> pd.DataFrame:
+    """
+    Cast an already-parsed F&O bhavcopy (e.g. the plain ``read_csv`` frame
+    archived by the default :meth:`Nse.fno_eod_bhav_copy`) to the schema of
+    :func:`_read_fo_bhav_zip`, keeping only *columns* when supplied.
+    """
+    use = list(df.columns) if columns is None else [c for c in columns if c in df.columns]
+    df  = df[use].copy()
+    for c in _FO_BHAV_CATEGORIES:
+        if c in df:
+            df[c] = df[c].astype("category")
+    for c in _FO_BHAV_NUMERIC:
+        if c in df:
+            df[c] = pd.to_numeric(df[c], errors="coerce").astype("float64")
+    for c in _FO_BHAV_DATES:
+        if c in df:
+            df[c] = df[c].astype("category").astype("datetime64[ns]")
+    return df
+
+
+# ── Option-Chain Builder ──────────────────────────────────────────────────────
+
+# Per-leg payload key → column suffix (CALLS_<suffix> / PUTS_<suffix>).
+_OC_LEG_FIELDS: dict[str, str] = {
+    "openInterest":         "OI",
+    "changeinOpenInterest": "Chng_in_OI",
+    "totalTradedVolume":    "Volume",
+    "impliedVolatility":    "IV",
+    "lastPrice":            "LTP",
+    "change":               "Net_Chng",
+}
+
+_OC_FULL_COLS = [
+    "Fetch_Time", "Symbol", "Expiry_Date",
+    "CALLS_OI", "CALLS_Chng_in_OI", "CALLS_Volume", "CALLS_IV",
+    "CALLS_LTP", "CALLS_Net_Chng",
+    "CALLS_Bid_Qty", "CALLS_Bid_Price", "CALLS_Ask_Price", "CALLS_Ask_Qty",
+    "Strike_Price",
+    "PUTS_Bid_Qty", "PUTS_Bid_Price", "PUTS_Ask_Price", "PUTS_Ask_Qty",
+    "PUTS_Net_Chng", "PUTS_LTP", "PUTS_IV",
+    "PUTS_Volume", "PUTS_Chng_in_OI", "PUTS_OI",
+    "Underlying_Value",
+]
+
+_OC_COMPACT_COLS = [
+    "Fetch_Time", "Symbol", "Expiry_Date",
+    "CALLS_OI", "CALLS_Chng_in_OI", "CALLS_Volume", "CALLS_IV",
+    "CALLS_LTP", "CALLS_Net_Chng",
+    "Strike_Price",
+    "PUTS_Net_Chng", "PUTS_LTP", "PUTS_IV",
+    "PUTS_Volume", "PUTS_Chng_in_OI", "PUTS_OI",
+    "Underlying_Value",
+]
+
+
+def _json_columns(records: list, spec: dict) -> dict[str, list]:
+    """
+    Columnar extraction: ``{out_col: [rec.get(key, default) for rec]}`` for
+    each ``out_col: (key, default)`` in *spec* — one tight pass per field
+    instead of one dict per record.
+    """
+    return {col: [rec.get(key, default) for rec in records] for col, (key, default) in spec.items()}
+
+
+def _float_col(values: list) -> np.ndarray:
+    """List of JSON numbers (``None`` allowed) → ``float64`` array."""
+    return np.asarray(values, dtype="float64")
+
+
+def _option_chain_frame(
+    records:    list,
+    symbol:     str = "",
+    expiry:     str = "",
+    fetch_time: str = "",
+    underlying: float = 0,
+    oi_mode:    str = "full",
+) -> pd.DataFrame:
+    """
+    Build the ``fno_live_option_chain`` table from ``payload["data"]``.
+
+    The CE and PE legs are pulled out column by column into ``float64``
+    arrays and the frame is assembled in one shot; bid/ask quantities fall
+    back to the level-1 quantity when the total is missing or zero.
+    """
+    cols = _OC_COMPACT_COLS if oi_mode == "compact" else _OC_FULL_COLS
+    n    = len(records)
+    data: dict[str, object] = {
+        "Strike_Price": _float_col([item.get("strikePrice") for item in records]),
+    }
+    for side, leg in (("CALLS", "CE"), ("PUTS", "PE")):
+        legs = [item.get(leg) or {} for item in records]
+        spec = {f"{side}_{name}": (key, 0) for key, name in _OC_LEG_FIELDS.items()}
+        if oi_mode != "compact":
+            spec.update({
+                f"{side}_Bid_Price": ("buyPrice1", 0),
+                f"{side}_Ask_Price": ("sellPrice1", 0),
+                "_bid_tot": ("totalBuyQuantity", 0), "_bid_1": ("buyQuantity1", 0),
+                "_ask_tot": ("totalSellQuantity", 0), "_ask_1": ("sellQuantity1", 0),
+            })
+        arrays = {col: _float_col(vals) for col, vals in _json_columns(legs, spec).items()}
+        if oi_mode != "compact":
+            for out, tot, lvl1 in ((f"{side}_Bid_Qty", "_bid_tot", "_bid_1"),
+                                   (f"{side}_Ask_Qty", "_ask_tot", "_ask_1")):
+                t = arrays.pop(tot)
+                arrays[out] = np.where(np.nan_to_num(t) != 0, t, arrays.pop(lvl1))
+        data.update(arrays)
+
+    data["Underlying_Value"] = np.full(n, np.nan if underlying is None else underlying, dtype="float64")
+    index = pd.RangeIndex(n)
+    for col, value in (("Fetch_Time", fetch_time), ("Symbol", symbol), ("Expiry_Date", expiry)):
+        data[col] = pd.Series([value] * n, index=index, dtype="object")
+    return pd.DataFrame(data, index=index, columns=cols)
+
+
+# ── Trading Calendar ──────────────────────────────────────────────────────────
+
+# NSE equity / index derivatives expire on Tuesdays (since 1-Sep-2025).
+_NSE_EXPIRY_WEEKDAY = 1
+
+
+def _as_day(value) -> np.datetime64:
+    """
+    Coerce a date-like value to ``datetime64[D]``.
+
+    Accepts ``date`` / ``datetime`` / ``pd.Timestamp`` / ``np.datetime64``
+    and the string formats used across NseKit: ``DD-MM-YYYY``,
+    ``DD-MMM-YYYY``, ``YYYY-MM-DD`` and ``DDMMYYYY``.
+    """
+    if isinstance(value, str):
+        for fmt in ("%d-%m-%Y", "%d-%b-%Y", "%Y-%m-%d", "%d%m%Y", "%d-%m-%y"):
+            try:
+                return np.datetime64(datetime.strptime(value, fmt).date(), "D")
+            except ValueError:
+                continue
+        raise ValueError(f"Invalid date format: {value}")
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+class TradingCalendar:
+    """
+    Offline NSE trading calendar.
+
+    The calendar is a NumPy business-day calendar — Monday to Friday minus a
+    sorted holiday array — so every lookup is a binary search: no network
+    calls and no day-by-day ``while`` loops.  Use
+    :meth:`Nse.trading_calendar` for an instance that is refreshed from the
+    holiday master once a day, or build one from any holiday list.
+
+    Parameters
+    ----------
+    holidays : iterable, optional
+        Holiday dates — ``DD-MMM-YYYY`` strings as returned by
+        ``nse_trading_holidays(list_only=True)``, ``DD-MM-YYYY`` strings,
+        ``date`` objects, etc.
+
+    Notes
+    -----
+    Every method accepts the same date-like values.  Dates are returned as
+    ``datetime.date``, or as strings when *fmt* (a ``strftime`` format) is
+    given.
+
+    Examples
+    --------
+    >>> cal = TradingCalendar(["26-Jan-2026", "03-Mar-2026"])
+    >>> cal.prev_trading_day("27-01-2026")
+    datetime.date(2026, 1, 23)
+    >>> cal.trading_days_between("01-01-2026", "31-01-2026", fmt="%d-%m-%Y")
+    >>> cal.monthly_expiry(2026, 3)
+    datetime.date(2026, 3, 31)
+    """
+
+    def __init__(self, holidays=()):
+        self.holidays     = np.array(sorted({_as_day(h) for h in holidays}), dtype="datetime64[D]")
+        self._cal         = np.busdaycalendar(weekmask="1111100", holidays=self.holidays)
+        self._holiday_set = frozenset(self.holidays.tolist())
+
+    def __repr__(self) -> str:
+        span = f"{self.holidays[0]}..{self.holidays[-1]}" if len(self.holidays) else "none"
+        return f"TradingCalendar(holidays={len(self.holidays)}, span={span})"
+
+    @staticmethod
+    def _out(days, fmt: str | None):
+        """Convert a ``datetime64[D]`` scalar or array to ``date`` / ``str``."""
+        if isinstance(days, np.ndarray):
+            dates = days.astype(object).tolist()
+            return [d.strftime(fmt) for d in dates] if fmt else dates
+        day = days.astype(object)
+        return day.strftime(fmt) if fmt else day
+
+    def to_list(self) -> list[str]:
+        """Holidays as ``DD-MMM-YYYY`` strings (the NSE holiday-master format)."""
+        return self._out(self.holidays, "%d-%b-%Y")
+
+    def is_holiday(self, day) -> bool:
+        """``True`` if *day* is a listed exchange holiday (weekends are not listed)."""
+        return _as_day(day).astype(object) in self._holiday_set
+
+    def is_trading_day(self, day) -> bool:
+        """``True`` if *day* is a weekday that is not an exchange holiday."""
+        return bool(np.is_busday(_as_day(day), busdaycal=self._cal))
+
+    def prev_trading_day(self, day, n: int = 1, fmt: str | None = None):
+        """The *n*-th trading day strictly before *day*."""
+        return self._out(np.busday_offset(_as_day(day), -n, roll="forward", busdaycal=self._cal), fmt)
+
+    def next_trading_day(self, day, n: int = 1, fmt: str | None = None):
+        """The *n*-th trading day strictly after *day*."""
+        return self._out(np.busday_offset(_as_day(day), n, roll="backward", busdaycal=self._cal), fmt)
+
+    def last_trading_day(self, day=None, fmt: str | None = None):
+        """*day* (default today) if it is a trading day, else the closest trading day before it."""
+        day = _as_day(day if day is not None else datetime.now())
+        return self._out(np.busday_offset(day, 0, roll="backward", busdaycal=self._cal), fmt)
+
+    def trading_days_between(self, start, end, fmt: str | None = None) -> list:
+        """All trading days from *start* to *end* (both inclusive), oldest first."""
+        days = np.arange(_as_day(start), _as_day(end) + 1, dtype="datetime64[D]")
+        return self._out(days[np.is_busday(days, busdaycal=self._cal)], fmt)
+
+    def count_trading_days(self, start, end) -> int:
+        """Number of trading days from *start* to *end* (both inclusive)."""
+        return int(np.busday_count(_as_day(start), _as_day(end) + 1, busdaycal=self._cal))
+
+    def expiry_days(
+        self,
+        start,
+        end,
+        weekday: int        = _NSE_EXPIRY_WEEKDAY,
+        monthly: bool       = False,
+        fmt:     str | None = None,
+    ) -> list:
+        """
+        Derivative expiry dates between *start* and *end* (both inclusive).
+
+        Every *weekday* (``0`` = Monday … ``4`` = Friday; default Tuesday)
+        is an expiry, moved to the previous trading day when it falls on a
+        holiday.  ``monthly=True`` keeps only the last one of each month.
+        """
+        first, last = _as_day(start), _as_day(end)
+        if monthly:
+            lo = first.astype("datetime64[M]").astype("datetime64[D]")
+            hi = (last.astype("datetime64[M]") + 1).astype("datetime64[D]")
+        else:
+            lo, hi = first, last + 7     # next week's expiry may roll back into range
+        days    = np.arange(lo, hi, dtype="datetime64[D]")
+        nominal = days[(days.astype("int64") + 3) % 7 == weekday]   # 1970-01-01 was a Thursday
+        if monthly:
+            months  = nominal.astype("datetime64[M]")
+            nominal = nominal[np.append(months[1:] != months[:-1], True)]
+        rolled = np.busday_offset(nominal, 0, roll="backward", busdaycal=self._cal)
+        return self._out(rolled[(rolled >= first) & (rolled <= last)], fmt)
+
+    def monthly_expiry(self, year: int, month: int, weekday: int = _NSE_EXPIRY_WEEKDAY, fmt: str | None = None):
+        """Monthly expiry of *year* / *month* — see :meth:`expiry_days`."""
+        first = np.datetime64(f"{year:04d}-{month:02d}", "M")
+        found = self.expiry_days(first.astype("datetime64[D]"), (first + 1).astype("datetime64[D]") - 1,
+                                 weekday, monthly=True, fmt=fmt)
+        return found[0] if found else None
+
+
+# ── On-disk EOD Archive Store ─────────────────────────────────────────────────
+
+def _parquet_available() -> bool:
+    """Return ``True`` when pandas has a usable Parquet engine installed."""
+    for engine in ("pyarrow", "fastparquet"):
+        try:
+            __import__(engine)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+class _ArchiveStore:
+    """
+    Size-bounded local store for immutable end-of-day report frames.
+
+    Each entry is addressed by ``(report, trade_date)`` and lives at
+    ``<root>/<report>/<YYYY-MM-DD>.<ext>``.  Frames are written as Parquet
+    when ``pyarrow``/``fastparquet`` is installed, otherwise as pandas
+    pickles, so the store works in a bare environment too.
+
+    Eviction is least-recently-used by file ``mtime`` — every hit touches
+    the file — and runs whenever a write pushes the total size over
+    *max_bytes*.  All bookkeeping is guarded by one ``threading.Lock``;
+    disk reads and writes happen outside the lock.
+
+    Instances are shared per root folder via :meth:`for_dir`.
+    """
+
+    _registry: dict = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root      = root
+        self.max_bytes = max_bytes
+        self.ext       = "parquet" if _parquet_available() else "pkl"
+        self._lock     = threading.Lock()
+        self._index: dict[str, list] | None = None   # path -> [size, last_used]
+        self._bytes     = 0
+        self.hits       = 0
+        self.misses     = 0
+        self.writes     = 0
+        self.evictions  = 0
+
+    @classmethod
+    def for_dir(cls, root: str, max_mb: float) -> "_ArchiveStore":
+        """Return the process-wide store for *root*, creating it on first use."""
+        root = os.path.abspath(os.path.expanduser(root))
+        with cls._registry_lock:
+            store = cls._registry.get(root)
+            if store is None:
+                store = cls._registry[root] = cls(root, int(max_mb * 1024 * 1024))
+            store.max_bytes = int(max_mb * 1024 * 1024)
+            return store
+
+    # ── Bookkeeping ─────────────────────────────────────────────────────────
+
+    def _path(self, report: str, key: str) -> str:
+        # Keys are dates or symbols/index names — keep them filename-safe.
+        key = re.sub(r"[^\w&.-]", "_", key)
+        return os.path.join(self.root, report, f"{key}.{self.ext}")
+
+    def _ensure_index(self) -> None:
+        """Scan *root* once to learn the size and age of existing entries."""
+        if self._index is not None:
+            return
+        self._index, self._bytes = {}, 0
+        for dirpath, _, files in os.walk(self.root):
+            for name in files:
+                if not name.endswith("." + self.ext):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                self._index[path] = [st.st_size, st.st_mtime]
+                self._bytes      += st.st_size
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the store fits its budget."""
+        if self._bytes <= self.max_bytes:
+            return
+        for path, (size, _) in sorted(self._index.items(), key=lambda kv: kv[1][1]):
+            if self._bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            del self._index[path]
+            self._bytes    -= size
+            self.evictions += 1
+
+    # ── Public API ──────────────────────────────────────────────────────────
+
+    def get(
+        self,
+        report:  str,
+        key:     str,
+        columns: list | None = None,
+        filters: list | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Return the stored frame for ``(report, key)`` or ``None`` on a miss.
+
+        *columns* and *filters* are forwarded to ``pd.read_parquet`` so only
+        the requested columns / row groups are decoded; with the pickle
+        fallback they are applied after loading.
+        """
+        path = self._path(report, key)
+        with self._lock:
+            self._ensure_index()
+            known = path in self._index
+        if not known:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            if self.ext == "parquet":
+                df = pd.read_parquet(path, columns=columns, filters=filters)
+            else:
+                df = _apply_filters(pd.read_pickle(path), filters)
+                if columns is not None:
+                    df = _keep_cols(df, columns)
+        except Exception as exc:
+            logger.debug("NseKit: archive read failed (%s): %s", path, exc)
+            with self._lock:
+                self.misses += 1
+            return None
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+            if path in self._index:
+                self._index[path][1] = now
+        return df
+
+    def put(self, report: str, key: str, df: pd.DataFrame) -> bool:
+        """
+        Persist *df* under ``(report, key)``.  Writes atomically via a temp
+        file + ``os.replace``; returns ``False`` (and logs at DEBUG) when the
+        frame cannot be serialised.
+        """
+        path = self._path(report, key)
+        tmp  = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if self.ext == "parquet":
+                df.to_parquet(tmp)
+            else:
+                df.to_pickle(tmp)
+            os.replace(tmp, path)
+            size = os.path.getsize(path)
+        except Exception as exc:
+            logger.debug("NseKit: archive write failed (%s): %s", path, exc)
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return False
+        with self._lock:
+            self._ensure_index()
+            old = self._index.get(path)
+            if old:
+                self._bytes -= old[0]
+            self._index[path] = [size, time.time()]
+            self._bytes      += size
+            self.writes      += 1
+            self._evict()
+        return True
+
+    def keys(self, report: str) -> list[str]:
+        """Return the sorted ``YYYY-MM-DD`` keys stored for *report*."""
+        suffix = "." + self.ext
+        with self._lock:
+            self._ensure_index()
+            folder = os.path.join(self.root, report) + os.sep
+            return sorted(
+                os.path.basename(p)[: -len(suffix)]
+                for p in self._index if p.startswith(folder)
+            )
+
+    def clear(self) -> int:
+        """Delete every stored entry and return the number of files removed."""
+        with self._lock:
+            self._ensure_index()
+            removed = 0
+            for path in list(self._index):
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+            self._index.clear()
+            self._bytes = 0
+            return removed
+
+    def stats(self) -> dict:
+        """Return hit/miss/write/eviction counters and the current footprint."""
+        with self._lock:
+            self._ensure_index()
+            return {
+                "root":      self.root,
+                "format":    self.ext,
+                "entries":   len(self._index),
+                "size_mb":   round(self._bytes / (1024 * 1024), 2),
+                "max_mb":    round(self.max_bytes / (1024 * 1024), 2),
+                "hits":      self.hits,
+                "misses":    self.misses,
+                "writes":    self.writes,
+                "evictions": self.evictions,
+            }
+
+
+# ── Shared HTTP Transport ────────────────────────────────────────────────────
+
+# One connection pool per process, keyed by its settings, so every Nse
+# instance (and every worker thread) reuses the same keep-alive / TLS
+# connections to NSE hosts.  Cookies and headers stay per session.
+_TRANSPORTS: dict[tuple, object] = {}
+_TRANSPORT_LOCK = threading.Lock()
+
+# Transport errors that callers treat like requests' own; extended with
+# httpx.HTTPError once an HTTP/2 session has been created.
+_HTTP_ERRORS: tuple = (requests.RequestException,)
+
+
+def _httpx():
+    """Return ``httpx`` when it is installed with HTTP/2 support (``h2``), else ``None``."""
+    try:
+        import h2  # noqa: F401
+        import httpx
+        return httpx
+    except ImportError:
+        return None
+
+
+def _shared_transport(http2: bool = False):
+    """
+    Return the process-wide transport for the current pool settings: a
+    ``requests`` ``HTTPAdapter`` or, with *http2*, an ``httpx.HTTPTransport``.
+    """
+    key = (http2, NseConfig.pool_connections, NseConfig.pool_maxsize)
+    with _TRANSPORT_LOCK:
+        transport = _TRANSPORTS.get(key)
+        if transport is None:
+            if http2:
+                httpx = _httpx()
+                transport = httpx.HTTPTransport(http2=True, limits=httpx.Limits(
+                    max_connections=NseConfig.pool_connections * NseConfig.pool_maxsize,
+                    max_keepalive_connections=NseConfig.pool_maxsize,
+                ))
+            else:
+                transport = HTTPAdapter(pool_connections=NseConfig.pool_connections,
+                                        pool_maxsize=NseConfig.pool_maxsize)
+            _TRANSPORTS[key] = transport
+        return transport
+
+
+def _new_session():
+    """
+    Create a session backed by the shared transport.
+
+    A ``requests.Session`` with the shared adapter mounted for ``http://``
+    and ``https://``, or an ``httpx.Client`` over the shared HTTP/2
+    transport when ``NseConfig.http2`` is on and httpx is available (both
+    expose the ``get`` / ``post`` / ``cookies`` API Nse uses).
+    """
+    global _HTTP_ERRORS
+    if NseConfig.http2:
+        httpx = _httpx()
+        if httpx is not None:
+            _HTTP_ERRORS = (requests.RequestException, httpx.HTTPError)
+            return httpx.Client(transport=_shared_transport(http2=True), follow_redirects=True)
+        logger.warning("NseKit: NseConfig.http2 needs 'httpx[http2]' — using HTTP/1.1")
+    session = requests.Session()
+    adapter = _shared_transport()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# ── In-memory Response Cache ─────────────────────────────────────────────────
+
+_MISS = object()
+
+# Set by Nse.no_cache(); a ContextVar so the bypass is scoped to the calling
+# thread (and never leaks into worker threads of another caller).
+_CACHE_BYPASS: ContextVar[bool] = ContextVar("_nsekit_cache_bypass", default=False)
+
+# Set while a call is running when part of its data could not be downloaded
+# (e.g. a failed date window); _cached then returns the result uncached.
+_PARTIAL: ContextVar[bool] = ContextVar("_nsekit_partial", default=False)
+
+
+class _ResponseCache:
+    """
+    Thread-safe LRU + TTL cache of parsed public-method results — the sync
+    counterpart of ``NseKitAsync._AsyncCache``.
+
+    Expiry is checked lazily on ``get``; the least-recently-used entry is
+    dropped when ``max_size`` is exceeded.
+    """
+
+    __slots__ = ("_lock", "_store", "max_size", "hits", "misses")
+
+    def __init__(self, max_size: int = 512):
+        self._lock  = threading.Lock()
+        self._store: OrderedDict[str, tuple] = OrderedDict()
+        self.max_size = max_size
+        self.hits     = 0
+        self.misses   = 0
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._store.get(key, _MISS)
+            if entry is _MISS or time.monotonic() > entry[1]:
+                if entry is not _MISS:
+                    del self._store[key]
+                self.misses += 1
+                return _MISS
+            self._store.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, value, ttl: float) -> None:
+        with self._lock:
+            self._store[key] = (value, time.monotonic() + ttl)
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._store), "max_size": self.max_size,
+                    "hits": self.hits, "misses": self.misses}
+
+
+class _NoCacheCtx:
+    """Context manager returned by :meth:`Nse.no_cache`."""
+
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> None:
+        self._token = _CACHE_BYPASS.set(True)
+
+    def __exit__(self, *_) -> None:
+        _CACHE_BYPASS.reset(self._token)
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done   = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class _SingleFlight:
+    """
+    Process-wide in-flight de-duplication.
+
+    The first thread to ask for *key* runs the call; threads asking for the
+    same key before it finishes block on its event and receive the same
+    result (or exception) — only one rate-limit token is spent.
+    """
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._calls: dict[str, _Flight] = {}
+        self.shared = 0
+
+    def do(self, key: str, fn, *args, **kwargs):
+        with self._lock:
+            flight = self._calls.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._calls[key] = _Flight()
+            else:
+                self.shared += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn(*args, **kwargs)
+            return flight.result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            flight.done.set()
+
+
+_INFLIGHT = _SingleFlight()
+
+
+def _cache_key(name: str, args: tuple, kwargs: dict) -> str:
+    """Stable key for a method call — same scheme as ``NseKitAsync``."""
+    raw = repr((name, args, tuple(sorted(kwargs.items()))))
+    return f"{name}#{hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()}"
+
+
+def _cache_copy(value):
+    """Copy of a cached result that the caller may mutate freely."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+def _cached(kind: str = "live"):
+    """
+    Decorator adding the response cache to a public ``Nse`` method.
+
+    *kind* selects the default TTL — ``"live"`` (``NseConfig.cache_live_ttl``)
+    or ``"hist"`` (``NseConfig.cache_hist_ttl``); ``NseConfig.cache_ttls``
+    overrides it per method name.  On a miss the call goes through
+    ``_INFLIGHT`` (when ``NseConfig.coalesce`` is on) so concurrent identical
+    calls share one download.  ``None``, empty ``DataFrame`` (the error
+    return of many methods) and results flagged as partial (``_PARTIAL``)
+    are never cached.  ``DataFrame`` / ``dict`` / ``list`` results are
+    copied on the way out so callers cannot mutate the cached / shared value.
+    """
+    def decorator(fn):
+        name = fn.__name__
+
+        def call(self, *args, **kwargs):
+            token = _PARTIAL.set(False)
+            try:
+                return fn(self, *args, **kwargs), _PARTIAL.get()
+            finally:
+                _PARTIAL.reset(token)
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            default   = NseConfig.cache_hist_ttl if kind == "hist" else NseConfig.cache_live_ttl
+            ttl       = NseConfig.cache_ttls.get(name, default)
+            use_cache = NseConfig.response_cache and ttl > 0 and not _CACHE_BYPASS.get()
+            key       = _cache_key(name, args, kwargs)
+
+            value = self._response_cache.get(key) if use_cache else _MISS
+            if value is _MISS:
+                if NseConfig.coalesce:
+                    value, partial = _INFLIGHT.do(key, call, self, *args, **kwargs)
+                else:
+                    value, partial = call(self, *args, **kwargs)
+                if partial:
+                    _PARTIAL.set(True)      # an enclosing cached call is partial too
+                if value is None:
+                    return None
+                if use_cache and not partial and not (isinstance(value, pd.DataFrame) and value.empty):
+                    cache = self._response_cache
+                    cache.max_size = NseConfig.cache_max_size
+                    cache.set(key, value, ttl)
+            return _cache_copy(value)
+        return wrapper
+    return decorator
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # II. Core Nse Client
 # ══════════════════════════════════════════════════════════════════════════════
@@ -676,6 +1653,14 @@ def _fmt_trade_date(trade_date: str, fmt: str = "%d%m%Y") -> str:
 # Structure: {"ts": float, "cookies": dict[str, str]}
 _PROCESS_COOKIE_CACHE: dict = {}
 
+# Process-level trading calendars, refreshed once per day.
+# Structure: {(kind, calendar_cache_path): (fetched_iso_date, TradingCalendar | None, retry_at)}
+# retry_at is a time.monotonic() deadline set when the download failed, so a
+# holiday-master outage costs one retried download per _CALENDAR_RETRY_SECS.
+_PROCESS_CALENDARS: dict = {}
+_CALENDAR_LOCK = threading.Lock()
+_CALENDAR_RETRY_SECS = 900
+
 
 class Nse:
     """
@@ -686,6 +1671,11 @@ class Nse:
     retried automatically up to 2 extra times by the underlying transport
     helpers before giving up.
 
+    Results are served from a short-lived response cache by default (live
+    data for 15 s, historical / reference data for 5 min) — see
+    ``NseConfig.response_cache`` / ``NseConfig.cache_ttls`` and
+    :meth:`no_cache` for always-fresh data.
+
     Quick start
     -----------
     ::
@@ -731,6 +1721,10 @@ class Nse:
         """
         Initialise the HTTP session and warm up NSE cookies.
 
+        The session shares the process-wide connection pool (see
+        ``NseConfig.pool_maxsize`` / ``NseConfig.http2``), so creating
+        several instances does not repeat TCP / TLS handshakes.
+
         Parameters
         ----------
         max_rps : float, optional
@@ -758,7 +1752,9 @@ class Nse:
         self.retry_delay  = retry_delay  if retry_delay  is not None else NseConfig.retry_delay
         self.cookie_cache = cookie_cache if cookie_cache is not None else NseConfig.cookie_cache
 
-        self.session = requests.Session()
+        self.last_backfill: pd.DataFrame | None = None   # status table of the last backfill()
+
+        self.session = _new_session()
         self._init_session()
 
     def rotate_user_agent(self) -> None:
@@ -814,6 +1810,83 @@ class Nse:
 
         return deleted
 
+    # ── Response Cache ──────────────────────────────────────────────────────
+
+    @property
+    def _response_cache(self) -> _ResponseCache:
+        """Per-instance result cache, created on first use."""
+        cache = self.__dict__.get("_rcache")
+        if cache is None:
+            cache = self.__dict__.setdefault("_rcache", _ResponseCache(NseConfig.cache_max_size))
+        return cache
+
+    def cache_stats(self) -> dict:
+        """
+        Return size / hit / miss counters of this instance's response cache,
+        plus ``coalesced`` — calls (process-wide) that joined an identical
+        in-flight request instead of issuing their own.
+
+        Example
+        -------
+        >>> nse.index_live_all_indices_data(); nse.index_live_all_indices_data()
+        >>> nse.cache_stats()   # {'size': 1, 'max_size': 512, 'hits': 1, 'misses': 1, 'coalesced': 0}
+        """
+        return {**self._response_cache.stats(), "coalesced": _INFLIGHT.shared}
+
+    def clear_cache(self) -> None:
+        """Drop every cached result held by this instance."""
+        self._response_cache.clear()
+
+    def no_cache(self) -> _NoCacheCtx:
+        """
+        Context manager that bypasses the response cache (reads and writes)
+        for calls made from the current thread inside the block.
+
+        The switch is a ``ContextVar``, so it does not reach the worker
+        threads of the ``*_many`` helpers (e.g.
+        :meth:`cm_live_equity_price_info_many`) — their per-item calls may
+        still be served from the cache.  Set ``NseConfig.response_cache =
+        False`` (or a ``cache_ttls`` entry of ``0``) to bypass it there.
+
+        Example
+        -------
+        >>> with nse.no_cache():
+        ...     nse.fno_live_option_chain("NIFTY")   # always a fresh download
+        """
+        return _NoCacheCtx()
+
+    @property
+    def archive(self) -> "_ArchiveStore | None":
+        """
+        The process-wide EOD archive store for ``NseConfig.archive_dir``,
+        or ``None`` when the store is disabled.
+        """
+        if not NseConfig.archive_dir:
+            return None
+        return _ArchiveStore.for_dir(NseConfig.archive_dir, NseConfig.archive_max_mb)
+
+    def archive_stats(self) -> dict:
+        """
+        Return hit / miss / write / eviction counters and the on-disk size
+        of the EOD archive store (empty ``dict`` when disabled).
+
+        Example
+        -------
+        >>> nse.fno_eod_bhav_copy("17-10-2025")   # miss → network
+        >>> nse.fno_eod_bhav_copy("17-10-2025")   # hit  → local Parquet
+        >>> nse.archive_stats()
+        """
+        store = self.archive
+        return store.stats() if store else {}
+
+    def clear_archive(self) -> int:
+        """
+        Delete every frame held in the EOD archive store and return the
+        number of files removed.
+        """
+        store = self.archive
+        return store.clear() if store else 0
+
     # ── Rate Limiting ───────────────────────────────────────────────────────
 
     def _throttle(self) -> None:
@@ -1139,14 +2212,62 @@ class Nse:
             self._log_error("_get_archive", exc)
             return None
 
-    def _get_csv_archive(self, url: str) -> pd.DataFrame | None:
+    def _archived(
+        self,
+        report:     str,
+        trade_date: str,
+        fetch,
+        columns:    list | None = None,
+    ) -> pd.DataFrame | None:
         """
-        Fetch a static CSV archive and parse it into a ``DataFrame``.
+        Serve an immutable EOD report from the archive store, calling
+        *fetch()* (and storing a non-empty result) only on a miss.
+        With *columns*, only those columns are read back on a hit and
+        returned after a miss (the full frame is still stored).
 
         Parameters
         ----------
-        url : str
-            Fully-qualified URL of the CSV file.
+        report : str
+            Report family name, used as the store sub-folder
+            (e.g. ``"fno_bhavcopy"``).
+        trade_date : str
+            Trade date in ``DD-MM-YYYY`` format.
+        fetch : callable
+            Zero-argument callable performing the network download.
+        columns : list of str, optional
+            Column projection applied to the returned frame.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            Whatever *fetch()* returns on a miss; the stored frame on a hit.
+        """
+        store = self.archive
+        try:
+            key = _fmt_trade_date(trade_date, "%Y-%m-%d")
+        except (TypeError, ValueError):
+            store = None        # unparseable date — let fetch() report it
+
+        if store is not None:
+            df = store.get(report, key, columns=columns)
+            if df is not None:
+                return df
+        df = fetch()
+        if isinstance(df, pd.DataFrame) and not df.empty:
+            if store is not None:
+                store.put(report, key, df)
+            if columns is not None:
+                df = _keep_cols(df, columns)
+        return df
+
+    def _get_csv_archive(self, url: str) -> pd.DataFrame | None:
+        """
+        Fetch a static CSV archive and parse it into a ``DataFrame``.
+
+        Parameters
+        ----------
+        url : str
+            Fully-qualified URL of the CSV file.
 
         Returns
         -------
@@ -1218,10 +2339,13 @@ class Nse:
         to_date:   str,
         chunk:    int = 89,
         retries:  int = 3,
+        workers:  int | None = None,
     ) -> list:
         """
         Fetch data in sliding 89-day windows and collect all records.
 
+        Thin collector around :meth:`_iter_chunked`.
+
         *api_tpl* must be a format string accepting two positional
         ``str.format`` arguments: ``{0}`` (start) and ``{1}`` (end) both
         as ``DD-MM-YYYY`` strings.
@@ -1232,6 +2356,10 @@ class Nse:
         upon for all subsequent GETs — no manual ``cookies=`` kwarg needed.
         Respects the ``Retry-After`` header on HTTP 429 responses.
 
+        With ``workers > 1`` the windows are requested concurrently on a
+        thread pool.  Pacing is then left to :meth:`_throttle` (``max_rps``)
+        instead of fixed sleeps, and records are reassembled in date order.
+
         Parameters
         ----------
         ref_url : str
@@ -1246,66 +2374,158 @@ class Nse:
             Window size in days. Default is ``89``.
         retries : int, optional
             Attempts per chunk. Default is ``3``.
+        workers : int or None, optional
+            Concurrent windows; defaults to ``NseConfig.chunk_workers``.
 
         Returns
         -------
         list
             Collected raw record dicts; empty list on session failure.
         """
+        return [
+            rec
+            for part in self._iter_chunked(
+                ref_url, api_tpl, from_date, to_date, chunk, retries, workers,
+            )
+            for rec in part
+        ]
+
+    def _iter_chunked(
+        self,
+        ref_url:  str,
+        api_tpl:  str,
+        from_date: str,
+        to_date:   str,
+        chunk:    int = 89,
+        retries:  int = 3,
+        workers:  int | None = None,
+    ):
+        """
+        Generator behind :meth:`_get_chunked` — yields each window's raw
+        record list as soon as it is available, oldest window first.
+
+        Takes the same arguments as :meth:`_get_chunked`.  Failed windows
+        (all of them when the initial warm-up fails) yield an empty list.
+        In concurrent mode later windows are already downloading while the
+        caller consumes earlier ones.
+        """
+        for _, _, records in self._iter_windows(
+            ref_url, api_tpl, from_date, to_date, chunk, retries, workers,
+        ):
+            yield records or []
+
+    def _iter_windows(
+        self,
+        ref_url:  str,
+        api_tpl:  str,
+        from_date: str,
+        to_date:   str,
+        chunk:    int = 89,
+        retries:  int = 3,
+        workers:  int | None = None,
+    ):
+        """
+        Yield ``(start, end, records)`` for every window of
+        :meth:`_iter_chunked`, oldest first.
+
+        *records* is ``None`` for a window whose download failed (every
+        window fails when the initial warm-up does), so callers can tell
+        a failed window from one without trading days.  Any failure marks
+        the calling public method's result as partial — see :func:`_cached`.
+        """
+        windows = _chunk_windows(from_date, to_date, chunk)
+        workers = NseConfig.chunk_workers if workers is None else workers
+
         # ── Initial warm-up: establishes cookies in self.session ─────
         try:
             self._warm_and_fetch(ref_url, ref_url, timeout=10)
         except Exception as exc:
             self._log_error("_get_chunked.session", exc)
-            return []
+            _PARTIAL.set(True)
+            for start, end in windows:
+                yield start, end, None
+            return
 
-        start    = datetime.strptime(from_date, "%d-%m-%Y")
-        end      = datetime.strptime(to_date,   "%d-%m-%Y")
-        all_data = []
+        if workers <= 1 or len(windows) <= 1:
+            for start, end in windows:
+                records = self._fetch_chunk(ref_url, api_tpl.format(start, end), retries)
+                if records is None:
+                    _PARTIAL.set(True)
+                yield start, end, records
+                time.sleep(random.uniform(1.5, 3.5))
+            return
 
-        while start <= end:
-            chunk_end = min(start + timedelta(days=chunk), end)
-            url       = api_tpl.format(
-                start.strftime("%d-%m-%Y"),
-                chunk_end.strftime("%d-%m-%Y"),
-            )
-            fetched = False
+        def _window(win: tuple[str, str]) -> list | None:
+            return self._fetch_chunk(ref_url, api_tpl.format(*win), retries, paced=False)
 
-            for att in range(1, retries + 1):
-                try:
-                    self._throttle()
-                    resp = self.session.get(
-                        url, headers=self.headers, timeout=15 + att * 5,
-                    )
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        if "data" in data and isinstance(data["data"], list):
-                            all_data.extend(data["data"])
-                        fetched = True
-                        break
-                    elif resp.status_code == 429:
-                        # Retry-After may be an integer or float string; parse via
-                        # float() first so "1.5" does not raise ValueError.
-                        retry_after = int(float(resp.headers.get("Retry-After", random.uniform(8, 12))))
-                        time.sleep(retry_after)
-                    else:
-                        time.sleep(random.uniform(2, 4))
-                except Exception as exc:
-                    logger.debug("_get_chunked chunk attempt %d: %s", att, exc)
-                    time.sleep(random.uniform(3, 6))
+        pool = ThreadPoolExecutor(
+            max_workers=min(workers, len(windows)), thread_name_prefix="nsekit-chunk",
+        )
+        try:
+            # map() yields in submission order, i.e. oldest window first.
+            for (start, end), records in zip(windows, pool.map(_window, windows)):
+                if records is None:
+                    _PARTIAL.set(True)
+                yield start, end, records
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_chunk(
+        self,
+        ref_url: str,
+        url:     str,
+        retries: int  = 3,
+        paced:   bool = True,
+    ) -> list | None:
+        """
+        GET one chunk URL and return its ``"data"`` records.
 
-            if not fetched:
-                # ── Cookie refresh ────────────────────────────────────
-                try:
-                    self._warm_and_fetch(ref_url, ref_url, timeout=10)
-                except Exception as exc:
-                    logger.debug("_get_chunked cookie refresh failed: %s", exc)
-                    time.sleep(random.uniform(5, 10))
+        Retries up to *retries* times.  HTTP 429 honours ``Retry-After``;
+        an HTML body (expired session) triggers a cookie refresh before the
+        next attempt.  With *paced* (the sequential mode) every other
+        failure also sleeps a random few seconds; otherwise the retry is
+        left to :meth:`_throttle`.  Returns ``None`` when every attempt
+        failed — the cookies are then refreshed for the next window.
+        """
+        for att in range(1, retries + 1):
+            try:
+                self._throttle()
+                resp = self.session.get(url, headers=self.headers, timeout=15 + att * 5)
+                if resp.status_code == 200:
+                    if "text/html" in resp.headers.get("Content-Type", ""):
+                        raise ValueError("Received HTML instead of JSON — session may have expired")
+                    data = resp.json()
+                    if "data" in data and isinstance(data["data"], list):
+                        return data["data"]
+                    return []
+                elif resp.status_code == 429:
+                    # Retry-After may be an integer or float string; parse via
+                    # float() first so "1.5" does not raise ValueError.
+                    retry_after = int(float(resp.headers.get("Retry-After", random.uniform(8, 12))))
+                    time.sleep(retry_after)
+                elif paced:
+                    time.sleep(random.uniform(2, 4))
+            except ValueError as exc:
+                # HTML page or undecodable JSON — refresh cookies, then back off
+                logger.debug("_get_chunked chunk attempt %d: %s", att, exc)
+                self._refresh_chunk_cookies(ref_url)
+                time.sleep(random.uniform(3, 6))
+            except Exception as exc:
+                logger.debug("_get_chunked chunk attempt %d: %s", att, exc)
+                if paced:
+                    time.sleep(random.uniform(3, 6))
 
-            time.sleep(random.uniform(1.5, 3.5))
-            start = chunk_end + timedelta(days=1)
+        # ── Cookie refresh ────────────────────────────────────────────
+        self._refresh_chunk_cookies(ref_url)
+        return None
 
-        return all_data
+    def _refresh_chunk_cookies(self, ref_url: str) -> None:
+        """Re-run the warm-up GET after a failed chunk; never raises."""
+        try:
+            self._warm_and_fetch(ref_url, ref_url, timeout=10)
+        except Exception as exc:
+            logger.debug("_get_chunked cookie refresh failed: %s", exc)
+            time.sleep(random.uniform(5, 10))
 
     def _live_ref_fetch(
         self,
@@ -1482,7 +2702,15 @@ class Nse:
         records = self._get_chunked(ref_url, api_tpl, from_date, to_date)
         if not records:
             return pd.DataFrame()
+        return self._hist_index_frame(records, col_map)
 
+    @staticmethod
+    def _hist_index_frame(records: list, col_map: dict) -> pd.DataFrame:
+        """
+        Rename raw index / VIX history records per *col_map*, sort by
+        ``Date`` and drop duplicates.  Shared by :meth:`_hist_index_df` and
+        the per-window ``iter_*`` generators.
+        """
         df = pd.DataFrame(records)
         df = _keep_cols(df, col_map).rename(columns=col_map)
 
@@ -1491,6 +2719,132 @@ class Nse:
 
         return df.reset_index(drop=True)
 
+    def _iter_hist_frames(
+        self,
+        ref_url:   str,
+        api_tpl:   str,
+        from_date: str,
+        to_date:   str,
+        shape,
+    ):
+        """
+        Yield ``shape(records)`` for every non-empty window returned by
+        :meth:`_iter_chunked` — the streaming counterpart of
+        :meth:`_hist_index_df` / ``cm_hist_security_wise_data``.
+        """
+        for records in self._iter_chunked(ref_url, api_tpl, from_date, to_date):
+            if records:
+                yield shape(records)
+
+    def _incremental_history(
+        self,
+        report:      str,
+        key:         str,
+        request:     tuple,
+        shape,
+        incremental: bool | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Return chunked history for *request*, downloading only the dates
+        not already held in the archive store under ``(report, key)``.
+
+        The stored frame remembers the range it covers (``attrs``).  Only
+        the uncovered head and tail are fetched via :meth:`_iter_windows`;
+        the tail restarts at the last covered day so a session stored
+        intraday is replaced by its final values.  Stored and fresh rows
+        are merged by :func:`_sort_dedup_dates` with ``keep="last"`` — the
+        fresh row always wins at the seam.  The covered range only grows
+        over the windows that downloaded and adjoin it, so a failed window
+        is fetched again on the next call (and the partial result is not
+        put in the response cache).
+
+        Parameters
+        ----------
+        report : str
+            Store sub-folder, e.g. ``"hist_security"``.
+        key : str
+            Symbol or index name.
+        request : tuple
+            ``(ref_url, api_tpl, from_date, to_date)`` as built by the
+            ``_*_request`` helpers.
+        shape : callable
+            Turns a raw record list into the normalised ``DataFrame``
+            (must contain a ``%d-%b-%Y`` ``Date`` column).
+        incremental : bool or None, optional
+            Overrides ``NseConfig.history_cache``.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            Ascending history limited to the requested range, or ``None``
+            when nothing is available.
+        """
+        ref_url, api_tpl, from_date, to_date = request
+        use   = NseConfig.history_cache if incremental is None else incremental
+        store = self.archive if use and key else None
+        if store is None:
+            records = self._get_chunked(*request)
+            return shape(records) if records else None
+
+        fmt       = "%d-%m-%Y"
+        day       = timedelta(days=1)
+        want_from = datetime.strptime(from_date, fmt)
+        want_to   = datetime.strptime(to_date,   fmt)
+        cached    = store.get(report, key)
+
+        # Each gap is (start, end, grows_down): the head gap extends the
+        # covered range downwards from its end, the tail gap upwards from
+        # its start.  Without a stored frame the whole request is a head gap.
+        parts, have_from, have_to = [], None, None
+        gaps = [(want_from, want_to, True)]
+        if cached is not None and not cached.empty:
+            dates     = pd.to_datetime(cached["Date"], format="%d-%b-%Y", errors="coerce")
+            have_from = datetime.strptime(cached.attrs.get("covered_from", dates.min().strftime(fmt)), fmt)
+            have_to   = datetime.strptime(cached.attrs.get("covered_to",   dates.max().strftime(fmt)), fmt)
+            parts, gaps = [cached], []
+            if want_from < have_from:
+                gaps.append((want_from, have_from - day, True))
+            if want_to >= have_to:
+                gaps.append((have_to, want_to, False))
+
+        cov_from, cov_to, fetched = have_from, have_to, False
+        for start, end, grows_down in gaps:
+            windows = list(self._iter_windows(ref_url, api_tpl, start.strftime(fmt), end.strftime(fmt)))
+            records = [rec for _, _, recs in windows if recs for rec in recs]
+            if records:
+                parts.append(shape(records))
+                fetched = True
+            # Windows that downloaded, walking away from the covered range.
+            done = list(itertools.takewhile(
+                lambda w: w[2] is not None, reversed(windows) if grows_down else windows,
+            ))
+            if not done:
+                continue
+            if grows_down:
+                cov_from = datetime.strptime(done[-1][0], fmt)
+                cov_to   = cov_to or end
+            else:
+                cov_to   = datetime.strptime(done[-1][1], fmt)
+
+        if not parts:
+            return None
+        merged = _sort_dedup_dates(
+            pd.concat(parts, ignore_index=True), "Date",
+            fmt="%d-%b-%Y", ascending=True, keep="last",
+        )
+        dates = pd.to_datetime(merged["Date"], format="%d-%b-%Y", errors="coerce")
+        if cov_from is not None and (fetched or (cov_from, cov_to) != (have_from, have_to)):
+            keep = merged[(dates >= cov_from) & (dates <= cov_to)].reset_index(drop=True)
+            if not keep.empty:
+                keep.attrs = {"covered_from": cov_from.strftime(fmt), "covered_to": cov_to.strftime(fmt)}
+                store.put(report, key, keep)
+
+        lo  = datetime.strptime(from_date, fmt)
+        hi  = datetime.strptime(to_date,   fmt)
+        out = merged[(dates >= lo) & (dates <= hi)].reset_index(drop=True)
+        out.attrs = {}
+        return out if not out.empty else None
+
     def _snapshot_contracts(self, index_param: str) -> pd.DataFrame | None:
         """
         Shared helper for most-active-contracts snapshots (OI / volume /
@@ -1762,7 +3116,7 @@ class Nse:
             # to_dict handles mixed int/float/str natively — no astype(object) copy needed
             return df.to_dict(orient="records")
 
-        except (requests.RequestException, ValueError, KeyError) as exc:
+        except (*_HTTP_ERRORS, ValueError, KeyError) as exc:
             self._log_error("_biz_growth_fetch", exc)
             return None
 
@@ -1906,23 +3260,53 @@ class Nse:
         )
         return df["tradingDate"].tolist() if list_only else df
 
-    def _is_holiday(self, fn, date_str: str | None = None) -> bool | None:
+    def _is_holiday(self, kind: str, date_str: str | None = None) -> bool | None:
         """
         Check whether *date_str* (``%d-%b-%Y``) or today is a market holiday.
 
-        *fn* must be either :meth:`nse_trading_holidays` or
-        :meth:`nse_clearing_holidays`.
+        *kind* is ``"trading"`` or ``"clearing"``; the lookup goes through the
+        cached :meth:`trading_calendar`, not a fresh holiday-master download.
         """
-        holidays = fn(list_only=True)
-        if holidays is None:
+        calendar = self.trading_calendar(kind)
+        if calendar is None:
             return None
         try:
             dt  = datetime.strptime(date_str, "%d-%b-%Y") if date_str else datetime.today()
-            return dt.strftime("%d-%b-%Y") in holidays
+            return calendar.is_holiday(dt)
         except Exception as exc:
             self._log_error("_is_holiday", exc)
             return None
 
+    @staticmethod
+    def _read_calendar_file(path: str | None) -> dict:
+        """Return the persisted ``{kind: {"fetched", "holidays"}}`` map, or ``{}``."""
+        if not path:
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _write_calendar_file(path: str | None, kind: str, fetched: str, holidays: list) -> None:
+        """Persist one calendar atomically; failures are logged at DEBUG and ignored."""
+        if not path:
+            return
+        tmp = path + ".tmp"
+        try:
+            data = Nse._read_calendar_file(path)
+            data[kind] = {"fetched": fetched, "holidays": holidays}
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(data, fh)
+            os.replace(tmp, path)
+        except Exception as exc:
+            logger.debug("NseKit: calendar cache write failed: %s", exc)
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
     def _nse_csv_list(
         self,
         url:      str,
@@ -2019,6 +3403,7 @@ class Nse:
     # ════════════════════════════════════════════════════════════════════════
     # ── NSE Market ──────────────────────────────────────────────────────────
 
+    @_cached("live")
     def nse_market_status(self, mode: str = "Market Status") -> pd.DataFrame | dict | None:
         """
         Fetch overall NSE market status, market cap, Nifty 50 info, and
@@ -2128,30 +3513,62 @@ class Nse:
         """
         from rich.text import Text
 
+        sel = self._market_state(market)
+        if sel is None:
+            return Text("Error fetching market status", style="bold red")
+        if not sel:
+            return Text(f"[{market}] Not found", style="bold yellow")
+
+        msg  = sel.get("marketStatusMessage", "").strip()
+        text = Text(f"[{market}] → ", style="bold white")
+        text.append(msg, style="bold green" if self._is_open_message(msg) else "bold red")
+        return text
+
+    def _market_state(self, market: str = "Capital Market") -> dict | None:
+        """
+        Return the ``marketState`` record for *market* — ``{}`` when the
+        segment is not listed, ``None`` when the status API fails.
+        """
         data = self._get_json(
             "https://www.nseindia.com/market-data/live-equity-market",
             "https://www.nseindia.com/api/marketStatus",
         )
         if not data:
-            return Text("Error fetching market status", style="bold red")
-
-        sel = next(
+            return None
+        return next(
             (m for m in data.get("marketState", []) if m.get("market") == market),
-            None,
+            {},
         )
-        if not sel:
-            return Text(f"[{market}] Not found", style="bold yellow")
 
-        msg  = sel.get("marketStatusMessage", "").strip()
-        text = Text(f"[{market}] → ", style="bold white")
-        is_closed = any(w in msg.lower() for w in ("closed", "halted", "suspended"))
-        text.append(msg, style="bold red" if is_closed else "bold green")
-        return text
+    @staticmethod
+    def _is_open_message(msg: str) -> bool:
+        return not any(w in msg.lower() for w in ("closed", "halted", "suspended"))
+
+    def market_is_open(self, market: str = "Capital Market") -> bool | None:
+        """
+        Plain-bool form of :meth:`nse_is_market_open`.
+
+        Returns
+        -------
+        bool or None
+            ``True`` / ``False`` from the NSE status message, ``None`` when
+            the status cannot be fetched or *market* is not listed.
+
+        Examples
+        --------
+        >>> nse.market_is_open()
+        >>> nse.market_is_open("Currency")
+        """
+        sel = self._market_state(market)
+        if not sel:
+            return None
+        return self._is_open_message(sel.get("marketStatusMessage", ""))
 
     # ══════════════════════════════════════════════════════════════════════════════
     # IV. Global & Miscellaneous
     # ══════════════════════════════════════════════════════════════════════════════
 
+    @_cached("hist")
     def nse_trading_holidays(self, list_only: bool = False):
         """Return the NSE trading-holiday calendar for the current year.
 
@@ -2172,6 +3589,7 @@ class Nse:
         """
         return self._holidays("trading", "CM", list_only)
 
+    @_cached("hist")
     def nse_clearing_holidays(self, list_only: bool = False):
         """Return the NSE clearing-holiday calendar for the current year.
 
@@ -2210,7 +3628,7 @@ class Nse:
         >>> nse.is_nse_trading_holiday()
         >>> nse.is_nse_trading_holiday("25-Dec-2026")
         """
-        return self._is_holiday(self.nse_trading_holidays, date_str)
+        return self._is_holiday("trading", date_str)
 
     def is_nse_clearing_holiday(self, date_str: str | None = None) -> bool | None:
         """Return ``True`` if *date_str* is a clearing holiday.
@@ -2229,8 +3647,74 @@ class Nse:
         >>> nse.is_nse_clearing_holiday()
         >>> nse.is_nse_clearing_holiday("22-Oct-2025")
         """
-        return self._is_holiday(self.nse_clearing_holidays, date_str)
+        return self._is_holiday("clearing", date_str)
+
+    def trading_calendar(self, kind: str = "trading", refresh: bool = False) -> "TradingCalendar | None":
+        """Return an offline :class:`TradingCalendar` built from the NSE holiday master.
 
+        The holiday master is downloaded at most once per day per process.
+        The result is persisted to ``NseConfig.calendar_cache``, so later
+        processes on the same day make no network call.  Holidays of earlier
+        years are merged into the saved calendar, because the holiday master
+        only lists the current year.  When the download fails, the last
+        saved calendar is used and the download is not retried for
+        15 minutes.
+
+        Parameters
+        ----------
+        kind : str, optional
+            ``"trading"`` (default) or ``"clearing"``.
+        refresh : bool, optional
+            ``True`` forces a new download of the holiday master.
+
+        Returns
+        -------
+        TradingCalendar or None
+            ``None`` only when nothing could be downloaded or loaded.
+
+        Examples
+        --------
+        >>> cal = nse.trading_calendar()
+        >>> cal.prev_trading_day(datetime.now(), fmt="%d-%m-%Y")
+        >>> cal.expiry_days("01-01-2026", "31-03-2026", monthly=True)
+        """
+        fetchers = {"trading": self.nse_trading_holidays, "clearing": self.nse_clearing_holidays}
+        if kind not in fetchers:
+            raise ValueError(f"kind must be one of {', '.join(fetchers)}")
+        path  = NseConfig.calendar_cache
+        key   = (kind, path)
+        today = datetime.now().date().isoformat()
+
+        with _CALENDAR_LOCK:
+            # ── Level 1: in-memory ────────────────────────────────────────
+            cached = _PROCESS_CALENDARS.get(key)
+            if cached and not refresh and (cached[0] == today or time.monotonic() < cached[2]):
+                return cached[1]
+
+            # ── Level 2: on-disk JSON ─────────────────────────────────────
+            stored = self._read_calendar_file(path).get(kind, {})
+            if stored.get("fetched") == today and not refresh:
+                calendar = TradingCalendar(stored.get("holidays", []))
+                _PROCESS_CALENDARS[key] = (today, calendar, 0.0)
+                return calendar
+
+            # ── Level 3: holiday master ───────────────────────────────────
+            fresh = fetchers[kind](list_only=True)
+            if fresh is None:
+                calendar = TradingCalendar(stored.get("holidays", [])) if stored else None
+                if calendar is not None:
+                    logger.info("NseKit: holiday master unavailable — using calendar saved on %s",
+                                stored.get("fetched"))
+                _PROCESS_CALENDARS[key] = (stored.get("fetched"), calendar,
+                                           time.monotonic() + _CALENDAR_RETRY_SECS)
+                return calendar
+
+            calendar = TradingCalendar(list(stored.get("holidays", [])) + list(fresh))
+            _PROCESS_CALENDARS[key] = (today, calendar, 0.0)
+            self._write_calendar_file(path, kind, today, calendar.to_list())
+            return calendar
+
+    @_cached("live")
     def nse_live_market_turnover(self) -> pd.DataFrame:
         """
         Fetch live market turnover across all NSE segments.
@@ -2277,6 +3761,7 @@ class Nse:
                 })
         return _clean(pd.DataFrame(rows))
 
+    @_cached("live")
     def nse_live_hist_circulars(
         self,
         from_date_str: str | None = None,
@@ -2339,6 +3824,7 @@ class Nse:
         except Exception:
             return empty
 
+    @_cached("live")
     def nse_live_hist_press_releases(
         self,
         from_date_str: str | None = None,
@@ -2425,6 +3911,7 @@ class Nse:
             self._log_error("nse_live_hist_press_releases", exc)
             return empty
 
+    @_cached("live")
     def nse_reference_rates(self) -> pd.DataFrame | None:
         """
         Fetch the latest NSE currency reference rates for major pairs.
@@ -2475,6 +3962,7 @@ class Nse:
         )
         return pd.read_csv(BytesIO(raw)) if raw else None
 
+    @_cached("hist")
     def nse_6m_nifty_50(self, list_only: bool = False):
         """Return the current Nifty 50 constituent list (updated 6-monthly).
 
@@ -2498,6 +3986,7 @@ class Nse:
             "Symbol", list_only,
         )
 
+    @_cached("hist")
     def nse_6m_nifty_500(self, list_only: bool = False):
         """Return the current Nifty 500 constituent list (updated 6-monthly).
 
@@ -2521,6 +4010,7 @@ class Nse:
             "Symbol", list_only,
         )
 
+    @_cached("hist")
     def nse_eod_equity_full_list(self, list_only: bool = False):
         """Return the full NSE equity listing with symbols, names, and dates.
 
@@ -2544,6 +4034,7 @@ class Nse:
             "SYMBOL", list_only,
         )
 
+    @_cached("hist")
     def nse_eom_fno_full_list(self, mode: str = "stocks", list_only: bool = False):
         """
         Return the full F&O underlying list (stocks or indices).
@@ -2600,6 +4091,7 @@ class Nse:
             "https://www.nseindia.com/api/registered-investors",
         )
 
+    @_cached("hist")
     def list_of_indices(self):
         """Return the master list of all NSE index categories.
 
@@ -2621,6 +4113,7 @@ class Nse:
     # ════════════════════════════════════════════════════════════════════════
     # ── IPO ─────────────────────────────────────────────────────────────────
 
+    @_cached("live")
     def ipo_current(self) -> pd.DataFrame | None:
         """Fetch all currently active / ongoing IPOs on the NSE.
 
@@ -2649,6 +4142,7 @@ class Nse:
         ]
         return _clean(_keep_cols(df, cols).fillna(0)) if not df.empty else None
 
+    @_cached("live")
     def ipo_preopen(self) -> pd.DataFrame | None:
         """Fetch pre-open session data for IPOs listed today.
 
@@ -2694,6 +4188,7 @@ class Nse:
         df = pd.DataFrame(rows).fillna(0)
         return df if not df.empty else None
 
+    @_cached("live")
     def ipo_tracker_summary(self, category_filter: str | None = None) -> pd.DataFrame | None:
         """
         Return the IPO tracker summary table from NSE.
@@ -2749,6 +4244,7 @@ class Nse:
     # ════════════════════════════════════════════════════════════════════════
     # ── Pre-Open ────────────────────────────────────────────────────────────
 
+    @_cached("live")
     def pre_market_nifty_info(self, category: str = "All") -> pd.DataFrame | None:
         """Return the pre-open summary for the selected index category.
 
@@ -2783,6 +4279,7 @@ class Nse:
             "timestamp": data.get("timestamp", ""),
         }])
 
+    @_cached("live")
     def pre_market_all_nse_adv_dec_info(self, category: str = "All") -> pd.DataFrame | None:
         """Return aggregate advances/declines for the pre-open session.
 
@@ -2809,6 +4306,7 @@ class Nse:
             "timestamp": data.get("timestamp", ""),
         }])
 
+    @_cached("live")
     def pre_market_info(self, category: str = "All") -> pd.DataFrame | None:
         """
         Return detailed per-stock pre-open data for *category*.
@@ -2856,6 +4354,7 @@ class Nse:
 
         return pd.DataFrame(rows).set_index("symbol", drop=False)
 
+    @_cached("live")
     def pre_market_derivatives_info(self, category: str = "Index Futures") -> pd.DataFrame | None:
         """
         Return pre-open data for F&O contracts.
@@ -2916,6 +4415,7 @@ class Nse:
 # IV. Indices & VIX
 # ══════════════════════════════════════════════════════════════════════════════
 
+    @_cached("live")
     def index_live_all_indices_data(self) -> pd.DataFrame | None:
         """Return live snapshot for all NSE indices.
 
@@ -2946,6 +4446,7 @@ class Nse:
         df = _keep_cols(df, cols)
         return _clean(df.fillna(0))
 
+    @_cached("live")
     def index_live_indices_stocks_data(
         self,
         category:  str,
@@ -2997,6 +4498,7 @@ class Nse:
         ]
         return _clean(_keep_cols(df, col_order))
 
+    @_cached("live")
     def index_live_nifty_50_returns(self) -> pd.DataFrame | None:
         """Return the periodic returns of the Nifty 50 index (1W to 5Y).
 
@@ -3024,6 +4526,7 @@ class Nse:
         ]
         return _clean(_keep_cols(df, cols).fillna(0))
 
+    @_cached("live")
     def index_live_contribution(
         self,
         *args,
@@ -3110,6 +4613,30 @@ class Nse:
         )
         return pd.read_csv(BytesIO(raw)) if raw else None
 
+    # Raw → display column maps for the chunked index / VIX history APIs.
+    _INDEX_HIST_COLS: dict = {
+        "EOD_TIMESTAMP":      "Date",
+        "EOD_INDEX_NAME":     "Index Name",
+        "EOD_OPEN_INDEX_VAL": "Open",
+        "EOD_HIGH_INDEX_VAL": "High",
+        "EOD_LOW_INDEX_VAL":  "Low",
+        "EOD_CLOSE_INDEX_VAL":"Close",
+        "HIT_TRADED_QTY":     "Shares Traded",
+        "HIT_TURN_OVER":      "Turnover (₹ Cr)",
+    }
+    _VIX_HIST_COLS: dict = {
+        "EOD_TIMESTAMP":      "Date",
+        "EOD_INDEX_NAME":     "Symbol",
+        "EOD_OPEN_INDEX_VAL": "Open Price",
+        "EOD_HIGH_INDEX_VAL": "High Price",
+        "EOD_LOW_INDEX_VAL":  "Low Price",
+        "EOD_CLOSE_INDEX_VAL":"Close Price",
+        "EOD_PREV_CLOSE":     "Prev Close",
+        "VIX_PTS_CHG":        "VIX Pts Chg",
+        "VIX_PERC_CHG":       "VIX % Chg",
+    }
+
+    @_cached("hist")
     def index_historical_data(
         self,
         index: str,
@@ -3117,6 +4644,7 @@ class Nse:
         from_date: str | None = None,
         to_date:   str | None = None,
         period:    str | None = None,
+        incremental: bool | None = None,
     ) -> pd.DataFrame:
         """
         Return OHLCV + turnover history for an NSE index.
@@ -3134,6 +4662,10 @@ class Nse:
         period : str, optional
             Shorthand: ``"1D"``, ``"1W"``, ``"1M"``, ``"3M"``, ``"6M"``,
             ``"1Y"``, ``"2Y"``, ``"5Y"``, ``"10Y"``, ``"YTD"``, ``"MAX"``.
+        incremental : bool, optional
+            Keep a per-index history in the archive store and download
+            only the dates not yet stored. Defaults to
+            ``NseConfig.history_cache``.
 
         Returns
         -------
@@ -3147,27 +4679,56 @@ class Nse:
         >>> nse.index_historical_data("NIFTY 50", "01-12-2025")
         >>> nse.index_historical_data("NIFTY BANK", "1W")
         """
+        df = self._incremental_history(
+            "hist_index", index.upper(),
+            self._index_history_request(index, args, from_date, to_date, period),
+            lambda recs: self._hist_index_frame(recs, self._INDEX_HIST_COLS),
+            incremental,
+        )
+        return df if df is not None else pd.DataFrame()
+
+    def iter_index_historical_data(
+        self,
+        index: str,
+        *args,
+        from_date: str | None = None,
+        to_date:   str | None = None,
+        period:    str | None = None,
+    ):
+        """
+        Streaming variant of :meth:`index_historical_data`.
+
+        Yields one normalised ``DataFrame`` (same columns as the eager
+        method) per 89-day window as soon as it is downloaded, oldest
+        first, so long ranges can be written out chunk by chunk without
+        holding the whole history in memory.
+
+        Examples
+        --------
+        >>> for df in nse.iter_index_historical_data("NIFTY 50", "MAX"):
+        ...     df.to_csv("nifty.csv", mode="a", header=False, index=False)
+        """
+        yield from self._iter_hist_frames(
+            *self._index_history_request(index, args, from_date, to_date, period),
+            lambda recs: self._hist_index_frame(recs, self._INDEX_HIST_COLS),
+        )
+
+    @staticmethod
+    def _index_history_request(
+        index: str, args: tuple, from_date, to_date, period,
+    ) -> tuple[str, str, str, str]:
+        """Resolve ``(ref_url, api_tpl, from_date, to_date)`` for index history."""
         from_date, to_date, period, _ = _unpack_args(args, from_date, to_date, period)
         from_date, to_date = _resolve_dates(from_date, to_date, period)
         enc = index.replace(" ", "%20").upper()
-
-        return self._hist_index_df(
+        return (
             "https://www.nseindia.com/reports-indices-historical-index-data",
             f"https://www.nseindia.com/api/historicalOR/indicesHistory"
             f"?indexType={enc}&from={{}}&to={{}}",
             from_date, to_date,
-            {
-                "EOD_TIMESTAMP":      "Date",
-                "EOD_INDEX_NAME":     "Index Name",
-                "EOD_OPEN_INDEX_VAL": "Open",
-                "EOD_HIGH_INDEX_VAL": "High",
-                "EOD_LOW_INDEX_VAL":  "Low",
-                "EOD_CLOSE_INDEX_VAL":"Close",
-                "HIT_TRADED_QTY":     "Shares Traded",
-                "HIT_TURN_OVER":      "Turnover (₹ Cr)",
-            },
         )
 
+    @_cached("hist")
     def index_pe_pb_div_historical_data(
         self,
         index: str,
@@ -3230,6 +4791,7 @@ class Nse:
             df.ffill(inplace=True)
         return df
 
+    @_cached("hist")
     def india_vix_historical_data(
         self,
         *args,
@@ -3262,24 +4824,41 @@ class Nse:
         >>> nse.india_vix_historical_data("01-08-2025", "17-10-2025")
         >>> nse.india_vix_historical_data("1M")
         """
+        return self._hist_index_df(
+            *self._vix_history_request(args, from_date, to_date, period),
+            self._VIX_HIST_COLS,
+        )
+
+    def iter_india_vix_historical_data(
+        self,
+        *args,
+        from_date: str | None = None,
+        to_date:   str | None = None,
+        period:    str | None = None,
+    ):
+        """
+        Streaming variant of :meth:`india_vix_historical_data` — yields one
+        normalised ``DataFrame`` per 89-day window, oldest first.
+
+        Examples
+        --------
+        >>> for df in nse.iter_india_vix_historical_data("5Y"):
+        ...     print(df["Date"].iloc[0], len(df))
+        """
+        yield from self._iter_hist_frames(
+            *self._vix_history_request(args, from_date, to_date, period),
+            lambda recs: self._hist_index_frame(recs, self._VIX_HIST_COLS),
+        )
+
+    @staticmethod
+    def _vix_history_request(args: tuple, from_date, to_date, period) -> tuple[str, str, str, str]:
+        """Resolve ``(ref_url, api_tpl, from_date, to_date)`` for VIX history."""
         from_date, to_date, period, _ = _unpack_args(args, from_date, to_date, period)
         from_date, to_date = _resolve_dates(from_date, to_date, period)
-
-        return self._hist_index_df(
+        return (
             "https://www.nseindia.com/report-detail/eq_security",
             "https://www.nseindia.com/api/historicalOR/vixhistory?from={}&to={}",
             from_date, to_date,
-            {
-                "EOD_TIMESTAMP":      "Date",
-                "EOD_INDEX_NAME":     "Symbol",
-                "EOD_OPEN_INDEX_VAL": "Open Price",
-                "EOD_HIGH_INDEX_VAL": "High Price",
-                "EOD_LOW_INDEX_VAL":  "Low Price",
-                "EOD_CLOSE_INDEX_VAL":"Close Price",
-                "EOD_PREV_CLOSE":     "Prev Close",
-                "VIX_PTS_CHG":        "VIX Pts Chg",
-                "VIX_PERC_CHG":       "VIX % Chg",
-            },
         )
 
 
@@ -3368,6 +4947,7 @@ class Nse:
 # V. Capital Market (Equities)
 # ══════════════════════════════════════════════════════════════════════════════
 
+    @_cached("live")
     def cm_live_gifty_nifty(self) -> pd.DataFrame | None:
         """Return the live Gift Nifty price along with USD/INR spot info.
 
@@ -3404,6 +4984,7 @@ class Nse:
             "usdInr_expiry_dt": ui.get("expiry_dt"),
         }])
 
+    @_cached("live")
     def cm_live_market_statistics(self) -> pd.DataFrame | None:
         """
         Return today's market breadth summary.
@@ -3450,6 +5031,7 @@ class Nse:
             "Date":                       d.get("asOnDate"),
         }])
 
+    @_cached("live")
     def cm_live_equity_info(self, symbol: str) -> dict | None:
         """
         Return basic equity information for a symbol.
@@ -3500,6 +5082,7 @@ class Nse:
             self._log_error("cm_live_equity_info", exc)
             return None
 
+    @_cached("live")
     def cm_live_equity_price_info(self, symbol: str) -> dict | None:
         """
         Return live price info including OHLC, VWAP, and the 5-level order book.
@@ -3583,6 +5166,99 @@ class Nse:
             self._log_error("cm_live_equity_price_info", exc)
             return None
 
+    # Index-snapshot column → cm_live_equity_price_info key.
+    _INDEX_QUOTE_COLS = {
+        "previousClose": "PreviousClose",
+        "lastPrice":     "LastTradedPrice",
+        "change":        "Change",
+        "pChange":       "PercentChange",
+        "open":          "Open",
+        "dayHigh":       "High",
+        "dayLow":        "Low",
+    }
+
+    def cm_live_equity_price_info_many(
+        self,
+        symbols: list[str],
+        workers: int = 4,
+        retries: int = 1,
+        index:   str | list[str] | None = "NIFTY 500",
+    ) -> pd.DataFrame | None:
+        """
+        Return live price info for many symbols as one DataFrame indexed by symbol.
+
+        Symbols that are constituents of *index* are filled from a single
+        ``index_live_indices_stocks_data`` call (price, change and OHLC
+        columns only, ``Source == "index"``).  The rest are fetched with
+        ``cm_live_equity_price_info`` on *workers* threads that share the
+        process-wide token bucket (``Source == "quote"``).  A symbol whose
+        quote fails is retried on its own up to *retries* more times; any
+        still missing are logged and left out.
+
+        Parameters
+        ----------
+        symbols : list of str
+            NSE equity symbols. Duplicates are dropped, order is kept.
+        workers : int, optional
+            Concurrent per-symbol quote requests. Default ``4``.
+        retries : int, optional
+            Extra rounds for symbols whose quote failed. Default ``1``.
+        index : str or list of str or None, optional
+            Index snapshot(s) used to serve covered symbols without a
+            per-symbol call. Pass ``None`` to quote every symbol (needed for
+            VWAP, circuit limits and the order book). Default ``"NIFTY 500"``.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            One row per symbol, columns as in ``cm_live_equity_price_info``
+            plus ``Source``; ``None`` if nothing could be fetched.
+
+        Examples
+        --------
+        >>> nse.cm_live_equity_price_info_many(["RELIANCE", "TCS", "IRCTC"])
+        >>> nse.cm_live_equity_price_info_many(["RELIANCE", "TCS"], index=None, workers=2)
+        """
+        wanted = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+        if not wanted:
+            return None
+        rows: dict[str, dict] = {}
+
+        for name in [index] if isinstance(index, str) else (index or []):
+            pending = [s for s in wanted if s not in rows]
+            if not pending:
+                break
+            snap = self.index_live_indices_stocks_data(name)
+            if not isinstance(snap, pd.DataFrame) or "symbol" not in snap.columns:
+                continue
+            for rec in snap[snap["symbol"].isin(pending)].to_dict("records"):
+                rows[rec["symbol"]] = {
+                    "Symbol": rec["symbol"],
+                    **{new: rec.get(old) for old, new in self._INDEX_QUOTE_COLS.items()},
+                    "Source": "index",
+                }
+
+        pending = [s for s in wanted if s not in rows]
+        for _ in range(max(retries, 0) + 1):
+            if not pending:
+                break
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as pool:
+                results = list(pool.map(self.cm_live_equity_price_info, pending))
+            for sym, res in zip(pending, results):
+                if res:
+                    rows[sym] = {**res, "Symbol": sym, "Source": "quote"}
+            pending = [s for s in pending if s not in rows]
+
+        if pending:
+            logger.warning("cm_live_equity_price_info_many: no data for %s", ", ".join(pending))
+        if not rows:
+            return None
+
+        df   = pd.DataFrame([rows[s] for s in wanted if s in rows])
+        cols = ["Symbol", *[c for c in df.columns if c not in ("Symbol", "Source")], "Source"]
+        return _clean(df[cols].set_index("Symbol", drop=False))
+
+    @_cached("live")
     def cm_live_equity_full_info(self, symbol: str) -> dict | None:
         """
         Return comprehensive live data for a symbol.
@@ -3717,13 +5393,89 @@ class Nse:
                 # ================= META =================
                 "LastUpdated":              eq.get("lastUpdateTime")
         }
-        
+
         return result
 
+    def cm_live_equity_full_info_many(
+        self,
+        symbols:  list[str],
+        workers:  int = 4,
+        retries:  int = 1,
+        progress      = None,
+    ) -> tuple[pd.DataFrame | None, list[str]]:
+        """
+        Return ``cm_live_equity_full_info`` for many symbols as one DataFrame.
+
+        Symbols are fetched on *workers* threads that share the process-wide
+        token bucket, so a sweep runs at ``max_rps`` instead of one symbol
+        per request latency.  Each request already goes through the client's
+        ``_retry`` policy; a symbol that still fails is retried on its own for
+        up to *retries* more rounds, then reported in the failures list.
+        Pick ``workers`` around ``max_rps × request latency`` — more only
+        queue on the bucket.
+
+        Parameters
+        ----------
+        symbols : list of str
+            NSE equity symbols. Duplicates are dropped, order is kept.
+        workers : int, optional
+            Concurrent quote requests. Default ``4``.
+        retries : int, optional
+            Extra rounds for symbols that failed. Default ``1``.
+        progress : callable, optional
+            Called as ``progress(symbol, done, total)`` each time a symbol
+            succeeds or finally fails.
+
+        Returns
+        -------
+        tuple of (pd.DataFrame or None, list of str)
+            One row per symbol indexed by ``Symbol`` with the columns of
+            ``cm_live_equity_full_info`` (``None`` if nothing could be
+            fetched), and the symbols that failed, in input order.
+
+        Examples
+        --------
+        >>> df, failed = nse.cm_live_equity_full_info_many(["RELIANCE", "TCS", "IRCTC"])
+        >>> df, failed = nse.cm_live_equity_full_info_many(symbols, workers=6,
+        ...                                                progress=lambda s, d, n: print(f"{d}/{n} {s}"))
+        """
+        wanted = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+        rows: dict[str, dict] = {}
+        pending, rounds, done = wanted, max(retries, 0) + 1, 0
+
+        for attempt in range(rounds):
+            if not pending:
+                break
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending))),
+                                    thread_name_prefix="nsekit-full-info") as pool:
+                futures = {pool.submit(self.cm_live_equity_full_info, s): s for s in pending}
+                for fut in as_completed(futures):
+                    sym = futures[fut]
+                    try:
+                        res = fut.result()
+                    except Exception as exc:
+                        self._log_error(f"cm_live_equity_full_info_many {sym}", exc)
+                        res = None
+                    if res:
+                        rows[sym] = {**res, "Symbol": sym}
+                    if res or attempt == rounds - 1:
+                        done += 1
+                        if progress is not None:
+                            progress(sym, done, len(wanted))
+            pending = [s for s in pending if s not in rows]
+
+        if pending:
+            logger.warning("cm_live_equity_full_info_many: no data for %s", ", ".join(pending))
+        if not rows:
+            return None, pending
+        df = pd.DataFrame([rows[s] for s in wanted if s in rows])
+        return _clean(df.set_index("Symbol", drop=False)), pending
+
     # ══════════════════════════════════════════════════════════════════════════════
     # VI. Capital Market (Equities)
     # ══════════════════════════════════════════════════════════════════════════════
 
+    @_cached("live")
     def cm_live_most_active_equity_by_value(self) -> pd.DataFrame | None:
         """Return today's most actively traded equities ranked by traded value.
 
@@ -3740,6 +5492,7 @@ class Nse:
             "https://www.nseindia.com/api/live-analysis-most-active-securities?index=value",
         )
 
+    @_cached("live")
     def cm_live_most_active_equity_by_vol(self) -> pd.DataFrame | None:
         """Return today's most actively traded equities ranked by traded volume.
 
@@ -3756,6 +5509,7 @@ class Nse:
             "https://www.nseindia.com/api/live-analysis-most-active-securities?index=volume",
         )
 
+    @_cached("live")
     def cm_live_volume_spurts(self) -> pd.DataFrame | None:
         """
         Return equities with unusual intraday volume spikes (1-week and
@@ -3784,6 +5538,7 @@ class Nse:
             "turnover":       "Turnover (₹ Lakhs)",
         })
 
+    @_cached("live")
     def cm_live_52week_high(self) -> pd.DataFrame | None:
         """Return equities that hit a new 52-week high today.
 
@@ -3802,6 +5557,7 @@ class Nse:
             "https://www.nseindia.com/api/live-analysis-data-52weekhighstock",
         )
 
+    @_cached("live")
     def cm_live_52week_low(self) -> pd.DataFrame | None:
         """Return equities that hit a new 52-week low today.
 
@@ -3820,6 +5576,7 @@ class Nse:
             "https://www.nseindia.com/api/live-analysis-data-52weeklowstock",
         )
 
+    @_cached("live")
     def cm_live_block_deal(self) -> pd.DataFrame | None:
         """Return today's block-deal data with session, OHLC, and volume.
 
@@ -3895,6 +5652,7 @@ class Nse:
     # ════════════════════════════════════════════════════════════════════════
     # ── CM — Corporate Filings (Live) ───────────────────────────────────────
 
+    @_cached("live")
     def cm_live_hist_insider_trading(
         self,
         *args,
@@ -3949,6 +5707,7 @@ class Nse:
             keep_cols=cols,
         )
 
+    @_cached("live")
     def cm_live_hist_corporate_announcement(
         self,
         *args,
@@ -3999,6 +5758,7 @@ class Nse:
             extra="&reqXbrl=false", keep_cols=cols,
         )
 
+    @_cached("live")
     def cm_live_hist_corporate_action(
         self,
         *args,
@@ -4090,6 +5850,7 @@ class Nse:
         ]
         return _clean_str(_keep_cols(df, cols))
 
+    @_cached("live")
     def cm_live_today_event_calendar(
         self,
         from_date: str | None = None,
@@ -4124,6 +5885,7 @@ class Nse:
             keep_cols=["symbol", "company", "purpose", "bm_desc", "date"],
         )
 
+    @_cached("live")
     def cm_live_upcoming_event_calendar(self) -> pd.DataFrame | None:
         """Return all upcoming corporate events in the NSE event calendar.
 
@@ -4145,6 +5907,7 @@ class Nse:
         df = pd.DataFrame(data)
         return df[["symbol", "company", "purpose", "bm_desc", "date"]] if not df.empty else None
 
+    @_cached("live")
     def cm_live_hist_board_meetings(
         self,
         *args,
@@ -4188,6 +5951,7 @@ class Nse:
             keep_cols=cols,
         )
 
+    @_cached("live")
     def cm_live_hist_Shareholder_meetings(
         self,
         *args,
@@ -4256,6 +6020,7 @@ class Nse:
         df   = _keep_cols(df, cols)
         return _clean_str(df)
 
+    @_cached("hist")
     def cm_live_hist_qualified_institutional_placement(self, *args, **kw) -> pd.DataFrame | None:
         """Return QIP filings — In-Principle or Listing Stage.
 
@@ -4317,6 +6082,7 @@ class Nse:
             *args, **kw,
         )
 
+    @_cached("hist")
     def cm_live_hist_preferential_issue(self, *args, **kw) -> pd.DataFrame | None:
         """Return preferential-issue filings — In-Principle or Listing Stage.
 
@@ -4374,6 +6140,7 @@ class Nse:
             *args, **kw,
         )
 
+    @_cached("hist")
     def cm_live_hist_right_issue(self, *args, **kw) -> pd.DataFrame | None:
         """Return rights-issue filings — In-Principle or Listing Stage.
 
@@ -4481,6 +6248,7 @@ class Nse:
     #         df[col] = df[col].map(_flatten)
     #     return df.reset_index(drop=True)
 
+    @_cached("live")
     def cm_live_voting_results(self) -> pd.DataFrame | None:
         """Return corporate voting results with per-agenda breakdown.
 
@@ -4591,6 +6359,7 @@ class Nse:
 
         return df
 
+    @_cached("live")
     def cm_live_qtly_shareholding_patterns(self) -> pd.DataFrame | None:
         """Return the latest quarterly shareholding-pattern filings.
 
@@ -4733,6 +6502,9 @@ class Nse:
         """
         Download the full CM bhavcopy with delivery data for a trade date.
 
+        Repeat requests for the same date are served from the local EOD
+        archive store (see ``NseConfig.archive_dir``).
+
         Parameters
         ----------
         trade_date : str
@@ -4747,23 +6519,29 @@ class Nse:
         --------
         >>> nse.cm_eod_bhavcopy_with_delivery("17-10-2025")
         """
-        dt  = _fmt_trade_date(trade_date)
-        raw = self._get_archive(
-            f"https://nsearchives.nseindia.com/products/content/"
-            f"sec_bhavdata_full_{dt}.csv"
-        )
-        if not raw:
-            return None
-        df = pd.read_csv(BytesIO(raw))
-        df.columns        = [c.replace(" ", "") for c in df.columns]
-        df["SERIES"]      = df["SERIES"].str.replace(" ", "")
-        df["DATE1"]       = df["DATE1"].str.replace(" ", "")
-        return df
-
-    def cm_eod_equity_bhavcopy(self, trade_date: str) -> pd.DataFrame | None:
-        """
+        def _fetch() -> pd.DataFrame | None:
+            dt  = _fmt_trade_date(trade_date)
+            raw = self._get_archive(
+                f"https://nsearchives.nseindia.com/products/content/"
+                f"sec_bhavdata_full_{dt}.csv"
+            )
+            if not raw:
+                return None
+            df = pd.read_csv(BytesIO(raw))
+            df.columns        = [c.replace(" ", "") for c in df.columns]
+            df["SERIES"]      = df["SERIES"].str.replace(" ", "")
+            df["DATE1"]       = df["DATE1"].str.replace(" ", "")
+            return df
+
+        return self._archived("cm_bhavcopy_delivery", trade_date, _fetch)
+
+    def cm_eod_equity_bhavcopy(self, trade_date: str) -> pd.DataFrame | None:
+        """
         Download the NSE CM equity bhavcopy (EQ series only) for a trade date.
 
+        Repeat requests for the same date are served from the local EOD
+        archive store (see ``NseConfig.archive_dir``).
+
         Parameters
         ----------
         trade_date : str
@@ -4778,15 +6556,18 @@ class Nse:
         --------
         >>> nse.cm_eod_equity_bhavcopy("17-10-2025")
         """
-        dt  = _fmt_trade_date(trade_date, "%Y%m%d")
-        raw = self._get_archive(
-            f"https://nsearchives.nseindia.com/content/cm/"
-            f"BhavCopy_NSE_CM_0_0_0_{dt}_F_0000.csv.zip"
-        )
-        if not raw:
-            return None
-        df = self._zip_csv(raw)
-        return df[df["SctySrs"] == "EQ"].reset_index(drop=True) if not df.empty else None
+        def _fetch() -> pd.DataFrame | None:
+            dt  = _fmt_trade_date(trade_date, "%Y%m%d")
+            raw = self._get_archive(
+                f"https://nsearchives.nseindia.com/content/cm/"
+                f"BhavCopy_NSE_CM_0_0_0_{dt}_F_0000.csv.zip"
+            )
+            if not raw:
+                return None
+            df = self._zip_csv(raw)
+            return df[df["SctySrs"] == "EQ"].reset_index(drop=True) if not df.empty else None
+
+        return self._archived("cm_bhavcopy", trade_date, _fetch)
 
     def cm_eod_52_week_high_low(self, trade_date: str) -> list | None:
         """
@@ -5046,6 +6827,7 @@ class Nse:
     # ════════════════════════════════════════════════════════════════════════
     # ── CM — Historical ─────────────────────────────────────────────────────
 
+    @_cached("hist")
     def cm_hist_eq_price_band(
         self,
         *args,
@@ -5105,6 +6887,7 @@ class Nse:
         )
         return self._get_csv_session(ref_url, api_url)
 
+    @_cached("hist")
     def cm_hist_security_wise_data(
         self,
         *args,
@@ -5112,6 +6895,7 @@ class Nse:
         to_date:   str | None = None,
         period:    str | None = None,
         symbol:    str | None = None,
+        incremental: bool | None = None,
     ) -> pd.DataFrame | None:
         """
         Return historical price, volume, and delivery data for a symbol.
@@ -5128,6 +6912,10 @@ class Nse:
             Shorthand: ``"1D"`` – ``"1Y"``.
         symbol : str, optional
             NSE equity symbol. Required if not passed positionally.
+        incremental : bool, optional
+            Keep a per-symbol history in the archive store and download
+            only the dates not yet stored. Defaults to
+            ``NseConfig.history_cache``.
 
         Returns
         -------
@@ -5143,38 +6931,79 @@ class Nse:
         >>> nse.cm_hist_security_wise_data("RELIANCE", "1Y")
         >>> nse.cm_hist_security_wise_data("RELIANCE", "01-10-2025", "17-10-2025")
         """
+        symbol = _unpack_args(args, symbol=symbol, short=True)[3]
+        return self._incremental_history(
+            "hist_security", symbol,
+            self._security_wise_request(args, from_date, to_date, period, symbol),
+            self._security_wise_frame,
+            incremental,
+        )
+
+    def iter_cm_hist_security_wise_data(
+        self,
+        *args,
+        from_date: str | None = None,
+        to_date:   str | None = None,
+        period:    str | None = None,
+        symbol:    str | None = None,
+    ):
+        """
+        Streaming variant of :meth:`cm_hist_security_wise_data`.
+
+        Yields one normalised ``DataFrame`` (same columns as the eager
+        method) per 89-day window as soon as it is downloaded, oldest
+        first.  Each window can be written to disk or analysed while the
+        rest of the range is still downloading.
+
+        Examples
+        --------
+        >>> for df in nse.iter_cm_hist_security_wise_data("RELIANCE", "01-01-2015", "17-10-2025"):
+        ...     df.to_parquet(f"RELIANCE_{df['Date'].iloc[0]}.parquet")
+        """
+        yield from self._iter_hist_frames(
+            *self._security_wise_request(args, from_date, to_date, period, symbol),
+            self._security_wise_frame,
+        )
+
+    _SECURITY_WISE_COLS: dict = {
+        "CH_SYMBOL":            "Symbol",
+        "CH_SERIES":            "Series",
+        "mTIMESTAMP":           "Date",
+        "CH_PREVIOUS_CLS_PRICE":"Prev Close",
+        "CH_OPENING_PRICE":     "Open Price",
+        "CH_TRADE_HIGH_PRICE":  "High Price",
+        "CH_TRADE_LOW_PRICE":   "Low Price",
+        "CH_LAST_TRADED_PRICE": "Last Price",
+        "CH_CLOSING_PRICE":     "Close Price",
+        "VWAP":                 "VWAP",
+        "CH_TOT_TRADED_QTY":    "Total Traded Quantity",
+        "CH_TOT_TRADED_VAL":    "Turnover ₹",
+        "CH_TOTAL_TRADES":      "No. of Trades",
+        "COP_DELIV_QTY":        "Deliverable Qty",
+        "COP_DELIV_PERC":       "% Dly Qt to Traded Qty",
+    }
+
+    @staticmethod
+    def _security_wise_request(
+        args: tuple, from_date, to_date, period, symbol,
+    ) -> tuple[str, str, str, str]:
+        """Resolve ``(ref_url, api_tpl, from_date, to_date)`` for security-wise data."""
         from_date, to_date, period, symbol = _unpack_args(
             args, from_date, to_date, period, symbol, short=True
         )
         from_date, to_date = _resolve_dates(from_date, to_date, period)
-
-        ref_url = "https://www.nseindia.com/report-detail/eq_security"
-        api_tpl = (
+        return (
+            "https://www.nseindia.com/report-detail/eq_security",
             f"https://www.nseindia.com/api/historicalOR/"
             f"generateSecurityWiseHistoricalData"
-            f"?from={{}}&to={{}}&symbol={symbol}&type=priceVolumeDeliverable&series=ALL"
+            f"?from={{}}&to={{}}&symbol={symbol}&type=priceVolumeDeliverable&series=ALL",
+            from_date, to_date,
         )
-        records = self._get_chunked(ref_url, api_tpl, from_date, to_date)
-        if not records:
-            return None
 
-        col_map = {
-            "CH_SYMBOL":            "Symbol",
-            "CH_SERIES":            "Series",
-            "mTIMESTAMP":           "Date",
-            "CH_PREVIOUS_CLS_PRICE":"Prev Close",
-            "CH_OPENING_PRICE":     "Open Price",
-            "CH_TRADE_HIGH_PRICE":  "High Price",
-            "CH_TRADE_LOW_PRICE":   "Low Price",
-            "CH_LAST_TRADED_PRICE": "Last Price",
-            "CH_CLOSING_PRICE":     "Close Price",
-            "VWAP":                 "VWAP",
-            "CH_TOT_TRADED_QTY":    "Total Traded Quantity",
-            "CH_TOT_TRADED_VAL":    "Turnover ₹",
-            "CH_TOTAL_TRADES":      "No. of Trades",
-            "COP_DELIV_QTY":        "Deliverable Qty",
-            "COP_DELIV_PERC":       "% Dly Qt to Traded Qty",
-        }
+    @classmethod
+    def _security_wise_frame(cls, records: list) -> pd.DataFrame:
+        """Rename, zero-fill, sort and de-duplicate raw security-wise records."""
+        col_map = cls._SECURITY_WISE_COLS
         df = pd.DataFrame(records)
         df = _keep_cols(df, col_map).rename(columns=col_map)
         df.replace({np.inf: 0, -np.inf: 0}, inplace=True)
@@ -5182,6 +7011,7 @@ class Nse:
         df = _sort_dedup_dates(df, "Date", fmt="%d-%b-%Y", ascending=True)
         return df
 
+    @_cached("hist")
     def cm_hist_bulk_deals(self,  *args, **kw) -> pd.DataFrame | None:
         """Return historical bulk-deal records.
 
@@ -5209,6 +7039,7 @@ class Nse:
         """
         return self._hist_deal_csv("bulk_deals",   *args, **kw)
 
+    @_cached("hist")
     def cm_hist_block_deals(self, *args, **kw) -> pd.DataFrame | None:
         """Return historical block-deal records.
 
@@ -5233,6 +7064,7 @@ class Nse:
         """
         return self._hist_deal_csv("block_deals",  *args, **kw)
 
+    @_cached("hist")
     def cm_hist_short_selling(self, *args, **kw) -> pd.DataFrame | None:
         """Return historical short-selling records.
 
@@ -5261,6 +7093,7 @@ class Nse:
     # ════════════════════════════════════════════════════════════════════════
     # ── CM — Periodic Reports ───────────────────────────────────────────────
 
+    @_cached("live")
     def cm_dmy_biz_growth(
         self,
         *args,
@@ -5298,6 +7131,7 @@ class Nse:
         mode, month, year = _parse_biz_growth_args(args, month, year, mode)
         return self._biz_growth_fetch("cm", mode, month, year)
 
+    @_cached("hist")
     def cm_monthly_settlement_report(
         self,
         *args,
@@ -5348,6 +7182,7 @@ class Nse:
             },
         )
 
+    @_cached("live")
     def cm_monthly_most_active_equity(self) -> pd.DataFrame | None:
         """Return the monthly most-active equities by turnover.
 
@@ -5384,6 +7219,7 @@ class Nse:
         })
         return _clean(df.fillna(0))
 
+    @_cached("live")
     def historical_advances_decline(
         self,
         *args,
@@ -5502,6 +7338,7 @@ class Nse:
             f"?functionName=getSymbolDerivativesData&symbol={symbol}",
         )
 
+    @_cached("live")
     def symbol_specific_most_active_Calls_or_Puts_or_Contracts_by_OI(
         self,
         symbol:    str,
@@ -5570,6 +7407,7 @@ class Nse:
     # VII. Derivatives (F&O)
     # ══════════════════════════════════════════════════════════════════════════════
 
+    @_cached("live")
     def fno_live_futures_data(self, symbol: str) -> pd.DataFrame | None:
         """
         Return live futures data for all expiries of a symbol.
@@ -5631,6 +7469,7 @@ class Nse:
         ]
         return _keep_cols(df, order)
 
+    @_cached("live")
     def fno_live_top_20_derivatives_contracts(
         self,
         category: str = "Stock Options",
@@ -5711,6 +7550,7 @@ class Nse:
             self._log_error("fno_live_top_20_derivatives_contracts", exc)
             return None
 
+    @_cached("live")
     def fno_live_most_active_futures_contracts(
         self,
         mode: str = "Volume",
@@ -5744,6 +7584,7 @@ class Nse:
             self._log_error("fno_live_most_active_futures_contracts", exc)
             return None
 
+    @_cached("live")
     def fno_live_most_active(
         self,
         mode:    str = "Index",
@@ -5789,6 +7630,7 @@ class Nse:
             self._log_error("fno_live_most_active", exc)
             return None
 
+    @_cached("live")
     def fno_live_most_active_contracts_by_oi(self) -> pd.DataFrame | None:
         """Return the most active derivative contracts ranked by open interest.
 
@@ -5802,6 +7644,7 @@ class Nse:
         """
         return self._snapshot_contracts("oi")
 
+    @_cached("live")
     def fno_live_most_active_contracts_by_volume(self) -> pd.DataFrame | None:
         """Return the most active derivative contracts ranked by trading volume.
 
@@ -5815,6 +7658,7 @@ class Nse:
         """
         return self._snapshot_contracts("contracts")
 
+    @_cached("live")
     def fno_live_most_active_options_contracts_by_volume(self) -> pd.DataFrame | None:
         """Return the top-20 most active options contracts by trading volume.
 
@@ -5828,6 +7672,7 @@ class Nse:
         """
         return self._snapshot_contracts("options&limit=20")
 
+    @_cached("live")
     def fno_live_most_active_underlying(self) -> pd.DataFrame | None:
         """
         Return the most active F&O underlying symbols by total volume.
@@ -5872,6 +7717,7 @@ class Nse:
             self._log_error("fno_live_most_active_underlying", exc)
             return None
 
+    @_cached("live")
     def fno_live_change_in_oi(self) -> pd.DataFrame | None:
         """
         Return OI spurts — underlyings with the largest OI change today.
@@ -5917,6 +7763,7 @@ class Nse:
             self._log_error("fno_live_change_in_oi", exc)
             return None
 
+    @_cached("live")
     def fno_live_oi_vs_price(self) -> pd.DataFrame | None:
         """
         Return OI-vs-price signals for all F&O contracts.
@@ -5976,6 +7823,7 @@ class Nse:
             self._log_error("fno_live_oi_vs_price", exc)
             return None
 
+    @_cached("live")
     def fno_expiry_dates_raw(self, symbol: str = "NIFTY") -> dict | None:
         """Return the raw option-chain dropdown JSON for a symbol.
 
@@ -6000,6 +7848,7 @@ class Nse:
             f"?functionName=getOptionChainDropdown&symbol={symbol}",
         )
 
+    @_cached("live")
     def fno_expiry_dates(
         self,
         symbol:       str = "NIFTY",
@@ -6116,6 +7965,7 @@ class Nse:
             return None
         return pd.to_datetime(sub.loc[0, "Expiry Date"], format="%d-%b-%Y").strftime("%d-%m-%Y")
 
+    @_cached("live")
     def fno_live_option_chain_raw(
         self,
         symbol:      str,
@@ -6146,6 +7996,7 @@ class Nse:
             f"&params=expiryDate={expiry_date}",
         )
 
+    @_cached("live")
     def fno_live_option_chain(
         self,
         symbol:      str,
@@ -6181,31 +8032,8 @@ class Nse:
         >>> nse.fno_live_option_chain("RELIANCE", oi_mode="compact")
         """
         self.rotate_user_agent()
-        base_url = "https://www.nseindia.com/api/NextApi/apiClient/GetQuoteApi"
-
-        full_cols = [
-            "Fetch_Time", "Symbol", "Expiry_Date",
-            "CALLS_OI", "CALLS_Chng_in_OI", "CALLS_Volume", "CALLS_IV",
-            "CALLS_LTP", "CALLS_Net_Chng",
-            "CALLS_Bid_Qty", "CALLS_Bid_Price", "CALLS_Ask_Price", "CALLS_Ask_Qty",
-            "Strike_Price",
-            "PUTS_Bid_Qty", "PUTS_Bid_Price", "PUTS_Ask_Price", "PUTS_Ask_Qty",
-            "PUTS_Net_Chng", "PUTS_LTP", "PUTS_IV",
-            "PUTS_Volume", "PUTS_Chng_in_OI", "PUTS_OI",
-            "Underlying_Value"
-        ]
-
-        compact_cols = [
-            "Fetch_Time", "Symbol", "Expiry_Date",
-            "CALLS_OI", "CALLS_Chng_in_OI", "CALLS_Volume", "CALLS_IV",
-            "CALLS_LTP", "CALLS_Net_Chng",
-            "Strike_Price",
-            "PUTS_Net_Chng", "PUTS_LTP", "PUTS_IV",
-            "PUTS_Volume", "PUTS_Chng_in_OI", "PUTS_OI",
-            "Underlying_Value"
-        ]
-
-        col_names = compact_cols if oi_mode == "compact" else full_cols
+        base_url  = "https://www.nseindia.com/api/NextApi/apiClient/GetQuoteApi"
+        col_names = _OC_COMPACT_COLS if oi_mode == "compact" else _OC_FULL_COLS
 
         dtypes = {
             c: "float64"
@@ -6261,50 +8089,42 @@ class Nse:
 
         if not records:
             return pd.DataFrame(columns=col_names).astype(dtypes)
+        return _option_chain_frame(records, symbol, target, ts, uv, oi_mode)
+
+    # Output column → (contract key, default) for fno_live_active_contracts.
+    _ACTIVE_CONTRACT_SPEC = {
+        "Instrument Type":    ("instrumentType",        ""),
+        "Expiry Date":        ("expiryDate",            ""),
+        "Option Type":        ("optionType",            ""),
+        "Strike Price":       ("strikePrice",           ""),
+        "Open":               ("openPrice",             0),
+        "High":               ("highPrice",             0),
+        "Low":                ("lowPrice",              0),
+        "closePrice":         ("closePrice",            0),
+        "Prev Close":         ("prevClose",             0),
+        "Last":               ("lastPrice",             0),
+        "Change":             ("change",                0),
+        "%Change":            ("pchange",               0),
+        "Volume (Contracts)": ("totalTradedVolume",     0),
+        "Value (₹ Lakhs)":    ("totalTurnover",         0),
+        "OI":                 ("openInterest",          0),
+        "Chng in OI":         ("changeinOpenInterest",  0),
+        "% Chng in OI":       ("pchangeinOpenInterest", 0),
+    }
+    _ACTIVE_CONTRACT_COLS = (
+        "Instrument Type", "Expiry Date", "Option Type", "Strike Price",
+        "Open", "High", "Low", "closePrice", "Prev Close", "Last", "Change",
+        "%Change", "Volume (Contracts)", "Value (₹ Lakhs)", "totalBuyQuantity",
+        "totalSellQuantity", "OI", "Chng in OI", "% Chng in OI", "VWAP",
+    )
 
-        rows = []
-        for item in records:
-            ce  = item.get("CE", {})
-            pe  = item.get("PE", {})
-            row = {
-                "Fetch_Time":       ts,
-                "Symbol":           symbol,
-                "Expiry_Date":      target,
-                "Strike_Price":     item.get("strikePrice"),
-                "CALLS_OI":         ce.get("openInterest",          0),
-                "CALLS_Chng_in_OI": ce.get("changeinOpenInterest",  0),
-                "CALLS_Volume":     ce.get("totalTradedVolume",      0),
-                "CALLS_IV":         ce.get("impliedVolatility",      0),
-                "CALLS_LTP":        ce.get("lastPrice",              0),
-                "CALLS_Net_Chng":   ce.get("change",                 0),
-                "PUTS_OI":          pe.get("openInterest",           0),
-                "PUTS_Chng_in_OI":  pe.get("changeinOpenInterest",   0),
-                "PUTS_Volume":      pe.get("totalTradedVolume",       0),
-                "PUTS_IV":          pe.get("impliedVolatility",       0),
-                "PUTS_LTP":         pe.get("lastPrice",               0),
-                "PUTS_Net_Chng":    pe.get("change",                  0),
-                "Underlying_Value": uv,
-            }
-            if oi_mode == "full":
-                row.update({
-                    "CALLS_Bid_Qty":   ce.get("totalBuyQuantity",  0) or ce.get("buyQuantity1",  0),
-                    "CALLS_Bid_Price": ce.get("buyPrice1",          0),
-                    "CALLS_Ask_Price": ce.get("sellPrice1",         0),
-                    "CALLS_Ask_Qty":   ce.get("totalSellQuantity",  0) or ce.get("sellQuantity1", 0),
-                    "PUTS_Bid_Qty":    pe.get("totalBuyQuantity",   0) or pe.get("buyQuantity1",  0),
-                    "PUTS_Bid_Price":  pe.get("buyPrice1",           0),
-                    "PUTS_Ask_Price":  pe.get("sellPrice1",          0),
-                    "PUTS_Ask_Qty":    pe.get("totalSellQuantity",   0) or pe.get("sellQuantity1", 0),
-                })
-            rows.append(row)
-
-        return pd.DataFrame(rows, columns=col_names).astype(dtypes)
-
+    @_cached("live")
     def fno_live_active_contracts(
         self,
         symbol:      str,
         expiry_date: str | None = None,
-    ) -> list | None:
+        as_frame:    bool       = False,
+    ) -> list | pd.DataFrame | None:
         """
         Return all live active option contracts for a symbol.
 
@@ -6315,10 +8135,13 @@ class Nse:
         expiry_date : str, optional
             Target expiry in ``DD-MMM-YYYY`` format (e.g. ``"27-Jan-2026"``).
             Defaults to the nearest available expiry.
+        as_frame : bool, optional
+            Return one ``DataFrame`` (same columns) instead of a list of
+            dicts. Default ``False``.
 
         Returns
         -------
-        list of dict or None
+        list of dict or pd.DataFrame or None
             Each dict has keys: Instrument Type, Expiry Date, Option Type,
             Strike Price, Open, High, Low, Last, Change, Volume, OI, etc.
 
@@ -6328,6 +8151,7 @@ class Nse:
         >>> nse.fno_live_active_contracts("NIFTY", expiry_date="27-Jan-2026")
         >>> nse.fno_live_active_contracts("RELIANCE")
         >>> nse.fno_live_active_contracts("RELIANCE", expiry_date="27-Jan-2026")
+        >>> nse.fno_live_active_contracts("NIFTY", as_frame=True)
         """
         self.rotate_user_agent()
 
@@ -6350,28 +8174,17 @@ class Nse:
             exp       = pd.to_datetime(expiry_date, format="%d-%b-%Y").strftime("%d-%b-%Y")
             contracts = [c for c in contracts if c.get("expiryDate") == exp]
 
-        return [{
-            "Instrument Type":   c.get("instrumentType", ""),
-            "Expiry Date":       c.get("expiryDate",     ""),
-            "Option Type":       c.get("optionType",     ""),
-            "Strike Price":      str(c.get("strikePrice", "")).strip(),
-            "Open":              c.get("openPrice",  0),
-            "High":              c.get("highPrice",  0),
-            "Low":               c.get("lowPrice",   0),
-            "closePrice":        c.get("closePrice", 0),
-            "Prev Close":        c.get("prevClose",  0),
-            "Last":              c.get("lastPrice",  0),
-            "Change":            c.get("change",     0),
-            "%Change":           c.get("pchange",    0),
-            "Volume (Contracts)":c.get("totalTradedVolume", 0),
-            "Value (₹ Lakhs)":   round(c.get("totalTurnover", 0) / 100_000, 2),
-            "totalBuyQuantity":  0,
-            "totalSellQuantity": 0,
-            "OI":                c.get("openInterest",        0),
-            "Chng in OI":        c.get("changeinOpenInterest", 0),
-            "% Chng in OI":      c.get("pchangeinOpenInterest",0),
-            "VWAP":              0,
-        } for c in contracts]
+        cols = _json_columns(contracts, self._ACTIVE_CONTRACT_SPEC)
+        n    = len(contracts)
+        cols["Strike Price"]    = [str(v).strip() for v in cols["Strike Price"]]
+        cols["Value (₹ Lakhs)"] = [round(v / 100_000, 2) for v in cols["Value (₹ Lakhs)"]]
+        for name in ("totalBuyQuantity", "totalSellQuantity", "VWAP"):
+            cols[name] = [0] * n
+        order = list(self._ACTIVE_CONTRACT_COLS)
+
+        if as_frame:
+            return pd.DataFrame(cols, columns=order)
+        return [dict(zip(order, row)) for row in zip(*(cols[c] for c in order))]
 
 
     # ════════════════════════════════════════════════════════════════════════
@@ -6500,18 +8313,73 @@ class Nse:
     #         return None
 
 
-    def fno_eod_bhav_copy(self, trade_date: str = "") -> pd.DataFrame | None:
+    def _fno_bhav_zip(self, trade_date: str) -> bytes:
+        """
+        Download the raw F&O bhavcopy ZIP for *trade_date* (``DD-MM-YYYY``).
+
+        Tries the direct archive URL first and falls back to the NSE
+        reports API with a cookie warm-up.  Every GET waits on
+        :meth:`_throttle`, so parallel backfills stay within ``max_rps``.
+        Raises on failure.
+        """
+        self.rotate_user_agent()
+        archive_url = (
+            "https://nsearchives.nseindia.com/content/fo/"
+            f"BhavCopy_NSE_FO_0_0_0_{_fmt_trade_date(trade_date, '%Y%m%d')}_F_0000.csv.zip"
+        )
+
+        # ---- 1. DIRECT ARCHIVE CALL (no warmup) ----
+        self._throttle()
+        resp = self.session.get(archive_url, headers=self.headers, timeout=15)
+        if resp.status_code == 200:
+            return resp.content
+
+        # ---- 2. FALLBACK WITH COOKIE ----
+        warm_url = "https://www.nseindia.com/market-data/live-equity-market"
+        self._throttle()
+        self.session.get(warm_url, headers=self.headers, timeout=5)
+
+        dt_label = datetime.strptime(trade_date, "%d-%m-%Y").strftime("%d-%b-%Y")
+        url2 = (
+            "https://www.nseindia.com/api/reports?archives="
+            "%5B%7B%22name%22%3A%22F%26O%20-%20Bhavcopy(csv)%22%2C"
+            "%22type%22%3A%22archives%22%2C"
+            "%22category%22%3A%22derivatives%22%2C"
+            "%22section%22%3A%22equity%22%7D%5D"
+            f"&date={dt_label}&type=equity&mode=single"
+        )
+        self._throttle()
+        resp2 = self.session.get(url2, headers=self.headers, timeout=15)
+        resp2.raise_for_status()
+        return resp2.content
+
+    def fno_eod_bhav_copy(
+        self,
+        trade_date: str = "",
+        typed:      bool = False,
+        columns:    list | None = None,
+    ) -> pd.DataFrame | None:
         """
         Download the F&O bhavcopy for a trade date.
 
         Tries the direct archive URL first; falls back to the NSE reports
-        API if it returns non-200. Rows with all-zero price/volume columns
-        are filtered out automatically.
+        API if it returns non-200. Rows with all-zero OI/volume/value
+        columns are filtered out automatically.  Repeat requests for the
+        same date are served from the local EOD archive store (see
+        ``NseConfig.archive_dir``).
 
         Parameters
         ----------
         trade_date : str
             Date in ``DD-MM-YYYY`` format.
+        typed : bool, optional
+            ``True`` parses the ZIP with the fixed bhavcopy schema —
+            categorical ``TckrSymb`` / ``FinInstrmTp`` / ``OptnTp``, float
+            prices and OI, ``datetime64`` trade and expiry dates.
+            Default ``False`` (generic ``read_csv`` frame, as before).
+        columns : list of str, optional
+            Return only these bhavcopy columns (implies ``typed=True``);
+            with a Parquet archive only they are decoded on a hit.
 
         Returns
         -------
@@ -6520,60 +8388,48 @@ class Nse:
         Examples
         --------
         >>> nse.fno_eod_bhav_copy("17-10-2025")
+        >>> nse.fno_eod_bhav_copy("17-10-2025", typed=True)
+        >>> nse.fno_eod_bhav_copy("17-10-2025", columns=["TckrSymb", "FinInstrmTp", "XpryDt",
+        ...                                             "StrkPric", "OptnTp", "OpnIntrst"])
         """
-        try:
-            self.rotate_user_agent()
-            archive_url = (
-                "https://nsearchives.nseindia.com/content/fo/"
-                f"BhavCopy_NSE_FO_0_0_0_{_fmt_trade_date(trade_date, '%Y%m%d')}_F_0000.csv.zip"
-            )
-
-            # ---- 1. DIRECT ARCHIVE CALL (no warmup) ----
-            resp = self.session.get(archive_url, headers=self.headers, timeout=15)
-
-            if resp.status_code == 200:
-                df = self._zip_csv(resp.content)
-
-            else:
-                # ---- 2. FALLBACK WITH COOKIE ----
-                warm_url = "https://www.nseindia.com/market-data/live-equity-market"
-                self.session.get(warm_url, headers=self.headers, timeout=5)
-
-                dt_label = datetime.strptime(
-                    trade_date, "%d-%m-%Y"
-                ).strftime("%d-%b-%Y")
-
-                url2 = (
-                    "https://www.nseindia.com/api/reports?archives="
-                    "%5B%7B%22name%22%3A%22F%26O%20-%20Bhavcopy(csv)%22%2C"
-                    "%22type%22%3A%22archives%22%2C"
-                    "%22category%22%3A%22derivatives%22%2C"
-                    "%22section%22%3A%22equity%22%7D%5D"
-                    f"&date={dt_label}&type=equity&mode=single"
-                )
+        if typed or columns is not None:
+            def _fetch_typed() -> pd.DataFrame | None:
+                try:
+                    df = _read_fo_bhav_zip(self._fno_bhav_zip(trade_date))
+                except Exception as exc:
+                    self._log_error("fno_eod_bhav_copy", exc)
+                    return None
+                flow = ["OpnIntrst", "ChngInOpnIntrst", "TtlTradgVol", "TtlTrfVal"]
+                if df.empty or not set(flow) <= set(df.columns):
+                    return df
+                df = df[df[flow].fillna(0).ne(0).any(axis=1)]
+                return df.sort_values("TtlTradgVol", ascending=False, kind="mergesort")
 
-                resp2 = self.session.get(url2, headers=self.headers, timeout=15)
+            return self._archived("fno_bhavcopy_typed", trade_date, _fetch_typed, columns=columns)
 
-                resp2.raise_for_status()
-                df = self._zip_csv(resp2.content)
+        def _fetch() -> pd.DataFrame | None:
+            try:
+                df = self._zip_csv(self._fno_bhav_zip(trade_date))
+
+                # ---- 3. FILTER ----
+                if not df.empty:
+                    try:
+                        df = df[~(
+                            (df.iloc[:, 22] == 0) &
+                            (df.iloc[:, 23] == 0) &
+                            (df.iloc[:, 24] == 0) &
+                            (df.iloc[:, 25] == 0)
+                        )]
+                        df = df.sort_values(by=df.columns[24], ascending=False)
+                    except IndexError:
+                        pass
+                return df
 
-            # ---- 3. FILTER ----
-            if not df.empty:
-                try:
-                    df = df[~(
-                        (df.iloc[:, 22] == 0) &
-                        (df.iloc[:, 23] == 0) &
-                        (df.iloc[:, 24] == 0) &
-                        (df.iloc[:, 25] == 0)
-                    )]
-                    df = df.sort_values(by=df.columns[24], ascending=False)
-                except IndexError:
-                    pass
-            return df
+            except Exception as exc:
+                self._log_error("fno_eod_bhav_copy", exc)
+                return None
 
-        except Exception as exc:
-            self._log_error("fno_eod_bhav_copy", exc)
-            return None
+        return self._archived("fno_bhavcopy", trade_date, _fetch)
 
     def fno_eod_fii_stats(self, trade_date: str) -> pd.DataFrame | None:
         """Return the FII stats Excel file for a trade date.
@@ -6772,6 +8628,7 @@ class Nse:
         """
         return self._fao_participant_csv(trade_date, "vol")
 
+    @_cached("hist")
     def fno_eom_lot_size(self, symbol: str | None = None) -> pd.DataFrame | None:
         """
         Return the current F&O lot-size table.
@@ -6828,6 +8685,7 @@ class Nse:
     # ════════════════════════════════════════════════════════════════════════
     # ── FnO — Historical ────────────────────────────────────────────────────
 
+    @_cached("hist")
     def future_price_volume_data(self, *args, **kwargs) -> pd.DataFrame:
         """
         Return historical futures price/volume data for a symbol.
@@ -6877,7 +8735,7 @@ class Nse:
             raise ValueError("Provide at least symbol and instrument as positional arguments.")
 
         symbol     = args[0].strip().upper()
-        instrument = args[1].strip().lower()
+        instrument = self._future_instrument(args[1])
         expiry = from_date = to_date = period = None
 
         for arg in args[2:]:
@@ -6897,25 +8755,13 @@ class Nse:
         to_date   = to_date   or kwargs.get("to_date")
         period    = period    or kwargs.get("period")
 
-        if instrument in ("futidx", "index futures", "index future", "index"):
-            instrument = "FUTIDX"
-        elif instrument in ("futstk", "stock futures", "stock future", "stock"):
-            instrument = "FUTSTK"
-        else:
-            raise ValueError("instrument must be 'Index Futures' or 'Stock Futures'")
-
         expiry_date = None
         if expiry:
             try:
                 ep  = expiry.split("-")
                 em  = ep[0].upper()
                 ey  = 2000 + int(ep[1])
-                meta_url = (
-                    f"https://www.nseindia.com/api/historicalOR/meta/foCPV/expireDts"
-                    f"?instrument={instrument}&symbol={symbol}&year={ey}"
-                )
-                meta_resp = self._warm_and_fetch(REF, meta_url, timeout=15)
-                meta      = meta_resp.json().get("expiresDts", [])
+                meta    = self._fo_expiry_dates(instrument, symbol, ey)
                 matched = [x for x in meta if em in x.upper()]
                 if not matched:
                     return pd.DataFrame()
@@ -6975,6 +8821,7 @@ class Nse:
             [c for c in ("FH_TIMESTAMP", "FH_EXPIRY_DT") if c in df.columns]
         ).reset_index(drop=True)
 
+    @_cached("hist")
     def option_price_volume_data(self, *args, **kwargs) -> pd.DataFrame:
         """
         Return historical options price/volume data for a symbol.
@@ -7044,13 +8891,7 @@ class Nse:
         option_type  = option_type  or kwargs.get("option_type")
         strike_price = strike_price or kwargs.get("strike_price")
 
-        if instrument in ("optidx", "index options", "index option", "index"):
-            instrument = "OPTIDX"
-        elif instrument in ("optstk", "stock options", "stock option", "stock"):
-            instrument = "OPTSTK"
-        else:
-            raise ValueError("instrument must be 'Index Options' or 'Stock Options'")
-
+        instrument  = self._option_instrument(instrument)
         expiry_date = None
         if expiry:
             try:
@@ -7062,25 +8903,9 @@ class Nse:
                 ):
                     expiry_date = datetime.strptime(expiry, "%d-%m-%Y").strftime("%d-%b-%Y")
                 elif any(m in expiry for m in _MONTH_NUM):
-                    # Bug 5 fix: self.get_expiries() does not exist; replaced with
-                    # the same meta-API pattern used by future_price_volume_data.
-                    mon, yr = expiry.split("-")
-                    ey      = 2000 + int(yr)
-                    meta_url = (
-                        f"https://www.nseindia.com/api/historicalOR/meta/foCPV/expireDts"
-                        f"?instrument={instrument}&symbol={symbol}&year={ey}"
-                    )
-                    meta_resp = self._warm_and_fetch(
-                        "https://www.nseindia.com/report-detail/fo_eq_security",
-                        meta_url, timeout=15
-                    )
-                    el      = meta_resp.json().get("expiresDts", [])
-                    matched = [x for x in el if mon in x.upper()]
-                    if not matched:
+                    expiry_date = self._fo_month_expiry(instrument, symbol, expiry)
+                    if expiry_date is None:
                         return pd.DataFrame()
-                    expiry_date = max(
-                        matched, key=lambda d: datetime.strptime(d, "%d-%b-%Y")
-                    )
             except Exception as exc:
                 self._log_error("option_price_volume_data expiry", exc)
                 return pd.DataFrame()
@@ -7108,6 +8933,459 @@ class Nse:
         if option_type:  params["optionType"]  = option_type
         if strike_price: params["strikePrice"] = strike_price
 
+        try:
+            return self._option_cpv(params)
+        except Exception as exc:
+            self._log_error("option_price_volume_data", exc)
+            return pd.DataFrame()
+
+    _FO_CONTRACT_COLS = ["Symbol", "Instrument", "Expiry", "Strike", "OptionType"]
+
+    def option_price_volume_data_many(
+        self,
+        contracts,
+        from_date:     str | None = None,
+        to_date:       str | None = None,
+        workers:       int        = 4,
+        group_strikes: bool       = True,
+    ) -> pd.DataFrame | None:
+        """
+        Return option price/volume history for many contracts as one long frame.
+
+        Month codes are resolved through :meth:`_fo_month_expiry`, whose
+        expiry lookup is shared via the response cache.  Contracts on the
+        same symbol / expiry / date range are normally served by a single
+        foCPV request without a strike filter.  The endpoint returns every
+        strike of that expiry, and the rows are split back per contract.
+        Lone contracts are requested with their strike and option-type
+        filters.  Requests run on *workers* threads that share the
+        process-wide token bucket.  If a grouped reply cannot be split by
+        contract, or comes back empty or failed, its contracts are
+        re-requested one by one.
+
+        Parameters
+        ----------
+        contracts : iterable
+            ``(symbol, instrument, strike, option_type, expiry)`` tuples or
+            dicts with those keys.  *instrument* is as in
+            :meth:`option_price_volume_data`.  *expiry* may be
+            ``DD-MM-YYYY``, ``DD-MMM-YYYY`` or a month code such as
+            ``"OCT-25"``.
+        from_date, to_date : str, optional
+            ``DD-MM-YYYY`` range for every contract.  The defaults match
+            :meth:`option_price_volume_data`: 180 days ago up to the
+            contract's expiry.
+        workers : int, optional
+            Concurrent foCPV requests. Default ``4``.
+        group_strikes : bool, optional
+            ``False`` sends one filtered request per contract. Default ``True``.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            ``Symbol``, ``Instrument``, ``Expiry`` (``DD-MMM-YYYY``),
+            ``Strike`` and ``OptionType`` key columns, followed by the
+            ``FH_*`` columns of :meth:`option_price_volume_data`.  Contracts
+            keep their input order, and each contract's rows are sorted by
+            trade date.  ``None`` when nothing could be fetched.
+
+        Examples
+        --------
+        >>> nse.option_price_volume_data_many([
+        ...     ("ITC", "Stock Options", 420, "CE", "28-10-2025"),
+        ...     ("ITC", "Stock Options", 400, "PE", "28-10-2025"),
+        ...     ("NIFTY", "Index Options", 25000, "PE", "OCT-25"),
+        ... ], from_date="01-10-2025")
+        """
+        dd, today = "%d-%m-%Y", datetime.now()
+
+        def _expiry(instrument: str, symbol: str, expiry) -> str:
+            expiry = str(expiry).strip().upper()
+            if any(m in expiry for m in _MONTH_NUM) and expiry.count("-") == 1:
+                expiry_date = self._fo_month_expiry(instrument, symbol, expiry)
+                if expiry_date is None:
+                    raise ValueError(f"no {expiry} expiry for {symbol}")
+                return expiry_date
+            return _as_day(expiry).astype(object).strftime("%d-%b-%Y")
+
+        # ── Normalise contracts → groups of (strike, option type) ──────────
+        groups: dict[tuple, list] = {}
+        wanted: list[tuple] = []
+        for spec in contracts:
+            if isinstance(spec, dict):
+                spec = tuple(spec.get(k) for k in ("symbol", "instrument", "strike", "option_type", "expiry"))
+            symbol, instrument, strike, option_type, expiry = spec
+            symbol = str(symbol).strip().upper()
+            try:
+                instrument  = self._option_instrument(instrument)
+                expiry_date = _expiry(instrument, symbol, expiry)
+            except Exception as exc:
+                self._log_error(f"option_price_volume_data_many {symbol} {expiry}", exc)
+                continue
+            exp_dt = datetime.strptime(expiry_date, "%d-%b-%Y")
+            start  = from_date or (today - timedelta(days=180)).strftime(dd)
+            end    = to_date or exp_dt.strftime(dd)
+            key    = (symbol, instrument, expiry_date, start, end)
+            leg    = (round(float(strike), 2), str(option_type).strip().upper())
+            if leg not in groups.setdefault(key, []):
+                groups[key].append(leg)
+                wanted.append(key + leg)
+        if not groups:
+            return None
+
+        # ── One request per group (or per contract), fanned out ────────────
+        def _tasks(keys, grouped: bool) -> list:
+            out = []
+            for key in keys:
+                legs = groups[key]
+                if grouped and len(legs) > 1:
+                    sides = {side for _, side in legs}
+                    out.append((key, None, sides.pop() if len(sides) == 1 else None, legs))
+                else:
+                    out.extend((key, strike, side, [(strike, side)]) for strike, side in legs)
+            return out
+
+        def _run(task):
+            (symbol, instrument, expiry_date, start, end), strike, side, _ = task
+            params = {
+                "from": start, "to": end, "instrumentType": instrument, "symbol": symbol,
+                "year": today.year, "csv": "true", "expiryDate": expiry_date,
+            }
+            if side:
+                params["optionType"] = side
+            if strike is not None:
+                params["strikePrice"] = f"{strike:g}"
+            try:
+                return self._option_cpv(params)
+            except Exception as exc:
+                self._log_error(f"option_price_volume_data_many {symbol} {expiry_date}", exc)
+                return None
+
+        frames: dict[tuple, pd.DataFrame] = {}
+        tasks = _tasks(groups, group_strikes)
+        while tasks:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tasks))),
+                                    thread_name_prefix="nsekit-fo-hist") as pool:
+                replies = list(pool.map(_run, tasks))
+            retry = []
+            for (key, strike, _, legs), df in zip(tasks, replies):
+                if strike is not None:
+                    if df is not None and not df.empty:
+                        frames[key + legs[0]] = df
+                    continue
+                # Grouped (unfiltered) request: fall back to per-contract
+                # requests if it failed, came back empty or cannot be split.
+                if df is None or df.empty or not {"FH_STRIKE_PRICE", "FH_OPTION_TYPE"} <= set(df.columns):
+                    retry.append(key)
+                    continue
+                strikes = pd.to_numeric(df["FH_STRIKE_PRICE"], errors="coerce").round(2)
+                sides   = df["FH_OPTION_TYPE"].astype(str).str.strip().str.upper()
+                for leg_strike, leg_side in legs:
+                    part = df[(strikes == leg_strike) & (sides == leg_side)]
+                    if not part.empty:
+                        frames[key + (leg_strike, leg_side)] = part
+            tasks = _tasks(retry, grouped=False)
+
+        missing = [c for c in wanted if c not in frames]
+        if missing:
+            logger.warning("option_price_volume_data_many: no data for %s",
+                           ", ".join(f"{c[0]} {c[2]} {c[5]:g}{c[6]}" for c in missing))
+        if not frames:
+            return None
+
+        parts = []
+        for contract in wanted:
+            if contract not in frames:
+                continue
+            part = frames[contract]
+            if "FH_TIMESTAMP" in part.columns:
+                order = pd.to_datetime(part["FH_TIMESTAMP"], format="%d-%b-%Y", errors="coerce")
+                part  = part.iloc[order.argsort(kind="mergesort")]
+            symbol, instrument, expiry_date, _, _, strike, side = contract
+            parts.append(part.assign(**dict(zip(self._FO_CONTRACT_COLS,
+                                                (symbol, instrument, expiry_date, strike, side)))))
+        df = pd.concat(parts, ignore_index=True)
+        return df[self._FO_CONTRACT_COLS + [c for c in df.columns if c not in self._FO_CONTRACT_COLS]]
+
+    # UDiFF ``FinInstrmTp`` code → foCPV ``instrumentType``.
+    _BHAV_INSTRUMENTS = {"IDF": "FUTIDX", "STF": "FUTSTK", "IDO": "OPTIDX", "STO": "OPTSTK"}
+
+    # Typed bhavcopy column → foCPV column of the *_price_volume_data frames.
+    _BHAV_TO_CPV = {
+        "TckrSymb":        "FH_SYMBOL",
+        "FinInstrmTp":     "FH_INSTRUMENT",
+        "TradDt":          "FH_TIMESTAMP",
+        "XpryDt":          "FH_EXPIRY_DT",
+        "StrkPric":        "FH_STRIKE_PRICE",
+        "OptnTp":          "FH_OPTION_TYPE",
+        "OpnPric":         "FH_OPENING_PRICE",
+        "HghPric":         "FH_TRADE_HIGH_PRICE",
+        "LwPric":          "FH_TRADE_LOW_PRICE",
+        "ClsPric":         "FH_CLOSING_PRICE",
+        "LastPric":        "FH_LAST_TRADED_PRICE",
+        "PrvsClsgPric":    "FH_PREV_CLS",
+        "SttlmPric":       "FH_SETTLE_PRICE",
+        "TtlTradgVol":     "FH_TOT_TRADED_QTY",
+        "TtlTrfVal":       "FH_TOT_TRADED_VAL",
+        "OpnIntrst":       "FH_OPEN_INT",
+        "ChngInOpnIntrst": "FH_CHANGE_IN_OI",
+        "NewBrdLotQty":    "FH_MARKET_LOT",
+        "UndrlygPric":     "FH_UNDERLYING_VALUE",
+    }
+
+    def fno_eod_contract_history(
+        self,
+        contracts,
+        from_date:     str | None = None,
+        to_date:       str | None = None,
+        fetch_missing: bool       = True,
+        workers:       int        = 4,
+    ) -> pd.DataFrame | None:
+        """
+        Rebuild per-contract F&O history from archived bhavcopies.
+
+        Instead of one foCPV request per contract, every trade date in the
+        range is read from the typed F&O bhavcopy held in the EOD archive
+        store (``NseConfig.archive_dir``).  The reads push the ticker /
+        expiry / strike predicates down to Parquet, so only matching row
+        groups are decoded.  Dates archived only by the default (untyped)
+        :meth:`fno_eod_bhav_copy` are read too, cast to the typed schema on
+        the way in.  With *fetch_missing*, dates not yet archived are
+        downloaded once through :meth:`fno_eod_bhav_copy` (and archived for
+        the next run); no other network call is made.  Month-code expiries
+        are resolved from the bhavcopy rows themselves.
+
+        Parameters
+        ----------
+        contracts : iterable
+            ``(symbol, instrument, strike, option_type, expiry)`` tuples or
+            dicts with those keys, as in :meth:`option_price_volume_data_many`.
+            *instrument* is an options name (``"Stock Options"``,
+            ``"index"`` …) or a futures name (``"Index Futures"``,
+            ``"FUTSTK"`` …); *strike* and *option_type* are ignored for
+            futures.  *expiry* is a date or a month code such as ``"OCT-25"``.
+        from_date, to_date : str, optional
+            ``DD-MM-YYYY`` range for every contract.  Defaults: 180 days ago
+            up to the contract's expiry, never past today.
+        fetch_missing : bool, optional
+            Download bhavcopies for trade dates missing from the archive.
+            ``False`` reads only what is already stored. Default ``True``.
+        workers : int, optional
+            Threads reading / downloading trade dates. Default ``4``.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            Same layout as :meth:`option_price_volume_data_many`: ``Symbol``,
+            ``Instrument``, ``Expiry``, ``Strike`` and ``OptionType`` key
+            columns, then the ``FH_*`` columns (prices, quantities, values
+            and OI as reported in the bhavcopy).  Untraded option days are
+            dropped, as foCPV does.  Contracts keep their input order, and
+            each contract's rows are sorted by trade date.  ``None`` when no
+            contract has data.
+
+        Examples
+        --------
+        >>> nse.fno_eod_contract_history([
+        ...     ("ITC", "Stock Options", 420, "CE", "28-10-2025"),
+        ...     ("NIFTY", "Index Futures", None, None, "OCT-25"),
+        ... ], from_date="01-10-2025")
+        """
+        today = np.datetime64(datetime.now().date(), "D")
+
+        # ── Normalise contracts ─────────────────────────────────────────────
+        rows = []
+        for spec in contracts:
+            if isinstance(spec, dict):
+                spec = tuple(spec.get(k) for k in ("symbol", "instrument", "strike", "option_type", "expiry"))
+            symbol, instrument, strike, option_type, expiry = spec
+            symbol = str(symbol).strip().upper()
+            try:
+                try:
+                    code = self._option_instrument(instrument)
+                except ValueError:
+                    code = self._future_instrument(instrument)
+                expiry = str(expiry).strip().upper()
+                if any(m in expiry for m in _MONTH_NUM) and expiry.count("-") == 1:
+                    mon, yr = expiry.split("-")
+                    month   = np.datetime64(f"{2000 + int(yr)}-{_MONTH_NUM[mon]:02d}", "M")
+                    last    = (month + 1).astype("datetime64[D]") - 1
+                    exp_day = None
+                else:
+                    exp_day = last = _as_day(expiry)
+                leg = ((round(float(strike), 2), str(option_type).strip().upper())
+                       if code.startswith("OPT") else (-1.0, ""))
+            except Exception as exc:
+                self._log_error(f"fno_eod_contract_history {symbol} {expiry}", exc)
+                continue
+            start = _as_day(from_date) if from_date else today - 180
+            end   = min(_as_day(to_date) if to_date else last, today)
+            rows.append((symbol, code, exp_day, expiry, *leg, start, end))
+        if not rows:
+            return None
+        want = pd.DataFrame(rows, columns=["_sym", "_ins", "_exp", "_code", "_strike", "_side", "_start", "_end"])
+        want = want.drop_duplicates(["_sym", "_ins", "_code", "_strike", "_side"], ignore_index=True)
+        want["_order"] = range(len(want))
+
+        # ── Trade dates: archived ones, plus the calendar's when fetching ──
+        lo, hi  = want["_start"].min(), want["_end"].max()
+        store   = self.archive
+        report  = "fno_bhavcopy_typed"
+        stored  = {d for d in (store.keys(report) if store else [])
+                   if lo <= np.datetime64(d, "D") <= hi}
+        # Days archived only by the default (untyped) fno_eod_bhav_copy.
+        untyped = {d for d in (store.keys("fno_bhavcopy") if store else [])
+                   if lo <= np.datetime64(d, "D") <= hi} - stored
+        stored |= untyped
+        if fetch_missing:
+            lo_s, hi_s = lo.strftime("%d-%m-%Y"), hi.strftime("%d-%m-%Y")
+            calendar = self.trading_calendar()
+            days = (calendar.trading_days_between(lo_s, hi_s, fmt="%Y-%m-%d")
+                    if calendar is not None
+                    else [datetime.strptime(d, "%d-%m-%Y").strftime("%Y-%m-%d")
+                          for d in _weekday_dates(lo_s, hi_s)])
+            days = sorted(stored | set(days))
+        else:
+            days = sorted(stored)
+        if not days:
+            return None
+
+        # Predicates pushed down to the Parquet reader (exact match follows).
+        columns = list(self._BHAV_TO_CPV)
+        filters = [
+            ("TckrSymb", "in", sorted(want["_sym"].unique())),
+            ("FinInstrmTp", "in", [k for k, v in self._BHAV_INSTRUMENTS.items() if v in set(want["_ins"])]),
+        ]
+        if want["_exp"].notna().all():
+            filters.append(("XpryDt", "in", [pd.Timestamp(d) for d in want["_exp"].unique()]))
+        if want["_ins"].str.startswith("OPT").all():
+            filters.append(("StrkPric", "in", sorted(want["_strike"].unique())))
+
+        def _read(day: str) -> pd.DataFrame | None:
+            if day in untyped:
+                df = store.get("fno_bhavcopy", day, columns=columns)
+                if df is not None:
+                    df = _apply_filters(_type_fo_bhav(df, columns), filters)
+            else:
+                df = store.get(report, day, columns=columns, filters=filters) if day in stored else None
+            if df is None and fetch_missing:
+                df = self.fno_eod_bhav_copy(datetime.strptime(day, "%Y-%m-%d").strftime("%d-%m-%Y"),
+                                            columns=columns)
+                if df is not None:
+                    df = _apply_filters(df, filters)
+            return df if df is not None and not df.empty else None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(days))),
+                                thread_name_prefix="nsekit-bhav-hist") as pool:
+            frames = [df for df in pool.map(_read, days) if df is not None]
+        if not frames:
+            return None
+        bhav = pd.concat(frames, ignore_index=True)
+        bhav = bhav.astype({c: str for c in ("TckrSymb", "FinInstrmTp", "OptnTp") if c in bhav})
+
+        # ── Match rows to contracts ─────────────────────────────────────────
+        bhav["_sym"]    = bhav["TckrSymb"].str.strip().str.upper()
+        bhav["_ins"]    = bhav["FinInstrmTp"].map(self._BHAV_INSTRUMENTS)
+        bhav["_exp"]    = bhav["XpryDt"].dt.normalize().astype("datetime64[ns]")
+        is_opt          = bhav["_ins"].str.startswith("OPT", na=False)
+        bhav["_strike"] = bhav["StrkPric"].round(2).where(is_opt, -1.0)
+        bhav["_side"]   = bhav["OptnTp"].str.strip().str.upper().where(is_opt, "")
+
+        month_codes = want["_exp"].isna()
+        if month_codes.any():
+            bhav_month = _strftime_unique(bhav["_exp"], "%b-%y").str.upper()
+            last_exp   = bhav.assign(_code=bhav_month).groupby(["_sym", "_ins", "_code"])["_exp"].max()
+            want.loc[month_codes, "_exp"] = [
+                last_exp.get((s, i, c)) for s, i, c in want.loc[month_codes, ["_sym", "_ins", "_code"]].values
+            ]
+        want["_exp"] = pd.to_datetime(want["_exp"]).astype("datetime64[ns]")
+
+        df = bhav.merge(want, on=["_sym", "_ins", "_exp", "_strike", "_side"])
+        day = df["TradDt"].values.astype("datetime64[D]")
+        df  = df[(day >= df["_start"].values.astype("datetime64[D]"))
+                 & (day <= df["_end"].values.astype("datetime64[D]"))]
+        df  = df[~df["_ins"].str.startswith("OPT") | (df["TtlTradgVol"] > 0)]
+
+        found   = set(df["_order"])
+        missing = want[~want["_order"].isin(found)]
+        if not missing.empty:
+            logger.warning("fno_eod_contract_history: no data for %s", ", ".join(
+                f"{s} {c}" + (f" {k:g}{t}" if t else "")
+                for s, c, k, t in missing[["_sym", "_code", "_strike", "_side"]].values))
+        if df.empty:
+            return None
+
+        # ── foCPV-shaped output ─────────────────────────────────────────────
+        df = df.sort_values(["_order", "TradDt"], kind="mergesort")
+        is_opt = df["_ins"].str.startswith("OPT")
+        keys = pd.DataFrame({
+            "Symbol":     df["_sym"],
+            "Instrument": df["_ins"],
+            "Expiry":     _strftime_unique(df["_exp"], "%d-%b-%Y"),
+            "Strike":     df["_strike"].where(is_opt),
+            "OptionType": df["_side"].where(is_opt, None),
+        })
+        out = df[[c for c in self._BHAV_TO_CPV if c in df.columns]].rename(columns=self._BHAV_TO_CPV)
+        out["FH_INSTRUMENT"] = df["_ins"]
+        for col in ("FH_TIMESTAMP", "FH_EXPIRY_DT"):
+            out[col] = _strftime_unique(out[col], "%d-%b-%Y")
+        return pd.concat([keys, out], axis=1).reset_index(drop=True)
+
+    # ── FnO — Historical helpers ────────────────────────────────────────────
+
+    @staticmethod
+    def _option_instrument(instrument: str) -> str:
+        """Map ``"Index Options"`` / ``"stock"`` / ``"OPTIDX"`` … to the foCPV code."""
+        instrument = instrument.strip().lower()
+        if instrument in ("optidx", "index options", "index option", "index"):
+            return "OPTIDX"
+        if instrument in ("optstk", "stock options", "stock option", "stock"):
+            return "OPTSTK"
+        raise ValueError("instrument must be 'Index Options' or 'Stock Options'")
+
+    @staticmethod
+    def _future_instrument(instrument: str) -> str:
+        """Map ``"Index Futures"`` / ``"stock"`` / ``"FUTIDX"`` … to the foCPV code."""
+        instrument = instrument.strip().lower()
+        if instrument in ("futidx", "index futures", "index future", "index"):
+            return "FUTIDX"
+        if instrument in ("futstk", "stock futures", "stock future", "stock"):
+            return "FUTSTK"
+        raise ValueError("instrument must be 'Index Futures' or 'Stock Futures'")
+
+    @_cached("hist")
+    def _fo_expiry_dates(self, instrument: str, symbol: str, year: int) -> tuple:
+        """
+        Expiry dates (``DD-MMM-YYYY``) of *symbol* / *instrument* in *year*
+        from the foCPV meta API.  Memoised through the response cache, so a
+        batch of contracts costs one lookup per (instrument, symbol, year).
+        """
+        meta_url = (
+            f"https://www.nseindia.com/api/historicalOR/meta/foCPV/expireDts"
+            f"?instrument={instrument}&symbol={symbol}&year={year}"
+        )
+        resp = self._warm_and_fetch(
+            "https://www.nseindia.com/report-detail/fo_eq_security", meta_url, timeout=15
+        )
+        return tuple(resp.json().get("expiresDts", []))
+
+    def _fo_month_expiry(self, instrument: str, symbol: str, month_code: str) -> str | None:
+        """Resolve a ``"MON-YY"`` code to the month's last expiry date, or ``None``."""
+        mon, yr = month_code.upper().split("-")
+        matched = [x for x in self._fo_expiry_dates(instrument, symbol, 2000 + int(yr))
+                   if mon in x.upper()]
+        if not matched:
+            return None
+        return max(matched, key=lambda d: datetime.strptime(d, "%d-%b-%Y"))
+
+    def _option_cpv(self, params: dict) -> pd.DataFrame:
+        """
+        One foCPV options request → cleaned, date-sorted ``DataFrame``.
+
+        Prices, quantities and OI are numeric, untraded rows are dropped and
+        date columns are formatted as in :meth:`option_price_volume_data`.
+        Raises when every retry fails.
+        """
         def _call():
             return self._warm_and_fetch(
                 "https://www.nseindia.com/option-chain",
@@ -7117,11 +9395,7 @@ class Nse:
                 api_timeout=20,
             ).json().get("data", [])
 
-        try:
-            data = self._retry(_call)
-        except Exception as exc:
-            self._log_error("option_price_volume_data", exc)
-            return pd.DataFrame()
+        data = self._retry(_call)
 
         df = pd.DataFrame(data)
         if df.empty:
@@ -7166,6 +9440,7 @@ class Nse:
     # ════════════════════════════════════════════════════════════════════════
     # ── FnO — Periodic Reports ──────────────────────────────────────────────
 
+    @_cached("live")
     def fno_dmy_biz_growth(
         self,
         *args,
@@ -7201,6 +9476,7 @@ class Nse:
         mode, month, year = _parse_biz_growth_args(args, month, year, mode)
         return self._biz_growth_fetch("fo", mode, month, year)
 
+    @_cached("hist")
     def fno_monthly_settlement_report(
         self,
         *args,
@@ -7481,9 +9757,568 @@ class Nse:
             return None
 
 
+    # ══════════════════════════════════════════════════════════════════════════════
+    # VIII. Bulk Downloads
+    # ══════════════════════════════════════════════════════════════════════════════
+
+    # Per-date EOD reports accepted by :meth:`backfill` — every one takes a
+    # single ``DD-MM-YYYY`` trade date and returns a DataFrame.
+    _BACKFILL_REPORTS: tuple = (
+        "cm_eod_bhavcopy_with_delivery", "cm_eod_equity_bhavcopy",
+        "cm_eod_shortselling", "cm_eod_surveillance_indicator",
+        "cm_eod_eq_band_changes", "cm_eod_eq_price_band",
+        "cm_eod_pe_ratio", "cm_eod_mcap",
+        "index_eod_bhav_copy", "nse_eod_top10_nifty50",
+        "fno_eod_bhav_copy", "fno_eod_fii_stats", "fno_eod_sec_ban",
+        "fno_eod_mwpl_3", "fno_eod_combine_oi",
+        "fno_eod_participant_wise_oi", "fno_eod_participant_wise_vol",
+    )
+
+    def _backfill_one(self, fn, trade_date: str, retries: int) -> tuple:
+        """
+        Run *fn(trade_date)* with up to ``1 + retries`` attempts and return
+        ``(trade_date, df, status)`` where *status* is a per-date report row.
+        """
+        t0, attempts, error, df = time.monotonic(), 0, None, None
+        for attempt in range(retries + 1):
+            attempts += 1
+            try:
+                df    = fn(trade_date)
+                error = None
+            except Exception as exc:
+                df, error = None, f"{type(exc).__name__}: {exc}"
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                break
+            if attempt < retries:
+                time.sleep(self.retry_delay * (2 ** attempt))
+
+        ok = isinstance(df, pd.DataFrame) and not df.empty
+        status = {
+            "TradeDate": trade_date,
+            "Status":    "ok" if ok else ("failed" if error or df is None else "empty"),
+            "Attempts":  attempts,
+            "Rows":      len(df) if ok else 0,
+            "Error":     error,
+            "Seconds":   round(time.monotonic() - t0, 3),
+        }
+        return trade_date, (df if ok else None), status
+
+    def iter_backfill(
+        self,
+        report:    str,
+        from_date: str,
+        to_date:   str,
+        workers:   int       = 4,
+        retries:   int       = 1,
+        skip:      list | None = None,
+    ):
+        """
+        Download a per-date EOD report for every trading day in a range,
+        yielding each day's result as soon as it completes.
+
+        Dates are enumerated offline from :meth:`trading_calendar`, so
+        weekends and exchange holidays are skipped.
+        Requests are fanned out across a thread pool of *workers* threads;
+        every HTTP call still goes through :meth:`_throttle`, so the pool
+        shares the process-wide ``NseConfig`` token bucket.
+
+        Parameters
+        ----------
+        report : str
+            Name of a per-date ``Nse`` method, e.g. ``"fno_eod_bhav_copy"``,
+            ``"cm_eod_equity_bhavcopy"`` or ``"fno_eod_participant_wise_oi"``.
+        from_date, to_date : str
+            Inclusive range in ``DD-MM-YYYY`` format.
+        workers : int, optional
+            Thread-pool size. Default is ``4``.
+        retries : int, optional
+            Extra attempts per date when the report comes back empty or
+            ``None``. Default is ``1``.
+        skip : list, optional
+            ``DD-MM-YYYY`` dates to leave out — e.g. the ``"ok"`` dates of an
+            earlier, partially completed run.
+
+        Yields
+        ------
+        tuple
+            ``(trade_date, df, status)`` in completion order.  *df* is
+            ``None`` for failed or empty days; *status* is a dict with
+            ``TradeDate``, ``Status`` (``"ok"`` / ``"empty"`` / ``"failed"``),
+            ``Attempts``, ``Rows``, ``Error`` and ``Seconds``.
+
+        Examples
+        --------
+        >>> for d, df, st in nse.iter_backfill("fno_eod_bhav_copy", "01-01-2025", "31-03-2025"):
+        ...     print(st)
+        """
+        dates = self._backfill_dates(report, from_date, to_date, workers, skip)
+        yield from self._run_backfill(report, dates, workers, retries)
+
+    def _backfill_dates(
+        self,
+        report:    str,
+        from_date: str,
+        to_date:   str,
+        workers:   int,
+        skip:      list | None,
+    ) -> list[str]:
+        """Validate backfill arguments and return the trading dates to fetch."""
+        if report not in self._BACKFILL_REPORTS:
+            raise ValueError(
+                f"Unsupported report {report!r}; choose from {', '.join(self._BACKFILL_REPORTS)}"
+            )
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        calendar = self.trading_calendar()
+        dates = (calendar.trading_days_between(from_date, to_date, fmt="%d-%m-%Y")
+                 if calendar is not None else _weekday_dates(from_date, to_date))
+        done  = set(skip or [])
+        return [d for d in dates if d not in done]
+
+    def _run_backfill(self, report: str, dates: list, workers: int, retries: int):
+        """Fan *dates* out over a thread pool, yielding results as they finish."""
+        if not dates:
+            return
+        fn   = getattr(self, report)
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nsekit-backfill")
+        try:
+            futures = [pool.submit(self._backfill_one, fn, d, retries) for d in dates]
+            for fut in as_completed(futures):
+                yield fut.result()
+        finally:
+            # Also reached when the caller stops iterating early.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def backfill(
+        self,
+        report:    str,
+        from_date: str,
+        to_date:   str,
+        workers:   int       = 4,
+        retries:   int       = 1,
+        concat:    bool      = True,
+        progress             = None,
+        skip:      list | None = None,
+    ) -> pd.DataFrame | dict | None:
+        """
+        Download a per-date EOD report over a date range in parallel.
+
+        Thin collector around :meth:`iter_backfill`.  The per-date status
+        table of the run is kept on ``self.last_backfill`` (one row per
+        trade date, sorted by date) so a partial backfill can be resumed
+        with ``skip=`` the ``"ok"`` dates.  Bhavcopies already held in the
+        EOD archive store are served locally, so re-running is cheap too.
+
+        Parameters
+        ----------
+        report, from_date, to_date, workers, retries, skip
+            See :meth:`iter_backfill`.
+        concat : bool, optional
+            ``True`` (default) — return one ``DataFrame`` with a leading
+            ``TradeDate`` column.  ``False`` — return ``{trade_date: df}``.
+        progress : callable, optional
+            Called as ``progress(status, done, total)`` after every date.
+
+        Returns
+        -------
+        pd.DataFrame or dict or None
+            ``None`` when no date produced data (concat mode).
+
+        Examples
+        --------
+        >>> df = nse.backfill("fno_eod_participant_wise_oi", "01-01-2025", "31-03-2025", workers=3)
+        >>> nse.last_backfill.query("Status != 'ok'")
+        """
+        dates = self._backfill_dates(report, from_date, to_date, workers, skip)
+        results: dict = {}
+        statuses: list = []
+        for trade_date, df, status in self._run_backfill(report, dates, workers, retries):
+            statuses.append(status)
+            if df is not None:
+                results[trade_date] = df
+            if status["Status"] != "ok":
+                logger.info("NseKit.backfill %s %s: %s (%s)", report, trade_date,
+                            status["Status"], status["Error"])
+            if progress is not None:
+                progress(status, len(statuses), len(dates))
+
+        self.last_backfill = (
+            _sort_dedup_dates(pd.DataFrame(statuses), "TradeDate", fmt="%d-%m-%Y", ascending=True)
+            if statuses else pd.DataFrame()
+        )
+        if not concat:
+            return dict(sorted(results.items(), key=lambda kv: datetime.strptime(kv[0], "%d-%m-%Y")))
+        if not results:
+            return None
+        ordered = sorted(results, key=lambda d: datetime.strptime(d, "%d-%m-%Y"))
+        return (
+            pd.concat([results[d] for d in ordered], keys=ordered, names=["TradeDate"])
+            .reset_index(level="TradeDate")
+            .reset_index(drop=True)
+        )
+
+
 # ── Post-class fixups ──────────────────────────────────────────────────────────
 # _SEBI_HEADERS["Referer"] must equal _SEBI_REFERER, but class-body scoping
 # prevents referencing one class attribute from another at definition time.
 # Assign it here to keep the URL in a single place.
 Nse._SEBI_HEADERS["Referer"] = Nse._SEBI_REFERER
 
+
+# ══════════════════════════════════════════════════════════════════════════════
+# IX. Option-Chain Polling
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Index underlyings are polled ahead of single stocks when the budget is tight.
+_INDEX_UNDERLYINGS = frozenset({"NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY", "NIFTYNXT50"})
+
+
+class OptionChainPoller:
+    """
+    Poll live option chains for a watchlist on a fixed refresh interval.
+
+    Polls are spread evenly over *interval* and never issued faster than
+    ``budget × nse.max_rps`` per second, so the poller leaves room in the
+    shared token bucket for other calls.  When the budget cannot keep every
+    pair fresh, overdue pairs are served index-first, then nearest-expiry
+    first.  Each snapshot whose NSE timestamp changed is passed to every
+    callback and / or put on an ``asyncio.Queue``.  While
+    :meth:`Nse.market_is_open` reports the market closed, polls are skipped.
+
+    Parameters
+    ----------
+    nse : Nse
+        Client used for the downloads.
+    watchlist : list of (str, str or None)
+        ``(symbol, expiry)`` pairs; ``expiry`` is ``DD-MMM-YYYY`` or ``None``
+        for the nearest expiry.
+    interval : float, optional
+        Target seconds between two snapshots of the same pair. Default ``30``.
+    callbacks : list of callable, optional
+        Each is called as ``cb(snapshot)`` from the poller thread.
+    queue : asyncio.Queue, optional
+        Snapshots are also put here (thread-safe, via *loop*).
+    loop : asyncio.AbstractEventLoop, optional
+        Loop owning *queue*. Defaults to the loop running when
+        :meth:`start` is called.
+    budget : float, optional
+        Fraction of ``nse.max_rps`` the poller may use. Default ``0.5``.
+    market : str, optional
+        Segment checked with :meth:`Nse.market_is_open`. Default
+        ``"Capital Market"``; ``None`` polls regardless of market hours.
+    market_check : float, optional
+        Seconds between market-status checks. Default ``60``.
+    mode : str, optional
+        ``"raw"`` (default) publishes ``fno_live_option_chain_raw`` payloads,
+        ``"frame"`` publishes ``fno_live_option_chain`` DataFrames.
+
+    A snapshot is a dict with keys ``symbol``, ``expiry``, ``data``,
+    ``fetched_at`` (epoch seconds) and ``staleness`` (seconds since the
+    previous snapshot of that pair).
+
+    Examples
+    --------
+    >>> poller = OptionChainPoller(nse, [("NIFTY", None), ("RELIANCE", "27-Jan-2026")],
+    ...                            interval=20, callbacks=[print])
+    >>> poller.start(); time.sleep(120); poller.stop()
+    >>> poller.stats()
+    """
+
+    def __init__(
+        self,
+        nse:          "Nse",
+        watchlist:    list[tuple[str, str | None]],
+        interval:     float = 30.0,
+        callbacks:    list | None = None,
+        queue=None,
+        loop=None,
+        budget:       float = 0.5,
+        market:       str | None = "Capital Market",
+        market_check: float = 60.0,
+        mode:         str = "raw",
+    ):
+        if not watchlist:
+            raise ValueError("watchlist must not be empty")
+        if mode not in ("raw", "frame"):
+            raise ValueError("mode must be 'raw' or 'frame'")
+        self.nse          = nse
+        self.interval     = float(interval)
+        self.callbacks    = list(callbacks or [])
+        self.queue        = queue
+        self.loop         = loop
+        self.budget       = budget
+        self.market       = market
+        self.market_check = market_check
+        self.mode         = mode
+
+        now   = time.monotonic()
+        pairs = list(dict.fromkeys((sym.upper(), exp) for sym, exp in watchlist))
+        self._slots = [
+            {
+                "symbol": sym, "expiry": exp, "priority": self._priority(sym, exp),
+                "due": now + i * self.interval / len(pairs),
+                "polls": 0, "published": 0, "errors": 0, "skipped": 0,
+                "last_ts": None, "last_at": None, "gaps": [],
+            }
+            for i, (sym, exp) in enumerate(pairs)
+        ]
+        self._lock        = threading.Lock()
+        self._stop        = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_poll   = 0.0
+        self._market_open: bool | None = None
+        self._market_at   = float("-inf")
+
+    # ── scheduling ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _priority(symbol: str, expiry: str | None) -> tuple[int, int]:
+        """Sort key: index underlyings first, then days to expiry (None = nearest)."""
+        days = 0
+        if expiry:
+            try:
+                days = max((datetime.strptime(expiry, "%d-%b-%Y") - datetime.now()).days, 0)
+            except ValueError:
+                days = 0
+        return (0 if symbol in _INDEX_UNDERLYINGS else 1, days)
+
+    @property
+    def min_gap(self) -> float:
+        """Minimum seconds between two polls given the rate budget."""
+        rps = getattr(self.nse, "max_rps", NseConfig.max_rps) * max(self.budget, 1e-3)
+        return 1.0 / rps
+
+    def _next_slot(self, now: float) -> dict | None:
+        """Highest-priority overdue slot, or ``None`` if nothing is due."""
+        due = [sl for sl in self._slots if sl["due"] <= now]
+        return min(due, key=lambda sl: (sl["priority"], sl["due"])) if due else None
+
+    def _market_allows(self, now: float) -> bool:
+        if self.market is None:
+            return True
+        if now - self._market_at >= self.market_check:
+            self._market_open = self.nse.market_is_open(self.market)
+            self._market_at   = now
+        return self._market_open is not False       # unknown → keep polling
+
+    # ── polling ─────────────────────────────────────────────────────────────
+
+    def _fetch(self, symbol: str, expiry: str | None):
+        with self.nse.no_cache():
+            if self.mode == "frame":
+                df = self.nse.fno_live_option_chain(symbol, expiry_date=expiry)
+                return (df, df["Fetch_Time"].iloc[0]) if not df.empty else (None, None)
+            raw = self.nse.fno_live_option_chain_raw(symbol, expiry_date=expiry)
+            return (raw, raw.get("timestamp")) if isinstance(raw, dict) and raw.get("data") else (None, None)
+
+    def poll_once(self, now: float | None = None) -> dict | None:
+        """
+        Run one scheduling step: poll the most urgent due pair (if any and if
+        the market is open) and publish its snapshot.  Returns the snapshot,
+        or ``None`` when nothing was published.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            slot = self._next_slot(now)
+            if slot is None:
+                return None
+            slot["due"] += self.interval
+            if slot["due"] <= now:                   # fell behind — restart cadence
+                slot["due"] = now + self.interval
+            if not self._market_allows(now):
+                slot["skipped"] += 1
+                return None
+            self._last_poll = now
+
+        slot["polls"] += 1
+        try:
+            data, stamp = self._fetch(slot["symbol"], slot["expiry"])
+        except Exception as exc:
+            logger.warning("OptionChainPoller %s: %s", slot["symbol"], exc)
+            data, stamp = None, None
+        if data is None:
+            slot["errors"] += 1
+            return None
+        if stamp is not None and stamp == slot["last_ts"]:
+            return None
+
+        fetched   = time.time()
+        staleness = fetched - slot["last_at"] if slot["last_at"] is not None else None
+        if staleness is not None:
+            slot["gaps"].append(staleness)
+            del slot["gaps"][:-50]
+        slot.update(last_ts=stamp, last_at=fetched)
+        slot["published"] += 1
+
+        snap = {"symbol": slot["symbol"], "expiry": slot["expiry"], "data": data,
+                "fetched_at": fetched, "staleness": staleness}
+        self._publish(snap)
+        return snap
+
+    def _publish(self, snap: dict) -> None:
+        for cb in self.callbacks:
+            try:
+                cb(snap)
+            except Exception as exc:
+                logger.warning("OptionChainPoller callback failed: %s", exc)
+        if self.queue is not None and self.loop is not None:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, snap)
+
+    def _sleep_for(self, now: float) -> float:
+        """Seconds until the next poll may run (next due time and rate gap)."""
+        next_due = min(sl["due"] for sl in self._slots)
+        return max(next_due - now, self._last_poll + self.min_gap - now, 0.0)
+
+    def run(self, duration: float | None = None) -> None:
+        """Poll in the calling thread until :meth:`stop` or *duration* seconds."""
+        end = time.monotonic() + duration if duration is not None else None
+        while not self._stop.is_set():
+            now = time.monotonic()
+            if end is not None and now >= end:
+                break
+            wait = self._sleep_for(now)
+            if wait > 0:
+                self._stop.wait(wait if end is None else min(wait, max(end - now, 0.0)))
+                continue
+            self.poll_once(now)
+
+    def start(self) -> "OptionChainPoller":
+        """Start polling in a daemon thread."""
+        if self.queue is not None and self.loop is None:
+            import asyncio
+            try:
+                self.loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise ValueError("pass loop= when using queue outside a running event loop") from None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="OptionChainPoller", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        """Stop the polling thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "OptionChainPoller":
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    def stats(self) -> pd.DataFrame:
+        """
+        Per-pair poll counters and achieved staleness.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns: Symbol, Expiry, Polls, Published, Errors, Skipped,
+            Staleness (seconds since the last snapshot), Avg_Refresh and
+            Max_Refresh (seconds between successive snapshots).
+        """
+        now = time.time()
+        rows = [
+            {
+                "Symbol":      sl["symbol"],
+                "Expiry":      sl["expiry"],
+                "Polls":       sl["polls"],
+                "Published":   sl["published"],
+                "Errors":      sl["errors"],
+                "Skipped":     sl["skipped"],
+                "Staleness":   round(now - sl["last_at"], 2) if sl["last_at"] else None,
+                "Avg_Refresh": round(float(np.mean(sl["gaps"])), 2) if sl["gaps"] else None,
+                "Max_Refresh": round(max(sl["gaps"]), 2) if sl["gaps"] else None,
+            }
+            for sl in sorted(self._slots, key=lambda sl: sl["priority"])
+        ]
+        return pd.DataFrame(rows)
+
+
+
+# ── Incremental Option Chain ──────────────────────────────────────────────────
+
+_CHAIN_DELTA_FIELDS = ("OI", "Volume", "LTP", "IV")
+
+
+def _chain_strike_frame(records: list) -> pd.DataFrame:
+    """``payload["data"]`` → float frame indexed by strike with CALLS_/PUTS_ columns."""
+    df = _option_chain_frame(records, oi_mode="compact")
+    df = df.set_index("Strike_Price")[
+        [f"{side}_{name}" for side in ("CALLS", "PUTS") for name in _OC_LEG_FIELDS.values()]
+    ].fillna(0.0)
+    df.index = df.index.fillna(0.0)
+    return df[~df.index.duplicated(keep="last")].sort_index()
+
+
+class IncrementalOptionChain:
+    """
+    Option chain kept between polls and updated as a diff.
+
+    :meth:`apply` takes a raw ``fno_live_option_chain_raw`` payload, compares
+    it strike-by-strike with the previous snapshot and returns only the
+    strikes that moved, with OI / volume / LTP / IV deltas.  Call and put
+    OI totals are maintained from those deltas, so :attr:`pcr` costs
+    nothing per poll.
+
+    Examples
+    --------
+    >>> chain = IncrementalOptionChain("NIFTY")
+    >>> chain.apply(nse.fno_live_option_chain_raw("NIFTY", expiry_date="27-Jan-2026"))
+    >>> moved = chain.apply(nse.fno_live_option_chain_raw("NIFTY", expiry_date="27-Jan-2026"))
+    >>> moved[["CALLS_OI_Delta", "PUTS_OI_Delta"]], chain.pcr
+    """
+
+    def __init__(self, symbol: str = ""):
+        self.symbol      = symbol.upper()
+        self.frame: pd.DataFrame | None = None
+        self.timestamp: str | None      = None
+        self.underlying: float | None   = None
+        self.call_oi     = 0.0
+        self.put_oi      = 0.0
+
+    @property
+    def pcr(self) -> float | None:
+        """Put/call open-interest ratio of the current snapshot."""
+        return round(self.put_oi / self.call_oi, 4) if self.call_oi else None
+
+    def apply(self, payload: dict) -> pd.DataFrame:
+        """
+        Merge a new payload and return the strikes that changed.
+
+        Parameters
+        ----------
+        payload : dict
+            Raw option-chain JSON (``data``, ``timestamp``, ``underlyingValue``).
+
+        Returns
+        -------
+        pd.DataFrame
+            Indexed by ``Strike_Price``: every tracked CALLS_/PUTS_ column at
+            its new value plus ``<col>_Delta`` for OI, Volume, LTP and IV.
+            Strikes that disappeared are reported at zero with negated
+            deltas; on the first call every strike is returned.
+        """
+        new = _chain_strike_frame((payload or {}).get("data") or [])
+        self.timestamp  = (payload or {}).get("timestamp", self.timestamp)
+        self.underlying = (payload or {}).get("underlyingValue", self.underlying)
+
+        first = self.frame is None
+        old   = new.iloc[0:0] if first else self.frame
+        union = old.index.union(new.index)
+        old_u = old.reindex(union, fill_value=0.0)
+        new_u = new.reindex(union, fill_value=0.0)
+        moved = (old_u != new_u).any(axis=1) | first
+
+        out = new_u[moved].copy()
+        for side in ("CALLS", "PUTS"):
+            for name in _CHAIN_DELTA_FIELDS:
+                col = f"{side}_{name}"
+                out[f"{col}_Delta"] = out[col] - old_u.loc[moved, col]
+
+        self.call_oi += float(out["CALLS_OI_Delta"].sum())
+        self.put_oi  += float(out["PUTS_OI_Delta"].sum())
+        self.frame    = new
+        return out
@@ -16,6 +16,13 @@ from rich.console import Console
 # NseKit.NseConfig.retries      = 3      # Default: 2
 # NseKit.NseConfig.retry_delay  = 2.0    # Default: 2.0
 # NseKit.NseConfig.cookie_cache = False  # Default: True
+# NseKit.NseConfig.archive_dir  = None   # Default: ~/.nsekit_archive (None disables the EOD archive store)
+# NseKit.NseConfig.chunk_workers = 4     # Default: 1 (parallel date windows for historical data)
+# NseKit.NseConfig.history_cache = True  # Default: False (only download the missing tail of price history)
+# NseKit.NseConfig.cache_live_ttl = 5.0  # Default: 15.0 (seconds live results are reused; cache_hist_ttl default 300.0)
+# NseKit.NseConfig.cache_ttls = {"fno_live_option_chain": 0}   # Per-method TTL override (0 = never cache)
+# NseKit.NseConfig.pool_maxsize = 32     # Default: 16 (keep-alive connections per host, shared by all Nse instances)
+# NseKit.NseConfig.http2        = True   # Default: False (needs httpx[http2]; falls back to HTTP/1.1)
 
 # 2. PER-INSTANCE SETTINGS (Overwrites global settings for this instance only)
 # get_custom = NseKit.Nse(max_rps = 1.0, retries = 2, retry_delay  = 3.0, cookie_cache = True)
@@ -34,12 +41,18 @@ rich = Console()
 # # 🔹 Cookie
 # NseKit.Nse.clear_cookie_cache()                                                           #  Delete the cookie cache
 
+# # 🔹 Response cache
+# print(get.cache_stats())                                                                  # Size / hit / miss counters
+# get.clear_cache()                                                                         # Drop all cached results
+# with get.no_cache(): print(get.fno_live_option_chain("NIFTY"))                            # Force a fresh download
+
 # #---------------------------------------------------------- NSE Data ----------------------------------------------------------
 
 # # 🔹 Market Status
 # print(get.nse_market_status("Market Status"))                                             # "Market Status" | "Mcap" | "Nifty50" | "Gift Nifty"
      
 # rich.print(get.nse_is_market_open("Capital Market"), "\n")                                # "Capital Market" | "Currency" | "Commodity" | "Debt" | "currencyfuture"
+# print(get.market_is_open("Capital Market"))                                              # True / False / None (plain bool)
 
 # # 🔹 Trading Holidays
 # print(get.nse_trading_holidays())                                                         # Trading holidays DataFrame
@@ -53,6 +66,13 @@ rich = Console()
 # print(get.is_nse_trading_holiday())                                                       # Check if today is a trading holiday
 # print(get.is_nse_trading_holiday("25-Dec-2026"))                                          # Check if specific date is a trading holiday
 
+# # 🔹 Offline Trading Calendar (holiday master fetched once a day, cached on disk)
+# cal = get.trading_calendar()                                                              # TradingCalendar ("trading" | "clearing")
+# print(cal.is_trading_day("26-01-2026"))                                                   # False (Republic Day)
+# print(cal.prev_trading_day("27-01-2026", fmt="%d-%m-%Y"))                                 # Previous trading day
+# print(cal.trading_days_between("01-01-2026", "31-01-2026", fmt="%d-%m-%Y"))               # All trading days in range
+# print(cal.expiry_days("01-01-2026", "31-03-2026", monthly=True))                          # Monthly expiries (holiday-adjusted)
+
 # # 🔹 Check Clearing Holiday
 # print(get.is_nse_clearing_holiday())                                                      # Check if today is a clearing holiday
 # print(get.is_nse_clearing_holiday("25-Dec-2026"))                                         # Check if specific date is a clearing holiday
@@ -167,6 +187,8 @@ rich = Console()
 # print(get.index_historical_data("NIFTY 50", "01-01-2025", "17-10-2025"))
 # print(get.index_historical_data("NIFTY 50", "01-12-2025"))                                # Auto today date as "To date" 
 # print(get.index_historical_data("NIFTY BANK", "1W"))                                      # Last 1 Week      '1D','1W','1M','3M','6M','1Y','2Y','5Y','10Y','YTD','MAX'
+# for df in get.iter_index_historical_data("NIFTY 50", "MAX"): print(df.tail(1))             # Stream one DataFrame per 89-day window
+# print(get.index_historical_data("NIFTY 50", "MAX", incremental=True))                    # Local per-index history, only missing dates downloaded
 
 # # 🔹 Fetch Historical Index P/E, P/B, Dividend Yield
 # print(get.index_pe_pb_div_historical_data("NIFTY 50", "01-01-2025", "17-10-2025"))
@@ -176,6 +198,7 @@ rich = Console()
 # # 🔹 Fetch Historical India VIX Data
 # print(get.india_vix_historical_data("01-08-2025", "17-10-2025"))                          # Direct date range
 # print(get.india_vix_historical_data("1M"))                                                # Last 6 months     "1M", "3M", "6M", "1Y", "2Y", "5Y", "10Y", "YTD", "MAX"
+# for df in get.iter_india_vix_historical_data("5Y"): print(len(df))                        # Stream one DataFrame per 89-day window
 
 
 # #---------------------------------------------------------- Live Gift Nifty & USDINR ----------------------------------------------------------------
@@ -205,10 +228,12 @@ rich = Console()
 
 # # 🔹 Equity Price Information     (Old)
 # print(get.cm_live_equity_price_info("RELIANCE"))                                          # Detailed price data with bid/ask levels
+# print(get.cm_live_equity_price_info_many(["RELIANCE", "TCS", "IRCTC"], workers=4))           # Many symbols in one DataFrame (index snapshot where it covers them)
 
 
 # # 🔹 Equity Information           (New)
 # print(get.cm_live_equity_full_info("RELIANCE"))                                           # Equity details for a symbol
+# df, failed = get.cm_live_equity_full_info_many(["RELIANCE", "TCS", "IRCTC"], workers=4)    # Many symbols in parallel at max_rps → (DataFrame, failed symbols)
 
 
 # # 🔹 Most Active Equities by Value
@@ -410,9 +435,17 @@ rich = Console()
 
 # print(get.fno_live_option_chain_raw("M&M", expiry_date="27-Jan-2026"))                    # Raw Option chain with specific expiry     {JSON}
 
+# # 🔹 Option Chain Polling
+# poller = NseKit.OptionChainPoller(get, [("NIFTY", None), ("RELIANCE", "27-Jan-2026")], interval=20, callbacks=[print])
+# poller.start(); time.sleep(120); poller.stop()                                            # Polls in a background thread, skips when market is closed
+# print(poller.stats())                                                                     # Per-symbol polls / staleness
+# chain = NseKit.IncrementalOptionChain("NIFTY")                                            # Keeps the last snapshot keyed by strike
+# poller.callbacks.append(lambda snap: print(chain.apply(snap["data"]), chain.pcr))        # Only the strikes that moved (OI / Volume / LTP / IV deltas)
+
 # # 🔹 Active Contracts
 # print(get.fno_live_active_contracts("NIFTY"))                                             # Active index option contracts
 # print(get.fno_live_active_contracts("NIFTY", expiry_date="27-Jan-2026"))                   # Active index contracts with expiry
+# print(get.fno_live_active_contracts("NIFTY", as_frame=True))                             # Same contracts as one DataFrame
 
 # print(get.fno_live_active_contracts("RELIANCE"))                                          # Active stock option contracts
 # print(get.fno_live_active_contracts("RELIANCE", expiry_date="27-Jan-2026"))                # Active stock contracts with expiry
@@ -483,6 +516,8 @@ rich = Console()
 # print(get.cm_hist_security_wise_data("RELIANCE"))                                         # 1Y data for symbol
 # print(get.cm_hist_security_wise_data("RELIANCE", "2Y"))                                   # 1Y for symbol    1D, 1W, 1M, 3M, 6M, 1Y
 # print(get.cm_hist_security_wise_data("RELIANCE", "01-10-2025", "17-10-2025"))             # Date range for symbol
+# for df in get.iter_cm_hist_security_wise_data("RELIANCE", "1Y"): print(len(df))           # Stream one DataFrame per 89-day window
+# print(get.cm_hist_security_wise_data("RELIANCE", "1Y", incremental=True))                # Local per-symbol history, only missing dates downloaded
 
 # # 🔹 Historical Bulk Deals
 # print(get.cm_hist_bulk_deals())                                                           # today date data for all symbol
@@ -543,6 +578,8 @@ rich = Console()
 
 # # 🔹 F&O Bhavcopy
 # print(get.fno_eod_bhav_copy("16-02-2026"))                                                # F&O bhavcopy for a specific trade date (DD-MM-YYYY)
+# print(get.fno_eod_bhav_copy("16-02-2026", typed=True))                                    # Typed schema: categoricals, float OI/prices, datetime expiries
+# print(get.fno_eod_bhav_copy("16-02-2026", columns=["TckrSymb", "XpryDt", "StrkPric", "OptnTp", "OpnIntrst"]))   # Only the columns you need
 
 # # 🔹 FII Stats
 # print(get.fno_eod_fii_stats("17-10-2025"))                                                # FII statistics for a specific trade date (DD-MM-YYYY)
@@ -582,6 +619,12 @@ rich = Console()
 # print(get.option_price_volume_data("BANKNIFTY", "Index Options", "3M"))
 # print(get.option_price_volume_data("NIFTY", "Index Options","PE", "01-10-2025", expiry= "28-10-2025"))
 
+# # 🔹 Contract History from archived F&O Bhavcopies (no foCPV calls)
+# print(get.fno_eod_contract_history([("ITC", "Stock Options", 420, "CE", "28-10-2025"),
+#                                     ("NIFTY", "Index Futures", None, None, "OCT-25")], from_date="01-10-2025"))
+# print(get.fno_eod_contract_history([("TCS", "Stock Options", 3000, "CE", "24-02-2026")],
+#                                    "01-02-2026", "06-02-2026", fetch_missing=False))  # Archive only
+
 # # 🔹 F&O Lot Size
 # print(get.fno_eom_lot_size())                                                             # Latest F&O lot sizes
 # print(get.fno_eom_lot_size("TCS"))                                                        # F&O lot sizes for symbol 
@@ -597,6 +640,18 @@ rich = Console()
 # print(get.fno_monthly_settlement_report("2Y"))                                            # Last 2 FYs
 
 
+# #---------------------------------------------------------- Bulk Downloads ----------------------------------------------------------
+
+# # 🔹 EOD Archive Store (bhavcopies are served locally after the first download)
+# print(get.archive_stats())                                                                # Hit / miss / eviction counters and disk usage
+# print(get.clear_archive())                                                                # Delete every stored bhavcopy
+
+# # 🔹 Parallel Date-Range Backfill (weekends + trading holidays skipped)
+# print(get.backfill("fno_eod_bhav_copy", "01-01-2025", "31-03-2025", workers=4))           # One DataFrame with a TradeDate column
+# print(get.last_backfill)                                                                  # Per-date Status / Attempts / Rows / Error
+# for d, df, st in get.iter_backfill("cm_eod_equity_bhavcopy", "01-03-2025", "31-03-2025"):  # Stream each day as it completes
+#     print(d, st["Status"], st["Rows"])
+
 # #---------------------------------------------------------- SEBI Data ----------------------------------------------------------
 
 # # 🔹 SEBI Circulars
@@ -0,0 +1,298 @@
+"""
+bench_nsekit.py — offline micro-benchmarks for NseKit hot paths.
+
+Every benchmark builds synthetic NSE-shaped input, so no network access is
+needed.  Run all of them or pick one by name::
+
+    python bench_nsekit.py
+    python bench_nsekit.py fo_bhavcopy
+    python bench_nsekit.py option_chain
+    python bench_nsekit.py contract_history
+    python bench_nsekit.py http_transport
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+import NseKit
+
+
+def _best_of(fn, repeat: int = 5) -> float:
+    """Best wall-clock time of *repeat* runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def _report(title: str, rows: list[tuple[str, float]]) -> None:
+    base = rows[0][1]
+    print(f"\n{title}")
+    for label, ms in rows:
+        print(f"  {label:<34} {ms:9.1f} ms   x{base / ms:5.2f}")
+
+
+# ── F&O bhavcopy parsing ─────────────────────────────────────────────────────
+
+_FO_HEADER = (
+    "TradDt,BizDt,Sgmt,Src,FinInstrmTp,FinInstrmId,ISIN,TckrSymb,SctySrs,XpryDt,"
+    "FininstrmActlXpryDt,StrkPric,OptnTp,FinInstrmNm,OpnPric,HghPric,LwPric,ClsPric,"
+    "LastPric,PrvsClsgPric,UndrlygPric,SttlmPric,OpnIntrst,ChngInOpnIntrst,TtlTradgVol,"
+    "TtlTrfVal,TtlNbOfTxsExctd,SsnId,NewBrdLotQty,Rmks,Rsvd1,Rsvd2,Rsvd3,Rsvd4"
+)
+
+
+def make_fo_bhavcopy_zip(rows: int = 300_000, seed: int = 0) -> bytes:
+    """Synthetic UDiFF F&O bhavcopy ZIP with *rows* option/future records."""
+    rng     = np.random.default_rng(seed)
+    tickers = np.array([f"SYM{i:03d}" for i in range(200)] + ["NIFTY", "BANKNIFTY"])
+    expiry  = np.array(["2025-10-28", "2025-11-25", "2025-12-30"])
+    tick    = tickers[rng.integers(0, len(tickers), rows)]
+    xp      = expiry[rng.integers(0, 3, rows)]
+    kind    = np.where(np.isin(tick, ["NIFTY", "BANKNIFTY"]), "IDO", "STO")
+    optn    = np.array(["CE", "PE"])[rng.integers(0, 2, rows)]
+    strike  = rng.integers(50, 5000, rows) * 10.0
+    price   = rng.random(rows).round(4) * 100
+    oi      = rng.integers(0, 1_000_000, rows)
+    df = pd.DataFrame({
+        "TradDt": "2025-10-17", "BizDt": "2025-10-17", "Sgmt": "FO", "Src": "NSE",
+        "FinInstrmTp": kind, "FinInstrmId": np.arange(rows), "ISIN": "", "TckrSymb": tick,
+        "SctySrs": "", "XpryDt": xp, "FininstrmActlXpryDt": xp, "StrkPric": strike,
+        "OptnTp": optn, "FinInstrmNm": tick, "OpnPric": price, "HghPric": price * 1.1,
+        "LwPric": price * 0.9, "ClsPric": price, "LastPric": price, "PrvsClsgPric": price,
+        "UndrlygPric": strike, "SttlmPric": price, "OpnIntrst": oi,
+        "ChngInOpnIntrst": rng.integers(-5000, 5000, rows), "TtlTradgVol": oi // 3,
+        "TtlTrfVal": (oi * price).round(2), "TtlNbOfTxsExctd": oi // 10, "SsnId": "F1",
+        "NewBrdLotQty": 50, "Rmks": "", "Rsvd1": "", "Rsvd2": "", "Rsvd3": "", "Rsvd4": "",
+    })
+    assert ",".join(df.columns) == _FO_HEADER
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("BhavCopy_NSE_FO_0_0_0_20251017_F_0000.csv", df.to_csv(index=False))
+    return buf.getvalue()
+
+
+# Columns fno_analyzer actually uses, and the rename / to_numeric pass it runs.
+_ANALYZER_MAP = {
+    "TckrSymb": "ticker", "FinInstrmTp": "instrm_type", "XpryDt": "xpry_dt",
+    "StrkPric": "strk_prc", "OptnTp": "optn_tp", "HghPric": "high_prc",
+    "OpnIntrst": "opn_intrst", "ChngInOpnIntrst": "chng_in_oi",
+    "TtlTrfVal": "ttl_val", "ClsPric": "clse_prc",
+}
+
+
+def _legacy_fo_path(raw: bytes) -> pd.DataFrame:
+    df = object.__new__(NseKit.Nse)._zip_csv(raw)
+    df.columns = [c.strip() for c in df.columns]
+    df = df.rename(columns=_ANALYZER_MAP)
+    for col in ("strk_prc", "high_prc", "opn_intrst", "chng_in_oi", "ttl_val"):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df["xpry_dt"] = pd.to_datetime(df["xpry_dt"])
+    return df
+
+
+def bench_fo_bhavcopy(rows: int = 300_000) -> None:
+    raw = make_fo_bhavcopy_zip(rows)
+    cols = list(_ANALYZER_MAP)
+    legacy = _legacy_fo_path(raw)
+    typed  = NseKit._read_fo_bhav_zip(raw, columns=cols).rename(columns=_ANALYZER_MAP)
+    assert len(legacy) == len(typed)
+    assert np.allclose(legacy["opn_intrst"], typed["opn_intrst"])
+    assert (legacy["xpry_dt"].to_numpy() == typed["xpry_dt"].to_numpy()).all()
+
+    reader = "pyarrow" if NseKit._pyarrow_csv() else "pandas-c"
+    _report(f"F&O bhavcopy parse ({rows:,} rows, reader={reader})", [
+        ("_zip_csv + rename + to_numeric",  _best_of(lambda: _legacy_fo_path(raw), 3)),
+        ("_read_fo_bhav_zip (all columns)", _best_of(lambda: NseKit._read_fo_bhav_zip(raw), 3)),
+        ("_read_fo_bhav_zip (10 columns)",  _best_of(lambda: NseKit._read_fo_bhav_zip(raw, cols), 3)),
+    ])
+    mem = lambda df: df.memory_usage(deep=True).sum() / 2**20
+    print(f"  memory: legacy {mem(legacy):.1f} MB, typed projection {mem(typed):.1f} MB")
+
+
+# ── Live option-chain snapshot ───────────────────────────────────────────────
+
+def make_option_chain_payload(strikes: int = 200, seed: int = 0) -> dict:
+    """Synthetic ``getOptionChainData`` payload with *strikes* CE/PE rows."""
+    rng = np.random.default_rng(seed)
+
+    def leg():
+        return {
+            "openInterest": int(rng.integers(0, 100_000)), "changeinOpenInterest": int(rng.integers(-999, 999)),
+            "totalTradedVolume": int(rng.integers(0, 50_000)), "impliedVolatility": float(rng.random() * 40),
+            "lastPrice": float(rng.random() * 500), "change": float(rng.normal()),
+            "totalBuyQuantity": int(rng.integers(0, 9_000)), "buyQuantity1": 75, "buyPrice1": 10.5,
+            "sellPrice1": 10.6, "totalSellQuantity": int(rng.integers(0, 9_000)), "sellQuantity1": 75,
+        }
+
+    data = [{"strikePrice": 20_000 + 50 * i, "CE": leg(), "PE": leg()} for i in range(strikes)]
+    data[0].pop("PE")                                    # deep OTM strikes often miss a leg
+    return {"timestamp": "17-Oct-2025 15:30:00", "underlyingValue": 25_000.0, "data": data}
+
+
+def _legacy_option_chain(payload: dict, oi_mode: str = "full") -> pd.DataFrame:
+    """The per-row builder fno_live_option_chain used before the columnar one."""
+    col_names = NseKit._OC_COMPACT_COLS if oi_mode == "compact" else NseKit._OC_FULL_COLS
+    dtypes = {c: "float64" for c in col_names
+              if any(x in c for x in ("Price", "IV", "Value", "OI", "Volume", "Chng", "Qty"))}
+    dtypes.update({"Fetch_Time": "object", "Symbol": "object", "Expiry_Date": "object",
+                   "Strike_Price": "float64"})
+    rows = []
+    for item in payload["data"]:
+        ce, pe = item.get("CE", {}), item.get("PE", {})
+        row = {"Fetch_Time": payload["timestamp"], "Symbol": "NIFTY", "Expiry_Date": "28-Oct-2025",
+               "Strike_Price": item.get("strikePrice"), "Underlying_Value": payload["underlyingValue"]}
+        for side, leg in (("CALLS", ce), ("PUTS", pe)):
+            for key, name in NseKit._OC_LEG_FIELDS.items():
+                row[f"{side}_{name}"] = leg.get(key, 0)
+            if oi_mode == "full":
+                row[f"{side}_Bid_Qty"]   = leg.get("totalBuyQuantity", 0) or leg.get("buyQuantity1", 0)
+                row[f"{side}_Bid_Price"] = leg.get("buyPrice1", 0)
+                row[f"{side}_Ask_Price"] = leg.get("sellPrice1", 0)
+                row[f"{side}_Ask_Qty"]   = leg.get("totalSellQuantity", 0) or leg.get("sellQuantity1", 0)
+        rows.append(row)
+    return pd.DataFrame(rows, columns=col_names).astype(dtypes)
+
+
+def _columnar_option_chain(payload: dict, oi_mode: str = "full") -> pd.DataFrame:
+    return NseKit._option_chain_frame(payload["data"], "NIFTY", "28-Oct-2025", payload["timestamp"],
+                                      payload["underlyingValue"], oi_mode)
+
+
+def bench_option_chain(strikes: int = 200) -> None:
+    payload = make_option_chain_payload(strikes)
+    for mode in ("full", "compact"):
+        pd.testing.assert_frame_equal(_legacy_option_chain(payload, mode),
+                                      _columnar_option_chain(payload, mode))
+    _report(f"Option-chain snapshot build ({strikes} strikes, per snapshot)", [
+        ("row loop + astype (full)",  _best_of(lambda: _legacy_option_chain(payload), 50)),
+        ("columnar builder (full)",   _best_of(lambda: _columnar_option_chain(payload), 50)),
+        ("columnar builder (compact)", _best_of(lambda: _columnar_option_chain(payload, "compact"), 50)),
+    ])
+
+
+# ── Contract history from archived bhavcopies ────────────────────────────────
+
+def bench_contract_history(days: int = 60, rows: int = 100_000, contracts: int = 300) -> None:
+    day   = NseKit._read_fo_bhav_zip(make_fo_bhavcopy_zip(rows))
+    dates = pd.bdate_range(end="2025-10-17", periods=days)
+    pick  = day[day["TtlTradgVol"] > 0].drop_duplicates(["TckrSymb", "XpryDt", "StrkPric", "OptnTp"])
+    pick  = pick[pick["XpryDt"] == "2025-10-28"].sample(contracts, random_state=0)
+    specs = [(s, "Stock Options" if t == "STO" else "Index Options", k, o, "28-10-2025")
+             for s, t, k, o in pick[["TckrSymb", "FinInstrmTp", "StrkPric", "OptnTp"]].values]
+
+    with tempfile.TemporaryDirectory() as root:
+        NseKit.NseConfig.archive_dir = root
+        nse = object.__new__(NseKit.Nse)
+        for d in dates:
+            nse.archive.put("fno_bhavcopy_typed", d.strftime("%Y-%m-%d"), day.assign(TradDt=d))
+        lo, hi = dates[0].strftime("%d-%m-%Y"), dates[-1].strftime("%d-%m-%Y")
+
+        def _full_scan():
+            want = set(map(tuple, pick[["TckrSymb", "StrkPric", "OptnTp"]].astype(str).values))
+            out  = []
+            for d in dates:
+                df  = nse.archive.get("fno_bhavcopy_typed", d.strftime("%Y-%m-%d"))
+                key = df["TckrSymb"].astype(str) + "|" + df["StrkPric"].astype(str) + "|" + df["OptnTp"].astype(str)
+                out.append(df[key.isin({"|".join(k) for k in want}) & (df["XpryDt"] == "2025-10-28")])
+            return pd.concat(out)
+
+        hist = lambda: nse.fno_eod_contract_history(specs, lo, hi, fetch_missing=False)
+        assert len(hist()) == len(_full_scan())
+        _report(f"Contract history ({contracts} contracts x {days} archived days, {rows:,} rows/day)", [
+            ("full-frame read + filter",        _best_of(_full_scan, 3)),
+            ("fno_eod_contract_history",        _best_of(hist, 3)),
+        ])
+        print(f"  foCPV requests avoided: {contracts} (one per contract)")
+
+
+# ── Shared HTTP transport ────────────────────────────────────────────────────
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON endpoint; each new connection pays a fake TLS handshake."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True      # headers and body go out as separate writes
+    body = b'{"data": []}'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake)
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def bench_http_transport(calls: int = 200, threads: int = 32,
+                         handshake: float = 0.05, latency: float = 0.02) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads, server.lock = True, threading.Lock()
+    server.handshake, server.latency = handshake, latency
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/api/quote-equity"
+    logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)   # "pool is full" spam
+
+    def _run(label, fn):
+        server.connections = 0
+        t0 = time.perf_counter()
+        fn()
+        return label, (time.perf_counter() - t0) * 1000, server.connections
+
+    def _sequential(make):
+        for _ in range(calls):
+            make().get(url, timeout=5).content
+
+    def _concurrent(session):
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(lambda _: session.get(url, timeout=5).content, range(calls)))
+
+    import requests
+    rows = [
+        _run("sequential, Session per call",      lambda: _sequential(requests.Session)),
+        _run("sequential, shared transport",      lambda: _sequential(NseKit._new_session)),
+        _run(f"{threads} threads, default pool (10)", lambda: _concurrent(requests.Session())),
+        _run(f"{threads} threads, shared pool ({NseKit.NseConfig.pool_maxsize})",
+             lambda: _concurrent(NseKit._new_session())),
+    ]
+    server.shutdown()
+    for title, pair in (("sequential", rows[:2]), ("concurrent", rows[2:])):
+        _report(f"HTTP transport, {title} ({calls} calls, {handshake * 1000:.0f} ms handshake, "
+                f"{latency * 1000:.0f} ms latency)", [(label, ms) for label, ms, _ in pair])
+        for label, _, opened in pair:
+            print(f"  {label:<34} {opened:5d} connections opened")
+
+
+BENCHMARKS = {
+    "fo_bhavcopy":  bench_fo_bhavcopy,
+    "option_chain": bench_option_chain,
+    "contract_history": bench_contract_history,
+    "http_transport": bench_http_transport,
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
@@ -18,7 +18,13 @@ Marking convention
 
 from __future__ import annotations
 
+import asyncio
+import os
 import re
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import pandas as pd
@@ -35,6 +41,28 @@ def nse() -> NseKit.Nse:
     return NseKit.Nse(max_rps=1.5)
 
 
+@pytest.fixture
+def offline_nse():
+    """
+    Factory for an ``Nse`` built without a session or warm-up.
+
+    ``offline_nse(**members)`` binds every plain function in *members* as a
+    method (it receives the instance as ``self``) and sets everything else
+    as an attribute.  Each instance starts with an empty ``calls`` list and
+    a ``lock`` for stubs that record their calls.
+    """
+    def make(**members) -> NseKit.Nse:
+        nse = object.__new__(NseKit.Nse)
+        nse.calls = []
+        nse.lock  = threading.Lock()
+        for name, value in members.items():
+            if isinstance(value, types.FunctionType):
+                value = types.MethodType(value, nse)
+            setattr(nse, name, value)
+        return nse
+    return make
+
+
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
 def _is_df(result, min_rows: int = 0) -> None:
@@ -985,3 +1013,1004 @@ class TestModuleHelpers:
         result = NseKit._clean(df)
         assert result["a"].iloc[1] is None
         assert result["a"].iloc[2] is None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 19. EOD archive store (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class TestArchiveStore:
+    def _store(self, tmp_path, max_mb: float = 10.0):
+        return NseKit._ArchiveStore(str(tmp_path), int(max_mb * 1024 * 1024))
+
+    def test_put_get_roundtrip(self, tmp_path):
+        store = self._store(tmp_path)
+        df = pd.DataFrame({"SYMBOL": ["A", "B"], "CLOSE": [1.5, 2.5]})
+        assert store.get("fno_bhavcopy", "2025-10-17") is None
+        assert store.put("fno_bhavcopy", "2025-10-17", df)
+        out = store.get("fno_bhavcopy", "2025-10-17")
+        pd.testing.assert_frame_equal(out, df)
+        stats = store.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1 and stats["writes"] == 1
+        assert store.keys("fno_bhavcopy") == ["2025-10-17"]
+
+    def test_eviction_keeps_store_under_budget(self, tmp_path):
+        store = self._store(tmp_path)
+        df = pd.DataFrame({"x": range(2000)})
+        store.put("cm_bhavcopy", "2025-01-01", df)
+        store.max_bytes = int(store._bytes * 1.5)
+        store.put("cm_bhavcopy", "2025-01-02", df)
+        assert store.stats()["evictions"] == 1
+        assert store.keys("cm_bhavcopy") == ["2025-01-02"]
+
+    def test_archived_skips_fetch_on_hit(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(NseKit.NseConfig, "archive_dir", str(tmp_path))
+        nse = object.__new__(NseKit.Nse)     # no session / warm-up needed
+        calls = []
+
+        def _fetch():
+            calls.append(1)
+            return pd.DataFrame({"a": [1, 2]})
+
+        first  = nse._archived("cm_bhavcopy", "17-10-2025", _fetch)
+        second = nse._archived("cm_bhavcopy", "17-10-2025", _fetch)
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_archived_disabled(self, monkeypatch):
+        monkeypatch.setattr(NseKit.NseConfig, "archive_dir", None)
+        nse = object.__new__(NseKit.Nse)
+        assert nse.archive is None
+        assert nse._archived("cm_bhavcopy", "17-10-2025", lambda: None) is None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 20. Backfill engine & trading calendar (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class TestBackfill:
+    @pytest.fixture
+    def offline(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(NseKit.NseConfig, "calendar_cache", str(tmp_path / "calendar.json"))
+        nse = object.__new__(NseKit.Nse)      # no session / warm-up needed
+        nse.retry_delay   = 0.0
+        nse.last_backfill = None
+        nse.nse_trading_holidays = lambda list_only=False: ["15-Jan-2025"]
+        return nse
+
+    def test_weekday_dates_skip_weekends_and_holidays(self):
+        dates = NseKit._weekday_dates("10-01-2025", "16-01-2025", ["15-Jan-2025"])
+        assert dates == ["10-01-2025", "13-01-2025", "14-01-2025", "16-01-2025"]
+
+    def test_backfill_concat_and_status(self, offline):
+        calls = {}
+
+        def fake(trade_date):
+            calls[trade_date] = calls.get(trade_date, 0) + 1
+            if trade_date == "14-01-2025":
+                return None
+            return pd.DataFrame({"SYMBOL": ["A"], "CLOSE": [1.0]})
+
+        offline.fno_eod_bhav_copy = fake
+        df = offline.backfill("fno_eod_bhav_copy", "13-01-2025", "16-01-2025",
+                              workers=3, retries=1)
+        assert list(df.columns) == ["TradeDate", "SYMBOL", "CLOSE"]
+        assert df["TradeDate"].tolist() == ["13-01-2025", "16-01-2025"]
+        st = offline.last_backfill.set_index("TradeDate")
+        assert st.loc["14-01-2025", "Status"] == "failed"
+        assert st.loc["14-01-2025", "Attempts"] == 2
+        assert calls["14-01-2025"] == 2
+        assert "15-01-2025" not in calls
+
+    def test_fno_bhavcopy_downloads_share_the_throttle(self, offline, monkeypatch):
+        monkeypatch.setattr(NseKit.NseConfig, "archive_dir", None)
+        paced, fetched, lock = [], [], threading.Lock()
+
+        def throttle():
+            with lock:
+                paced.append(len(fetched))
+
+        def get(url, **kw):
+            with lock:
+                fetched.append(url)
+            return types.SimpleNamespace(status_code=200, content=_fo_bhav_zip())
+
+        offline.headers  = {}
+        offline._throttle = throttle
+        offline.session  = types.SimpleNamespace(get=get)
+        df = offline.backfill("fno_eod_bhav_copy", "13-01-2025", "16-01-2025", workers=3)
+        assert df["TradeDate"].unique().tolist() == ["13-01-2025", "14-01-2025", "16-01-2025"]
+        assert len(fetched) == len(paced) == 3
+
+    def test_backfill_skip_and_unknown_report(self, offline):
+        offline.cm_eod_equity_bhavcopy = lambda d: pd.DataFrame({"a": [1]})
+        out = offline.backfill("cm_eod_equity_bhavcopy", "13-01-2025", "14-01-2025",
+                               skip=["13-01-2025"], concat=False)
+        assert list(out) == ["14-01-2025"]
+        with pytest.raises(ValueError):
+            offline.backfill("not_a_report", "13-01-2025", "14-01-2025")
+
+
+class TestTradingCalendar:
+    @pytest.fixture
+    def cal(self):
+        return NseKit.TradingCalendar(["26-Jan-2026", "03-Mar-2026", "31-Mar-2026"])
+
+    def test_day_lookups(self, cal):
+        assert cal.prev_trading_day("27-01-2026") == datetime(2026, 1, 23).date()
+        assert cal.prev_trading_day("25-Jan-2026", fmt="%d-%m-%Y") == "23-01-2026"
+        assert cal.next_trading_day("23-01-2026", fmt="%d-%m-%Y") == "27-01-2026"
+        assert cal.last_trading_day("2026-01-26", fmt="%d-%m-%Y") == "23-01-2026"
+        assert not cal.is_trading_day("26-01-2026") and cal.is_holiday("26-01-2026")
+        assert not cal.is_trading_day("25-01-2026") and not cal.is_holiday("25-01-2026")
+
+    def test_ranges_and_expiries(self, cal):
+        days = cal.trading_days_between("23-01-2026", "28-01-2026", fmt="%d-%m-%Y")
+        assert days == ["23-01-2026", "27-01-2026", "28-01-2026"]
+        assert cal.count_trading_days("23-01-2026", "28-01-2026") == 3
+        # Last Tuesday of March is a holiday → expiry moves to Monday 30th.
+        assert cal.monthly_expiry(2026, 3, fmt="%d-%m-%Y") == "30-03-2026"
+        weekly = cal.expiry_days("01-03-2026", "31-03-2026", fmt="%d-%m-%Y")
+        assert weekly == ["02-03-2026", "10-03-2026", "17-03-2026", "24-03-2026", "30-03-2026"]
+
+    def test_fetched_once_per_day_and_persisted(self, tmp_path, monkeypatch):
+        path = tmp_path / "calendar.json"
+        monkeypatch.setattr(NseKit.NseConfig, "calendar_cache", str(path))
+        calls = []
+        nse = object.__new__(NseKit.Nse)
+        nse.nse_trading_holidays = lambda list_only=False: calls.append(1) or ["15-Jan-2025"]
+        assert nse.trading_calendar().is_holiday("15-01-2025")
+        assert nse.is_nse_trading_holiday("15-Jan-2025") is True
+        assert len(calls) == 1 and path.exists()
+
+        NseKit._PROCESS_CALENDARS.clear()          # new process: served from disk
+        assert nse.trading_calendar().is_holiday("15-01-2025")
+        assert len(calls) == 1
+
+        nse.nse_trading_holidays = lambda list_only=False: ["26-Jan-2026"]
+        merged = nse.trading_calendar(refresh=True)
+        assert merged.is_holiday("15-01-2025") and merged.is_holiday("26-01-2026")
+
+    def test_failed_download_retried_once_per_interval(self, tmp_path, monkeypatch):
+        path = tmp_path / "calendar.json"
+        path.write_text('{"trading": {"fetched": "2000-01-01", "holidays": ["15-Jan-2025"]}}')
+        monkeypatch.setattr(NseKit.NseConfig, "calendar_cache", str(path))
+        clock = [1000.0]
+        monkeypatch.setattr(NseKit.time, "monotonic", lambda: clock[0])
+        calls = []
+        nse = object.__new__(NseKit.Nse)
+        nse.nse_trading_holidays  = lambda list_only=False: calls.append("trading")
+        nse.nse_clearing_holidays = lambda list_only=False: calls.append("clearing")
+
+        for _ in range(3):
+            assert nse.trading_calendar().is_holiday("15-01-2025")      # saved calendar
+            assert nse.trading_calendar("clearing") is None             # nothing saved
+        assert calls == ["trading", "clearing"]
+
+        clock[0] += NseKit._CALENDAR_RETRY_SECS + 1
+        nse.trading_calendar()
+        assert calls == ["trading", "clearing", "trading"]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 21. Chunked historical fetch (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _FakeResponse:
+    def __init__(self, payload=None, status_code: int = 200, ctype: str = "application/json"):
+        self._payload    = payload
+        self.status_code = status_code
+        self.headers     = {"Content-Type": ctype}
+
+    def json(self):
+        if self._payload is None:
+            raise ValueError("not JSON")
+        return self._payload
+
+
+class _FakeChunkSession:
+    """Returns one record per window, echoing the window's start date."""
+
+    def __init__(self, fail_first: set | None = None):
+        self.fail_first = set(fail_first or ())
+        self.calls: list[str] = []
+
+    def get(self, url, **kw):
+        self.calls.append(url)
+        start = url.split("from=")[1].split("&")[0]
+        if start in self.fail_first:
+            self.fail_first.discard(start)
+            return _FakeResponse(None, ctype="text/html")
+        return _FakeResponse({"data": [{"start": start}]})
+
+
+class TestChunkedFetch:
+    TPL = "https://example.invalid/api?from={}&to={}"
+
+    @pytest.fixture
+    def offline(self, monkeypatch):
+        nse = object.__new__(NseKit.Nse)
+        nse.max_rps = 1000.0
+        nse.headers = {}
+        nse._warm_and_fetch = lambda *a, **k: None
+        monkeypatch.setattr(NseKit.time, "sleep", lambda s: None)
+        return nse
+
+    def test_chunk_windows_cover_range(self):
+        wins = NseKit._chunk_windows("01-01-2025", "30-06-2025", chunk=89)
+        assert wins[0] == ("01-01-2025", "31-03-2025")
+        assert wins[-1][1] == "30-06-2025"
+        for (_, prev_end), (nxt_start, _) in zip(wins, wins[1:]):
+            gap = datetime.strptime(nxt_start, "%d-%m-%Y") - datetime.strptime(prev_end, "%d-%m-%Y")
+            assert gap.days == 1
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_records_in_date_order(self, offline, workers):
+        offline.session = _FakeChunkSession()
+        recs = offline._get_chunked("ref", self.TPL, "01-01-2024", "31-12-2024",
+                                    chunk=29, workers=workers)
+        starts = [datetime.strptime(r["start"], "%d-%m-%Y") for r in recs]
+        assert starts == sorted(starts)
+        assert len(recs) == len(NseKit._chunk_windows("01-01-2024", "31-12-2024", 29))
+
+    def test_html_reply_is_retried(self, offline):
+        offline.session = _FakeChunkSession(fail_first={"01-01-2024"})
+        recs = offline._get_chunked("ref", self.TPL, "01-01-2024", "31-03-2024",
+                                    chunk=29, workers=3)
+        assert recs[0]["start"] == "01-01-2024"
+        assert len(offline.session.calls) == len(recs) + 1
+
+    def test_iter_security_wise_yields_per_window(self, offline):
+        class _Session(_FakeChunkSession):
+            def get(self, url, **kw):
+                start = url.split("from=")[1].split("&")[0]
+                day   = datetime.strptime(start, "%d-%m-%Y").strftime("%d-%b-%Y")
+                return _FakeResponse({"data": [
+                    {"CH_SYMBOL": "ABC", "mTIMESTAMP": day, "CH_CLOSING_PRICE": 10.0},
+                ]})
+
+        offline.session = _Session()
+        frames = list(offline.iter_cm_hist_security_wise_data(
+            "ABC", "01-01-2024", "30-06-2024",
+        ))
+        assert len(frames) == len(NseKit._chunk_windows("01-01-2024", "30-06-2024"))
+        assert all(list(f.columns) == ["Symbol", "Date", "Close Price"] for f in frames)
+        assert frames[0]["Date"].iloc[0] == "01-Jan-2024"
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 22. Incremental history cache (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _DailySession:
+    """One security-wise record per calendar day; Close = current ``version``."""
+
+    def __init__(self):
+        self.version = 1
+        self.fail: set[str] = set()     # window start dates answered with HTML
+        self.calls: list[tuple[str, str]] = []
+
+    def get(self, url, **kw):
+        q     = dict(p.split("=", 1) for p in url.split("?", 1)[1].split("&"))
+        start = datetime.strptime(q["from"], "%d-%m-%Y")
+        end   = datetime.strptime(q["to"],   "%d-%m-%Y")
+        self.calls.append((q["from"], q["to"]))
+        if q["from"] in self.fail:
+            return _FakeResponse(None, ctype="text/html")
+        rows, d = [], start
+        while d <= end:
+            rows.append({"CH_SYMBOL": "ABC", "mTIMESTAMP": d.strftime("%d-%b-%Y"),
+                         "CH_CLOSING_PRICE": float(self.version)})
+            d += timedelta(days=1)
+        return _FakeResponse({"data": rows})
+
+
+class TestIncrementalHistory:
+    @pytest.fixture
+    def offline(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(NseKit.NseConfig, "archive_dir", str(tmp_path))
+        monkeypatch.setattr(NseKit.time, "sleep", lambda s: None)
+        nse = object.__new__(NseKit.Nse)
+        nse.max_rps = 1000.0
+        nse.headers = {}
+        nse.session = _DailySession()
+        nse._warm_and_fetch = lambda *a, **k: None
+        return nse
+
+    def test_only_missing_tail_is_downloaded(self, offline):
+        first = offline.cm_hist_security_wise_data("ABC", "01-01-2024", "31-01-2024", incremental=True)
+        assert len(first) == 31
+        offline.session.calls.clear()
+        offline.session.version = 2
+
+        df = offline.cm_hist_security_wise_data("ABC", "01-01-2024", "15-02-2024", incremental=True)
+        assert offline.session.calls == [("31-01-2024", "15-02-2024")]
+        assert len(df) == 46
+        assert df["Date"].is_unique
+        close = df.set_index("Date")["Close Price"]
+        assert close["30-Jan-2024"] == 1.0          # stored row kept
+        assert close["31-Jan-2024"] == 2.0          # seam row replaced by fresh data
+
+    def test_range_inside_cache_needs_no_network(self, offline):
+        offline.cm_hist_security_wise_data("ABC", "01-01-2024", "31-03-2024", incremental=True)
+        offline.session.calls.clear()
+        df = offline.cm_hist_security_wise_data("ABC", "01-02-2024", "10-02-2024", incremental=True)
+        assert offline.session.calls == []
+        assert df["Date"].iloc[0] == "01-Feb-2024" and len(df) == 10
+
+    def test_failed_window_is_not_marked_covered(self, offline):
+        offline.session.fail = {"01-01-2024"}
+        part = offline.cm_hist_security_wise_data("ABC", "01-01-2024", "31-05-2024", incremental=True)
+        assert part["Date"].iloc[0] == "31-Mar-2024"
+        stored = offline.archive.get("hist_security", "ABC")
+        assert stored.attrs == {"covered_from": "31-03-2024", "covered_to": "31-05-2024"}
+
+        offline.session.fail.clear()
+        offline.session.calls.clear()
+        df = offline.cm_hist_security_wise_data("ABC", "01-01-2024", "31-05-2024", incremental=True)
+        assert offline.session.calls == [("01-01-2024", "30-03-2024"),      # not served from cache
+                                         ("31-05-2024", "31-05-2024")]
+        assert df["Date"].iloc[0] == "01-Jan-2024" and len(df) == 152
+
+    def test_sort_dedup_keep_last_prefers_later_rows(self):
+        df = pd.DataFrame({"Date": ["02-Jan-2025", "01-Jan-2025", "02-Jan-2025"], "v": [1, 1, 2]})
+        out = NseKit._sort_dedup_dates(df, "Date", "%d-%b-%Y", ascending=True, keep="last")
+        assert out["Date"].tolist() == ["01-Jan-2025", "02-Jan-2025"]
+        assert out["v"].tolist() == [1, 2]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 23. Response cache (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+@NseKit._cached("live")
+def _live_frame(self, symbol: str):
+    self.calls.append(symbol)
+    return pd.DataFrame({"Symbol": [symbol], "N": [len(self.calls)]})
+
+
+@NseKit._cached("hist")
+def _maybe_none(self):
+    self.calls.append(None)
+    return None
+
+
+@NseKit._cached("hist")
+def _failed_frame(self):
+    self.calls.append(None)
+    return pd.DataFrame()
+
+
+@NseKit._cached("live")
+def _raw_json(self):
+    self.calls.append(None)
+    return {"data": [{"N": len(self.calls)}]}
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def counting(self, offline_nse):
+        """Offline Nse whose cached endpoints count calls instead of hitting NSE."""
+        return offline_nse(live_frame=_live_frame, maybe_none=_maybe_none,
+                           failed_frame=_failed_frame, raw_json=_raw_json)
+
+    def test_hit_returns_copy(self, counting):
+        first = counting.live_frame("ABC")
+        first.loc[0, "N"] = 99
+        again = counting.live_frame("ABC")
+        assert len(counting.calls) == 1
+        assert again.loc[0, "N"] == 1
+        assert counting.cache_stats()["hits"] == 1
+
+    def test_args_are_part_of_key(self, counting):
+        counting.live_frame("ABC"); counting.live_frame(symbol="ABC"); counting.live_frame("XYZ")
+        assert len(counting.calls) == 3
+
+    def test_none_and_empty_frame_not_cached(self, counting):
+        counting.maybe_none(); counting.maybe_none()
+        assert len(counting.calls) == 2
+        counting.failed_frame(); counting.failed_frame()
+        assert len(counting.calls) == 4
+
+    def test_json_hit_returns_copy(self, counting):
+        counting.raw_json()["data"][0]["N"] = 99
+        assert counting.raw_json() == {"data": [{"N": 1}]}
+        assert len(counting.calls) == 1
+
+    def test_no_cache_and_ttl_override(self, counting, monkeypatch):
+        counting.live_frame("ABC")
+        with counting.no_cache():
+            counting.live_frame("ABC")
+        assert len(counting.calls) == 2
+        monkeypatch.setattr(NseKit.NseConfig, "cache_ttls", {"_live_frame": 0})
+        counting.live_frame("ABC")
+        assert len(counting.calls) == 3
+
+    def test_expiry_and_lru(self, monkeypatch):
+        cache = NseKit._ResponseCache(max_size=2)
+        clock = [100.0]
+        monkeypatch.setattr(NseKit.time, "monotonic", lambda: clock[0])
+        cache.set("a", 1, ttl=10); cache.set("b", 2, ttl=10); cache.set("c", 3, ttl=10)
+        assert cache.get("a") is NseKit._MISS
+        clock[0] = 111.0
+        assert cache.get("b") is NseKit._MISS
+        assert cache.stats()["size"] == 1
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 24. Single-flight request coalescing (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+@NseKit._cached("live")
+def _slow_frame(self, symbol: str):
+    self.calls.append(symbol)
+    self.gate.wait(5)
+    return pd.DataFrame({"Symbol": [symbol]})
+
+
+class TestSingleFlight:
+    def test_concurrent_identical_calls_share_one_download(self, offline_nse, monkeypatch):
+        monkeypatch.setattr(NseKit.NseConfig, "response_cache", False)
+        gate = threading.Event()
+        nse  = offline_nse(slow_frame=_slow_frame, gate=gate)
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            futures = [pool.submit(nse.slow_frame, "ABC") for _ in range(6)]
+            time.sleep(0.2)
+            gate.set()
+            frames = [f.result() for f in futures]
+        assert nse.calls == ["ABC"]
+        assert all(f["Symbol"].iloc[0] == "ABC" for f in frames)
+        assert len({id(f) for f in frames}) == 6        # every caller gets its own copy
+
+    def test_leader_error_reaches_followers(self):
+        flight  = NseKit._SingleFlight()
+        started = threading.Event()
+
+        def boom():
+            started.set()
+            time.sleep(0.2)
+            raise RuntimeError("down")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "k", boom)
+            started.wait(2)
+            follower = pool.submit(flight.do, "k", boom)
+            for fut in (leader, follower):
+                with pytest.raises(RuntimeError):
+                    fut.result()
+        assert flight._calls == {}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 25. Batched multi-symbol quotes (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _index_stocks(self, category, list_only=False):
+    df = pd.DataFrame({"symbol": ["TCS", "INFY"], "previousClose": [10.0, 20.0],
+                       "lastPrice": [11.0, 21.0], "change": [1.0, 1.0], "pChange": [10.0, 5.0],
+                       "open": [10.0, 20.0], "dayHigh": [12.0, 22.0], "dayLow": [9.0, 19.0]})
+    return df.set_index("symbol", drop=False)
+
+
+def _price_info(self, symbol):
+    with self.lock:
+        self.calls.append(symbol)
+        if symbol in self.flaky:
+            self.flaky.discard(symbol)
+            return None
+    return {"Symbol": symbol, "LastTradedPrice": 100.0, "VWAP": 99.5}
+
+
+class TestPriceInfoMany:
+    @pytest.fixture
+    def quotes(self, offline_nse):
+        """``quotes(flaky)`` — symbols in *flaky* fail on their first quote."""
+        return lambda flaky=(): offline_nse(index_live_indices_stocks_data=_index_stocks,
+                                            cm_live_equity_price_info=_price_info, flaky=set(flaky))
+
+    def test_index_covers_constituents(self, quotes):
+        nse = quotes()
+        df  = nse.cm_live_equity_price_info_many(["tcs", "IRCTC", "INFY", "TCS"])
+        assert df.index.tolist() == ["TCS", "IRCTC", "INFY"]
+        assert nse.calls == ["IRCTC"]
+        assert df.loc["TCS", "Source"] == "index" and df.loc["TCS", "LastTradedPrice"] == 11.0
+        assert df.loc["IRCTC", "Source"] == "quote" and df.loc["IRCTC", "VWAP"] == 99.5
+
+    def test_failed_symbols_retried_independently(self, quotes):
+        nse = quotes(flaky={"B"})
+        df  = nse.cm_live_equity_price_info_many(["A", "B", "C"], index=None, workers=3)
+        assert sorted(nse.calls) == ["A", "B", "B", "C"]
+        assert df["Symbol"].tolist() == ["A", "B", "C"]
+
+    def test_gives_up_after_retries(self, quotes):
+        nse = quotes(flaky={"B"})
+        df  = nse.cm_live_equity_price_info_many(["A", "B"], index=None, retries=0)
+        assert df.index.tolist() == ["A"]
+
+
+def _full_info(self, symbol):
+    with self.lock:
+        self.calls.append(symbol)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+    time.sleep(0.02)
+    with self.lock:
+        self.in_flight -= 1
+        if symbol in self.dead or symbol in self.flaky:
+            self.flaky.discard(symbol)
+            return None
+    return {"Symbol": symbol.lower(), "LastTradedPrice": 100.0, "TotalIssuedShares": float("nan")}
+
+
+class TestFullInfoMany:
+    @pytest.fixture
+    def full_info(self, offline_nse):
+        """``full_info(flaky, dead)`` — *flaky* symbols fail once, *dead* ones always."""
+        return lambda flaky=(), dead=(): offline_nse(
+            cm_live_equity_full_info=_full_info, flaky=set(flaky), dead=set(dead), in_flight=0, peak=0)
+
+    def test_concurrent_in_input_order(self, full_info):
+        nse  = full_info()
+        seen = []
+        df, failed = nse.cm_live_equity_full_info_many(
+            ["c", "A", "B", "D", "A"], workers=4, progress=lambda s, d, n: seen.append((d, n)))
+        assert failed == [] and nse.peak > 1
+        assert df.index.tolist() == ["C", "A", "B", "D"] and df["Symbol"].tolist() == ["C", "A", "B", "D"]
+        assert df["TotalIssuedShares"].isna().all() and df.loc["A", "TotalIssuedShares"] is None
+        assert seen == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    def test_failures_retried_then_reported(self, full_info):
+        nse = full_info(flaky={"B"}, dead={"C"})
+        df, failed = nse.cm_live_equity_full_info_many(["A", "B", "C"], workers=3, retries=1)
+        assert sorted(nse.calls) == ["A", "B", "B", "C", "C"]
+        assert df.index.tolist() == ["A", "B"] and failed == ["C"]
+
+        df, failed = full_info(dead={"A"}).cm_live_equity_full_info_many(["A"], retries=0)
+        assert df is None and failed == ["A"]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 26. Option-chain polling scheduler (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _ChainNse:
+    """Minimal stand-in for Nse used by OptionChainPoller."""
+
+    max_rps = 1000.0
+
+    def __init__(self, open_: bool | None = True):
+        self.open_  = open_
+        self.tick   = 0
+        self.polled: list[str] = []
+
+    def no_cache(self):
+        return NseKit._NoCacheCtx()
+
+    def market_is_open(self, market):
+        return self.open_
+
+    def fno_live_option_chain_raw(self, symbol, expiry_date=None):
+        self.polled.append(symbol)
+        return {"timestamp": f"t{self.tick}", "data": [{"strikePrice": 100}]}
+
+
+class TestOptionChainPoller:
+    def test_priority_index_then_near_expiry(self):
+        nse    = _ChainNse()
+        far    = (datetime.now() + timedelta(days=40)).strftime("%d-%b-%Y")
+        near   = (datetime.now() + timedelta(days=3)).strftime("%d-%b-%Y")
+        poller = NseKit.OptionChainPoller(nse, [("TCS", far), ("INFY", near), ("NIFTY", far)], interval=10)
+        late   = time.monotonic() + 100                # everything overdue
+        for _ in range(3):
+            nse.tick += 1
+            poller.poll_once(late)
+        assert nse.polled == ["NIFTY", "INFY", "TCS"]
+
+    def test_unchanged_snapshot_not_republished(self):
+        nse, seen = _ChainNse(), []
+        poller = NseKit.OptionChainPoller(nse, [("NIFTY", None)], interval=1, callbacks=[seen.append])
+        t0 = time.monotonic()
+        assert poller.poll_once(t0) is not None
+        assert poller.poll_once(t0 + 1) is None        # same NSE timestamp
+        nse.tick += 1
+        assert poller.poll_once(t0 + 2)["symbol"] == "NIFTY"
+        stats = poller.stats().iloc[0]
+        assert (stats["Polls"], stats["Published"], len(seen)) == (3, 2, 2)
+        assert stats["Avg_Refresh"] is not None
+
+    def test_skips_when_market_closed(self):
+        nse    = _ChainNse(open_=False)
+        poller = NseKit.OptionChainPoller(nse, [("NIFTY", None)], interval=1)
+        assert poller.poll_once(time.monotonic() + 5) is None
+        assert nse.polled == [] and poller.stats()["Skipped"].iloc[0] == 1
+
+    def test_thread_publishes_to_asyncio_queue(self):
+        import asyncio
+
+        async def main():
+            queue  = asyncio.Queue()
+            poller = NseKit.OptionChainPoller(_ChainNse(), [("NIFTY", None)], interval=0.05, queue=queue)
+            with poller:
+                snap = await asyncio.wait_for(queue.get(), timeout=5)
+            return snap
+
+        snap = asyncio.run(main())
+        assert snap["symbol"] == "NIFTY" and snap["data"]["timestamp"] == "t0"
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 27. Incremental option chain (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _chain_payload(rows, ts="t"):
+    return {"timestamp": ts, "underlyingValue": 100.0,
+            "data": [{"strikePrice": k, "CE": {"openInterest": c, "lastPrice": 1.5},
+                      "PE": {"openInterest": p}} for k, c, p in rows]}
+
+
+class TestIncrementalOptionChain:
+    def test_only_moved_strikes_returned(self):
+        chain = NseKit.IncrementalOptionChain("NIFTY")
+        first = chain.apply(_chain_payload([(100, 10, 5), (110, 20, 8)]))
+        assert first.index.tolist() == [100.0, 110.0]
+
+        moved = chain.apply(_chain_payload([(100, 12, 5), (110, 20, 8), (120, 1, 1)]))
+        assert moved.index.tolist() == [100.0, 120.0]
+        assert moved.loc[100.0, "CALLS_OI_Delta"] == 2.0
+        assert moved.loc[120.0, "PUTS_OI_Delta"] == 1.0
+        assert chain.pcr == round(14 / 33, 4)
+
+    def test_removed_strike_reported_at_zero(self):
+        chain = NseKit.IncrementalOptionChain()
+        chain.apply(_chain_payload([(100, 10, 5), (110, 20, 8)]))
+        moved = chain.apply(_chain_payload([(100, 10, 5)]))
+        assert moved.index.tolist() == [110.0]
+        assert moved.loc[110.0, "CALLS_OI"] == 0.0 and moved.loc[110.0, "CALLS_OI_Delta"] == -20.0
+        assert (chain.call_oi, chain.put_oi) == (10.0, 5.0)
+
+    def test_unchanged_payload_is_empty_diff(self):
+        chain = NseKit.IncrementalOptionChain()
+        chain.apply(_chain_payload([(100, 10, 5)]))
+        assert chain.apply(_chain_payload([(100, 10, 5)])).empty
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 28. Typed F&O bhavcopy parser (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _fo_bhav_zip() -> bytes:
+    import io
+    import zipfile
+
+    import bench_nsekit
+
+    rows = [
+        "2025-10-17,2025-10-17,FO,NSE,STO,1,,ABC,,2025-10-28,2025-10-28,100,CE,ABC,1,2,1,1.5,1.5,1,99,1.5,500,50,20,3000.5,4,F1,50,,,,,",
+        "2025-10-17,2025-10-17,FO,NSE,IDO,2,,NIFTY,,2025-10-28,2025-10-28,25000,PE,NIFTY,1,2,1,2.5,2.5,1,25010,2.5,900,-10,90,9000,8,F1,75,,,,,",
+        "2025-10-17,2025-10-17,FO,NSE,STO,3,,ABC,,2025-11-25,2025-11-25,110,PE,ABC,0,0,0,0,0,0,99,0,0,0,0,0,0,F1,50,,,,,",
+    ]
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("BhavCopy_NSE_FO_0_0_0_20251017_F_0000.csv",
+                    bench_nsekit._FO_HEADER + "\n" + "\n".join(rows) + "\n")
+    return buf.getvalue()
+
+
+class TestTypedFoBhavcopy:
+    @pytest.mark.parametrize("arrow", [True, False])
+    def test_schema_and_projection(self, monkeypatch, arrow):
+        if not arrow:
+            monkeypatch.setattr(NseKit, "_pyarrow_csv", lambda: None)
+        elif NseKit._pyarrow_csv() is None:
+            pytest.skip("pyarrow not installed")
+        df = NseKit._read_fo_bhav_zip(_fo_bhav_zip(), columns=["TckrSymb", "XpryDt", "OpnIntrst", "Nope"])
+        assert df.columns.tolist() == ["TckrSymb", "XpryDt", "OpnIntrst"]
+        assert isinstance(df["TckrSymb"].dtype, pd.CategoricalDtype)
+        assert str(df["XpryDt"].dtype) == "datetime64[ns]"
+        assert df["OpnIntrst"].dtype == "float64" and df["OpnIntrst"].sum() == 1400.0
+
+    def test_fno_eod_bhav_copy_typed_filters_and_archives(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(NseKit.NseConfig, "archive_dir", str(tmp_path))
+        nse   = object.__new__(NseKit.Nse)
+        calls = []
+        nse._fno_bhav_zip = lambda d: calls.append(d) or _fo_bhav_zip()
+
+        full = nse.fno_eod_bhav_copy("17-10-2025", typed=True)
+        assert full["TckrSymb"].tolist() == ["NIFTY", "ABC"]       # zero row dropped, volume-sorted
+        proj = nse.fno_eod_bhav_copy("17-10-2025", columns=["TckrSymb", "OptnTp"])
+        assert proj.columns.tolist() == ["TckrSymb", "OptnTp"]
+        assert calls == ["17-10-2025"]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 29. Columnar option-chain builder (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class TestOptionChainBuilder:
+    @pytest.mark.parametrize("oi_mode", ["full", "compact"])
+    def test_matches_row_loop_builder(self, oi_mode):
+        import bench_nsekit
+
+        payload = bench_nsekit.make_option_chain_payload(40)
+        payload["data"][3]["CE"]["totalBuyQuantity"] = 0          # falls back to level-1 qty
+        payload["data"][4]["PE"]["lastPrice"] = None
+        pd.testing.assert_frame_equal(
+            bench_nsekit._legacy_option_chain(payload, oi_mode),
+            bench_nsekit._columnar_option_chain(payload, oi_mode),
+        )
+
+    def test_active_contracts_list_and_frame(self, monkeypatch):
+        nse = object.__new__(NseKit.Nse)
+        nse.headers, nse.retries, nse.retry_delay = {}, 1, 0
+        contracts = [
+            {"instrumentType": "OPTIDX", "expiryDate": "28-Oct-2025", "optionType": "CE",
+             "strikePrice": " 25000 ", "lastPrice": 12.5, "totalTurnover": 1_234_567, "openInterest": 10},
+            {"instrumentType": "OPTIDX", "expiryDate": "25-Nov-2025", "optionType": "PE",
+             "strikePrice": 24000, "totalTurnover": 0},
+        ]
+
+        class _Resp:
+            def json(self):
+                return {"data": contracts}
+
+        nse._warm_and_fetch = lambda *a, **k: _Resp()
+        rows = nse.fno_live_active_contracts("NIFTY", expiry_date="28-Oct-2025")
+        assert len(rows) == 1
+        assert list(rows[0]) == list(NseKit.Nse._ACTIVE_CONTRACT_COLS)
+        assert rows[0]["Strike Price"] == "25000" and rows[0]["Value (₹ Lakhs)"] == 12.35
+        assert rows[0]["OI"] == 10 and rows[0]["VWAP"] == 0
+
+        df = nse.fno_live_active_contracts("NIFTY", as_frame=True)
+        assert df.columns.tolist() == list(NseKit.Nse._ACTIVE_CONTRACT_COLS) and len(df) == 2
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 30. Bulk option history (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+@NseKit._cached("hist")
+def _cpv_expiry_dates(self, instrument, symbol, year):
+    self.meta.append((instrument, symbol, year))
+    return ("07-Oct-2025", "28-Oct-2025")
+
+
+def _option_cpv(self, params):
+    """foCPV reply covering strikes 400/420, both sides, two days; see ``grouped``."""
+    with self.lock:
+        self.calls.append(dict(params))
+    rows = [
+        {"FH_SYMBOL": params["symbol"], "FH_TIMESTAMP": day, "FH_STRIKE_PRICE": str(k),
+         "FH_OPTION_TYPE": t, "FH_CLOSING_PRICE": k / 100}
+        for day in ("02-Oct-2025", "01-Oct-2025") for k in (400, 420) for t in ("CE", "PE")
+        if params.get("strikePrice") in (None, str(k)) and params.get("optionType") in (None, t)
+    ]
+    df = pd.DataFrame(rows)
+    if "strikePrice" in params or self.grouped == "split":
+        return df
+    return df.drop(columns="FH_STRIKE_PRICE") if self.grouped == "unsplittable" else pd.DataFrame()
+
+
+class TestOptionHistoryMany:
+    CONTRACTS = [
+        ("ITC", "Stock Options", 420, "CE", "28-10-2025"),
+        ("ITC", "Stock Options", 400, "PE", "28-Oct-2025"),
+        ("NIFTY", "Index", 400, "CE", "OCT-25"),
+        ("NIFTY", "Index", 420, "CE", "OCT-25"),
+        ("TCS", "stock", 400, "PE", "28-10-2025"),
+    ]
+
+    @pytest.fixture
+    def cpv(self, offline_nse):
+        """``cpv(grouped)`` — reply to strike-less requests: "split", "unsplittable" or "empty"."""
+        return lambda grouped="split": offline_nse(_fo_expiry_dates=_cpv_expiry_dates,
+                                                   _option_cpv=_option_cpv, grouped=grouped, meta=[])
+
+    def test_grouped_by_symbol_and_expiry(self, cpv):
+        nse = cpv()
+        df  = nse.option_price_volume_data_many(self.CONTRACTS, from_date="01-10-2025")
+        assert nse.meta == [("OPTIDX", "NIFTY", 2025)]
+        assert len(nse.calls) == 3
+        by_sym = {r["symbol"]: r for r in nse.calls}
+        assert "strikePrice" not in by_sym["ITC"] and "optionType" not in by_sym["ITC"]
+        assert by_sym["NIFTY"]["optionType"] == "CE" and by_sym["NIFTY"]["expiryDate"] == "28-Oct-2025"
+        assert by_sym["TCS"]["strikePrice"] == "400" and by_sym["TCS"]["optionType"] == "PE"
+
+        assert list(df.columns[:5]) == ["Symbol", "Instrument", "Expiry", "Strike", "OptionType"]
+        keys = df[["Symbol", "Strike", "OptionType"]].drop_duplicates().values.tolist()
+        assert keys == [["ITC", 420.0, "CE"], ["ITC", 400.0, "PE"], ["NIFTY", 400.0, "CE"],
+                        ["NIFTY", 420.0, "CE"], ["TCS", 400.0, "PE"]]
+        assert len(df) == 10
+        assert df["FH_TIMESTAMP"].tolist()[:2] == ["01-Oct-2025", "02-Oct-2025"]
+
+    @pytest.mark.parametrize("grouped", ["unsplittable", "empty"])
+    def test_group_falls_back_per_contract(self, cpv, grouped):
+        nse = cpv(grouped)
+        df  = nse.option_price_volume_data_many(self.CONTRACTS[:2], workers=1)
+        assert [r.get("strikePrice") for r in nse.calls] == [None, "420", "400"]
+        assert df.groupby(["Strike", "OptionType"]).size().to_dict() == {(400.0, "PE"): 2, (420.0, "CE"): 2}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 31. Contract history from archived bhavcopies (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class TestEodContractHistory:
+    CONTRACTS = [
+        ("ABC", "Stock Options", 100, "CE", "28-10-2025"),
+        ("NIFTY", "index", 25000, "PE", "OCT-25"),
+        ("XYZ", "stock", 1, "CE", "28-10-2025"),
+    ]
+
+    @pytest.fixture(params=["parquet", "pkl"])
+    def nse(self, request, tmp_path, monkeypatch):
+        """Archive holds 13–16 Oct 2025; 17 Oct is only available 'online'."""
+        if request.param == "pkl":
+            monkeypatch.setattr(NseKit, "_parquet_available", lambda: False)
+        elif not NseKit._parquet_available():
+            pytest.skip("no parquet engine")
+        monkeypatch.setattr(NseKit.NseConfig, "archive_dir", str(tmp_path))
+        nse = object.__new__(NseKit.Nse)
+        nse.calls = []
+        nse._fno_bhav_zip = lambda d: nse.calls.append(d) or _fo_bhav_zip()
+        nse.trading_calendar = lambda *a, **k: NseKit.TradingCalendar()
+        day = NseKit._read_fo_bhav_zip(_fo_bhav_zip())
+        for n, d in enumerate(("2025-10-13", "2025-10-14", "2025-10-15", "2025-10-16")):
+            nse.archive.put("fno_bhavcopy_typed", d,
+                            day.assign(TradDt=pd.Timestamp(d), OpnIntrst=day["OpnIntrst"] + n))
+        return nse
+
+    def test_reads_archive_and_fetches_missing_dates(self, nse):
+        df = nse.fno_eod_contract_history(self.CONTRACTS, "13-10-2025", "17-10-2025")
+        assert nse.calls == ["17-10-2025"]
+        assert list(df.columns[:5]) == ["Symbol", "Instrument", "Expiry", "Strike", "OptionType"]
+        assert df.groupby(["Symbol", "Expiry", "Strike", "OptionType"], sort=False).size().to_dict() == {
+            ("ABC", "28-Oct-2025", 100.0, "CE"): 5, ("NIFTY", "28-Oct-2025", 25000.0, "PE"): 5,
+        }
+        abc = df[df["Symbol"] == "ABC"]
+        assert abc["FH_TIMESTAMP"].tolist() == ["13-Oct-2025", "14-Oct-2025", "15-Oct-2025",
+                                                "16-Oct-2025", "17-Oct-2025"]
+        assert abc["FH_OPEN_INT"].tolist() == [500.0, 501.0, 502.0, 503.0, 500.0]
+        assert set(df["FH_INSTRUMENT"]) == {"OPTSTK", "OPTIDX"}
+
+    def test_archive_only_and_futures(self, nse):
+        df = nse.fno_eod_contract_history(self.CONTRACTS[:1], "13-10-2025", "17-10-2025",
+                                          fetch_missing=False)
+        assert nse.calls == [] and len(df) == 4
+        assert nse.fno_eod_contract_history([("ABC", "Stock Futures", None, None, "28-10-2025")],
+                                            "13-10-2025", "17-10-2025", fetch_missing=False) is None
+
+    def test_reads_untyped_bhavcopies(self, nse):
+        nse.fno_eod_bhav_copy("17-10-2025")                 # archived under "fno_bhavcopy"
+        nse.calls.clear()
+        df = nse.fno_eod_contract_history(self.CONTRACTS[:2], "13-10-2025", "17-10-2025",
+                                          fetch_missing=False)
+        assert nse.calls == []
+        abc = df[df["Symbol"] == "ABC"]
+        assert abc["FH_TIMESTAMP"].tolist()[-1] == "17-Oct-2025"
+        assert abc["FH_OPEN_INT"].tolist() == [500.0, 501.0, 502.0, 503.0, 500.0]
+        assert len(df[df["Symbol"] == "NIFTY"]) == 5
+
+    def test_missing_day_downloads_are_throttled(self, nse):
+        del nse._fno_bhav_zip                               # real downloader, fake session
+        nse.archive.clear()
+        tokens, fetched, lock = [0], [], threading.Lock()
+
+        def throttle():
+            with lock:
+                tokens[0] += 1
+
+        def get(url, **kw):
+            with lock:
+                tokens[0] -= 1
+                fetched.append(tokens[0] >= 0)
+            return types.SimpleNamespace(status_code=200, content=_fo_bhav_zip())
+
+        nse.headers   = {}
+        nse._throttle = throttle
+        nse.session   = types.SimpleNamespace(get=get)
+        df = nse.fno_eod_contract_history(self.CONTRACTS[:1], "13-10-2025", "17-10-2025", workers=4)
+        assert len(fetched) == 5 and all(fetched) and tokens[0] == 0
+        assert len(df) == 5
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 32. Shared HTTP transport (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class TestSharedTransport:
+    URL = "https://www.nseindia.com/api/quote-equity"
+
+    def test_sessions_share_one_pool(self):
+        a, b = NseKit._new_session(), NseKit._new_session()
+        assert a is not b
+        adapter = a.get_adapter(self.URL)
+        assert adapter is b.get_adapter(self.URL)
+        assert adapter is a.get_adapter("https://nsearchives.nseindia.com/content/x.csv")
+        assert adapter._pool_maxsize == NseKit.NseConfig.pool_maxsize
+
+    def test_pool_follows_config(self, monkeypatch):
+        monkeypatch.setattr(NseKit.NseConfig, "pool_maxsize", 32)
+        adapter = NseKit._new_session().get_adapter(self.URL)
+        assert adapter._pool_maxsize == 32
+        assert adapter is NseKit._new_session().get_adapter(self.URL)
+
+    def test_http2_falls_back_without_httpx(self, monkeypatch):
+        monkeypatch.setattr(NseKit.NseConfig, "http2", True)
+        monkeypatch.setattr(NseKit, "_httpx", lambda: None)
+        assert isinstance(NseKit._new_session(), NseKit.requests.Session)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 33. Async request coalescing (no network)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class TestAsyncSingleFlight:
+    @pytest.fixture
+    def nka(self, monkeypatch):
+        monkeypatch.syspath_prepend(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Async"))
+        return pytest.importorskip("NseKitAsync")       # needs aiohttp
+
+    @pytest.fixture
+    def api(self, nka):
+        """An AsyncNse plus a decorated fetch that blocks on ``gate``."""
+        nse   = nka.AsyncNse(min_gap=0.0)
+        calls = []
+
+        @nka.nse_api(ttl=60)
+        async def fetch(self, symbol):
+            calls.append(symbol)
+            await self.gate.wait()
+            return {"symbol": symbol, "n": len(calls)}
+
+        return nse, fetch, calls
+
+    def test_identical_calls_share_one_download(self, api):
+        nse, fetch, calls = api
+
+        async def main():
+            nse.gate = asyncio.Event()
+            tasks = [asyncio.create_task(fetch(nse, "ABC")) for _ in range(5)]
+            await asyncio.sleep(0.05)
+            nse.gate.set()
+            return await asyncio.gather(*tasks), await fetch(nse, "ABC")
+
+        results, later = asyncio.run(main())
+        assert calls == ["ABC"] and nse._coalesced == 4
+        assert all(r == {"symbol": "ABC", "n": 1} for r in results) and later == results[0]
+        assert nse._inflight == {}
+
+    def test_cache_written_before_inflight_entry_dropped(self, api, monkeypatch):
+        nse, fetch, _ = api
+        seen, store = [], type(nse._cache).set
+
+        async def spy(cache, key, value, ttl):
+            seen.append(key in nse._inflight)
+            await store(cache, key, value, ttl)
+
+        async def main():
+            nse.gate = asyncio.Event()
+            nse.gate.set()
+            return await fetch(nse, "ABC")
+
+        monkeypatch.setattr(type(nse._cache), "set", spy)
+
+        assert asyncio.run(main())["symbol"] == "ABC"
+        assert seen == [True] and nse._inflight == {}
+
+    def test_cancelled_leader_hands_over_to_follower(self, api):
+        nse, fetch, calls = api
+
+        async def main():
+            nse.gate = asyncio.Event()
+            leader   = asyncio.create_task(fetch(nse, "ABC"))
+            await asyncio.sleep(0.05)
+            follower = asyncio.create_task(fetch(nse, "ABC"))
+            await asyncio.sleep(0.05)
+            leader.cancel()
+            await asyncio.sleep(0.05)
+            nse.gate.set()
+            return await follower, leader.cancelled()
+
+        result, cancelled = asyncio.run(main())
+        assert cancelled and calls == ["ABC", "ABC"]
+        assert result == {"symbol": "ABC", "n": 2}
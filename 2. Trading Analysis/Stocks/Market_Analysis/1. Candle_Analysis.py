@@ -1,8 +1,8 @@
 # pip install NseKit pandas gspread google-auth pytz schedule
 
-from NseKit import Nse
+from NseKit import Nse, TradingCalendar
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 import pytz
 import time as sys_time
 import schedule
@@ -36,20 +36,10 @@ def run_tasks():
     # =====================================================
     # TRADING DAY LOGIC
     # =====================================================
-    holiday_list = nse.nse_trading_holidays(list_only=True)
-    holidays = set(pd.to_datetime(holiday_list, format='%d-%b-%Y', errors='coerce').date)
+    calendar = nse.trading_calendar() or TradingCalendar()              # Holiday master fetched once a day, cached on disk (weekends only if unavailable)
 
-    def get_prev_trading_day(d):
-        d -= timedelta(days=1)
-        while d.weekday() >= 5 or d in holidays:
-            d -= timedelta(days=1)
-        return d
-
-    today = datetime.now(IST).date()
-    while today.weekday() >= 5 or today in holidays:
-        today -= timedelta(days=1)
-
-    pdate = get_prev_trading_day(today)
+    today = calendar.last_trading_day(datetime.now(IST).date())
+    pdate = calendar.prev_trading_day(today)
 
     date_str  = today.strftime('%d-%m-%Y')
     pdate_str = pdate.strftime('%d-%m-%Y')
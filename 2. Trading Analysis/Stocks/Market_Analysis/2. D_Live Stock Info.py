@@ -92,28 +92,13 @@ def build_universe():
 
     AUTO_DATE           = True                                                  # True = auto (today), False = manual
     
-    holiday_list = get.nse_trading_holidays(list_only=True)                         # NSE trading holidays (as datetime.date objects)
-    holidays = set(pd.to_datetime(holiday_list, format='%d-%b-%Y', errors='coerce').date)
-
-    def get_next_trading_day(start_date, direction="forward"):                  # Find next valid NSE trading day, skipping weekends & holidays
-        step = 1 if direction == "forward" else -1
-        d = start_date + timedelta(days=step)
-        while d.weekday() >= 5 or d in holidays:                                # Sat=5, Sun=6
-            d += timedelta(days=step)
-        return d
-
-    def get_current_trading_day(start_date):                                    # Return last valid trading day if today is weekend/holiday
-        d = start_date
-        while d.weekday() >= 5 or d in holidays:                                # adjust back to last trading day
-            d -= timedelta(days=1)
-        return d
+    calendar = get.trading_calendar() or NseKit.TradingCalendar()               # Offline NSE calendar (holiday master fetched once a day; weekends only if unavailable)
 
     if AUTO_DATE:
-        today_dt = datetime.now().date()
-        current_trading_day = get_current_trading_day(today_dt)                  # Adjust today's date to last valid trading day (T)
+        current_trading_day = calendar.last_trading_day()                       # Adjust today's date to last valid trading day (T)
         # date  = current_trading_day.strftime('%d-%m-%Y')                         # T (last valid trading day)
-        pdate = get_next_trading_day(current_trading_day, "backward").strftime('%d-%m-%Y')  # T-1
-        # ndate = get_next_trading_day(current_trading_day, "forward").strftime('%d-%m-%Y')   # T+1
+        pdate = calendar.prev_trading_day(current_trading_day, fmt='%d-%m-%Y')  # T-1
+        # ndate = calendar.next_trading_day(current_trading_day, fmt='%d-%m-%Y')  # T+1
         
 
     else:
@@ -510,7 +495,6 @@ print(f"Total F&O Symbols: {len(fno_symbols)}\n")
 
 import NseKit
 from tqdm import tqdm
-import time
 import csv
 import os
 from datetime import datetime
@@ -524,9 +508,8 @@ from google.oauth2.service_account import Credentials
 # INDEX_NAME          = "SECURITIES IN F&O"    # "SECURITIES IN F&O"
 RESULT_SAVE_MODE    = "GSHEET"      # SAVE MODE → "CSV" | "GSHEET" | "BOTH"
 
-DELAY               = 0.3
+WORKERS             = 4         # Concurrent requests (shared max_rps budget)
 MAX_RETRIES         = 3
-RETRY_DELAY         = 1.0
 RESULT_FOLDER       = "universe"
 
 if RESULT_SAVE_MODE in ("CSV", "BOTH"):
@@ -597,42 +580,39 @@ failed_stocks = []
 # =====================================================
 # FETCH DATA
 # =====================================================
-for symbol in tqdm(symbols, desc="Fetching NSE Equity Data"):
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            data = get.cm_live_equity_full_info(symbol)
-            raw_data.append(data)
-
-            total_issued = data.get("TotalIssuedShares", 0)
-
-            screen_rows.append({
-                "Symbol": symbol,
-                "LTP": data.get("LastTradedPrice"),
-                "CHG": data.get("Change"),
-                "%CHG": data.get("PercentChange"),
-                "VWAP": data.get("VWAP"),
-                "VOLUME": format_large_number(data.get("TotalTradedVolume")),
-                "VALUE": format_large_number(data.get("TotalTradedValue")),
-                "DEL%": data.get("DeliveryPercent"),
-                "BUYQ": format_large_number(data.get("TotalBuyQuantity")),
-                "SELLQ": format_large_number(data.get("TotalSellQuantity")),
-                "BUYQ%": data.get("BuyQuantity%"),
-                "SELLQ%": data.get("SellQuantity%"),
-                "TVOL%": percent_of_total(data.get("TotalTradedVolume"), total_issued),
-                "TDEL_Q%": percent_of_total(data.get("DeliveryQty"), total_issued),
-                "TBUYQ%": percent_of_total(data.get("TotalBuyQuantity"), total_issued),
-                "TSELLQ%": percent_of_total(data.get("TotalSellQuantity"), total_issued),
-                "Industry": data.get("BasicIndustry")
-            })
-
-            time.sleep(DELAY)
-            break
-
-        except Exception as e:
-            if attempt == MAX_RETRIES:
-                failed_stocks.append(symbol)
-                print(f"FAILED {symbol} → {e}")
-            time.sleep(RETRY_DELAY)
+# Parallel fan-out: runs at the client's max_rps, retries failed symbols itself
+progress_bar = tqdm(total=len(symbols), desc="Fetching NSE Equity Data")
+df_info, failed_stocks = get.cm_live_equity_full_info_many(
+    symbols, workers=WORKERS, retries=MAX_RETRIES - 1,
+    progress=lambda symbol, done, total: progress_bar.update(1),
+)
+progress_bar.close()
+
+if df_info is not None:
+    raw_data = df_info.to_dict("records")
+
+for data in raw_data:
+    total_issued = data.get("TotalIssuedShares", 0)
+
+    screen_rows.append({
+        "Symbol": data["Symbol"],
+        "LTP": data.get("LastTradedPrice"),
+        "CHG": data.get("Change"),
+        "%CHG": data.get("PercentChange"),
+        "VWAP": data.get("VWAP"),
+        "VOLUME": format_large_number(data.get("TotalTradedVolume")),
+        "VALUE": format_large_number(data.get("TotalTradedValue")),
+        "DEL%": data.get("DeliveryPercent"),
+        "BUYQ": format_large_number(data.get("TotalBuyQuantity")),
+        "SELLQ": format_large_number(data.get("TotalSellQuantity")),
+        "BUYQ%": data.get("BuyQuantity%"),
+        "SELLQ%": data.get("SellQuantity%"),
+        "TVOL%": percent_of_total(data.get("TotalTradedVolume"), total_issued),
+        "TDEL_Q%": percent_of_total(data.get("DeliveryQty"), total_issued),
+        "TBUYQ%": percent_of_total(data.get("TotalBuyQuantity"), total_issued),
+        "TSELLQ%": percent_of_total(data.get("TotalSellQuantity"), total_issued),
+        "Industry": data.get("BasicIndustry")
+    })
 
 # =====================================================
 # TERMINAL OUTPUT
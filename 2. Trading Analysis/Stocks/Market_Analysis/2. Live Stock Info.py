@@ -4,7 +4,6 @@
 
 import NseKit
 from tqdm import tqdm
-import time
 import csv
 import os
 from datetime import datetime
@@ -18,9 +17,8 @@ from google.oauth2.service_account import Credentials
 INDEX_NAME          = "SECURITIES IN F&O"    # "SECURITIES IN F&O"
 RESULT_SAVE_MODE    = "BOTH"      # SAVE MODE → "CSV" | "GSHEET" | "BOTH"
 
-DELAY               = 0.3
+WORKERS             = 4         # Concurrent requests (shared max_rps budget)
 MAX_RETRIES         = 3
-RETRY_DELAY         = 1.0
 RESULT_FOLDER       = "Result"
 
 if RESULT_SAVE_MODE in ("CSV", "BOTH"):
@@ -91,42 +89,39 @@ failed_stocks = []
 # =====================================================
 # FETCH DATA
 # =====================================================
-for symbol in tqdm(stocks, desc="Fetching NSE Equity Data"):
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            data = get.cm_live_equity_full_info(symbol)
-            raw_data.append(data)
-
-            total_issued = data.get("TotalIssuedShares", 0)
-
-            screen_rows.append({
-                "Symbol": symbol,
-                "LTP": data.get("LastTradedPrice"),
-                "CHG": data.get("Change"),
-                "%CHG": data.get("PercentChange"),
-                "VWAP": data.get("VWAP"),
-                "VOLUME": format_large_number(data.get("TotalTradedVolume")),
-                "VALUE": format_large_number(data.get("TotalTradedValue")),
-                "DEL%": data.get("DeliveryPercent"),
-                "BUYQ": format_large_number(data.get("TotalBuyQuantity")),
-                "SELLQ": format_large_number(data.get("TotalSellQuantity")),
-                "BUYQ%": data.get("BuyQuantity%"),
-                "SELLQ%": data.get("SellQuantity%"),
-                "TVOL%": percent_of_total(data.get("TotalTradedVolume"), total_issued),
-                "TDEL_Q%": percent_of_total(data.get("DeliveryQty"), total_issued),
-                "TBUYQ%": percent_of_total(data.get("TotalBuyQuantity"), total_issued),
-                "TSELLQ%": percent_of_total(data.get("TotalSellQuantity"), total_issued),
-                "Industry": data.get("BasicIndustry")
-            })
-
-            time.sleep(DELAY)
-            break
-
-        except Exception as e:
-            if attempt == MAX_RETRIES:
-                failed_stocks.append(symbol)
-                print(f"FAILED {symbol} → {e}")
-            time.sleep(RETRY_DELAY)
+# Parallel fan-out: runs at the client's max_rps, retries failed symbols itself
+progress_bar = tqdm(total=len(stocks), desc="Fetching NSE Equity Data")
+df_info, failed_stocks = get.cm_live_equity_full_info_many(
+    stocks, workers=WORKERS, retries=MAX_RETRIES - 1,
+    progress=lambda symbol, done, total: progress_bar.update(1),
+)
+progress_bar.close()
+
+if df_info is not None:
+    raw_data = df_info.to_dict("records")
+
+for data in raw_data:
+    total_issued = data.get("TotalIssuedShares", 0)
+
+    screen_rows.append({
+        "Symbol": data["Symbol"],
+        "LTP": data.get("LastTradedPrice"),
+        "CHG": data.get("Change"),
+        "%CHG": data.get("PercentChange"),
+        "VWAP": data.get("VWAP"),
+        "VOLUME": format_large_number(data.get("TotalTradedVolume")),
+        "VALUE": format_large_number(data.get("TotalTradedValue")),
+        "DEL%": data.get("DeliveryPercent"),
+        "BUYQ": format_large_number(data.get("TotalBuyQuantity")),
+        "SELLQ": format_large_number(data.get("TotalSellQuantity")),
+        "BUYQ%": data.get("BuyQuantity%"),
+        "SELLQ%": data.get("SellQuantity%"),
+        "TVOL%": percent_of_total(data.get("TotalTradedVolume"), total_issued),
+        "TDEL_Q%": percent_of_total(data.get("DeliveryQty"), total_issued),
+        "TBUYQ%": percent_of_total(data.get("TotalBuyQuantity"), total_issued),
+        "TSELLQ%": percent_of_total(data.get("TotalSellQuantity"), total_issued),
+        "Industry": data.get("BasicIndustry")
+    })
 
 # =====================================================
 # TERMINAL OUTPUT
@@ -1,160 +1,124 @@
 import os
-import yfinance as yf
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import pickle
-from datetime import datetime, timedelta
+from datetime import datetime
 from tqdm import tqdm
+from ohlcv_store import OHLCVStore
 import shutil
 
 pd.set_option('future.no_silent_downcasting', True)
 
-# Settings
-DATA_CACHE_DIR = "data_cache"
-CACHE_FILE = os.path.join(DATA_CACHE_DIR, "stock_data_max.pkl")
-
-def get_data(symbol, cache, interval="1d", period="6mo"):
-    """Fetch data using pre-loaded cache: downloads 'max' if missing and slices by period."""
-    needs_download = False
-    if symbol not in cache:
-        needs_download = True
-    else:
-        last_date = cache[symbol].index[-1]
-        if datetime.now() - last_date > timedelta(days=1):
-            needs_download = True
-
-    if needs_download:
-        df = yf.download(symbol, interval=interval, period="max", auto_adjust=False, progress=False, multi_level_index=False)
-        if not df.empty:
-            cache[symbol] = df
-            # Save cache after each download to avoid losing progress
-            if not os.path.exists(DATA_CACHE_DIR): os.makedirs(DATA_CACHE_DIR)
-            with open(CACHE_FILE, 'wb') as f:
-                pickle.dump(cache, f)
-        else:
-            return pd.DataFrame()
-
-    df = cache[symbol]
-    
-    period_map = {
-        "1mo": 30, "3mo": 90, "6mo": 180, "1y": 365, "2y": 730, "5y": 1825, "10y": 3650, "max": 99999
-    }
-    
-    if period in period_map:
-        days = period_map[period]
-        start_date = df.index[-1] - timedelta(days=days)
-        df = df[df.index >= start_date]
-    
-    return df
-
-def momentum_squeeze_vectorized(df):
-    """Vectorized Momentum Squeeze calculation with Practical Interpretation."""
+def linreg_endpoint(source, length):
+    """
+    Rolling linear-regression value at the last bar of each window
+    (TradingView linreg(source, length, 0)) for a 1-D or 2-D (dates x symbols) array.
+    The fitted endpoint is a fixed linear combination of the window, so it is one
+    dot product over a sliding-window view instead of a Python callback per bar.
+    """
+    source = np.asarray(source, dtype=float)
+    n = length
+    x = np.arange(n)
+    x_sum = x.sum()
+    denominator = n * (x**2).sum() - x_sum**2
+    weights = 1 / n + (n * x - x_sum) / denominator * ((n - 1) - x_sum / n)
+
+    out = np.full(source.shape, np.nan)
+    if len(source) >= n:
+        windows = sliding_window_view(source, n, axis=0)   # (T-n+1, [K,] n)
+        out[n - 1:] = windows @ weights
+    return out
+
+def momentum_squeeze_vectorized(df, length=20, multKC=1.5):
+    """
+    Vectorized Momentum Squeeze calculation with Practical Interpretation.
+
+    df is either one symbol's OHLC frame or a panel with (field, symbol) column
+    MultiIndex, e.g. yf.download(list_of_symbols). A panel is scored in one call
+    and returned with the same (field, symbol) layout.
+    """
     if df.empty: return pd.DataFrame()
 
-    length = 20
-    multKC = 1.5
-    
-    high = df['High']
-    low = df['Low']
-    close = df['Close']
+    panel = isinstance(df.columns, pd.MultiIndex)
+    if panel:
+        high, low, close = df['High'], df['Low'], df['Close']
+    else:
+        high, low, close = df[['High']], df[['Low']], df[['Close']]
 
     # Bollinger Bands (Matching original code: mult=1.5)
     basis = close.rolling(length).mean()
-    dev = multKC * close.rolling(length).std() 
-    upperBB = basis + dev
-    lowerBB = basis - dev
+    dev = multKC * close.rolling(length).std()
+    upperBB = (basis + dev).to_numpy()
+    lowerBB = (basis - dev).to_numpy()
 
     # Keltner Channels (Matching original code)
-    ma = close.rolling(length).mean()
-    tr = pd.concat([
-        high - low,
-        (high - close.shift()).abs(),
-        (low - close.shift()).abs()
-    ], axis=1).max(axis=1)
-    
-    rangema = tr.rolling(length).mean()
+    prev_close = close.shift().to_numpy()
+    h, l = high.to_numpy(dtype=float), low.to_numpy(dtype=float)
+    tr = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+
+    rangema = pd.DataFrame(tr, index=close.index).rolling(length).mean().to_numpy()
+    ma = basis.to_numpy()
     upperKC = ma + (rangema * multKC)
     lowerKC = ma - (rangema * multKC)
 
     # Squeeze Conditions (Matching original code)
     sqzOn = (lowerBB > lowerKC) & (upperBB < upperKC)
     sqzOff = (lowerBB < lowerKC) & (upperBB > upperKC)
-    noSqz = (~sqzOn) & (~sqzOff)
-    
+    sqzOn_prev = np.vstack([np.zeros((1, sqzOn.shape[1]), dtype=bool), sqzOn[:-1]])
+
     # Momentum (Linear Regression)
-    highest_high = high.rolling(length).max()
-    lowest_low = low.rolling(length).min()
+    highest_high = high.rolling(length).max().to_numpy()
+    lowest_low = low.rolling(length).min().to_numpy()
     mid1 = (highest_high + lowest_low) / 2
-    mid2 = (mid1 + close.rolling(length).mean()) / 2
-    momentum_source = close - mid2
-
-    n = length
-    x = np.arange(n)
-    x_sum = x.sum()
-    x2_sum = (x**2).sum()
-    denominator = n * x2_sum - x_sum**2
-
-    def get_linreg_val(y):
-        y_sum = y.sum()
-        xy_sum = (x * y).sum()
-        m = (n * xy_sum - x_sum * y_sum) / denominator
-        c = (y_sum - m * x_sum) / n
-        return m * (n - 1) + c
+    mid2 = (mid1 + ma) / 2
+    momentum_source = close.to_numpy(dtype=float) - mid2
 
-    val = momentum_source.rolling(length).apply(get_linreg_val, raw=True)
-    val_prev = val.shift(1)
+    val = linreg_endpoint(momentum_source, length)
+    val_prev = np.vstack([np.full((1, val.shape[1]), np.nan), val[:-1]])
 
     # Colors and Interpretation (Matching original levels)
-    hist_color = np.where(val > 0, 
+    hist_color = np.where(val > 0,
                           np.where(val > val_prev, "lime", "green"),
-                          np.where(val < val_prev, "red", "maroon"))
-    
-    dot_color = np.empty(len(df), dtype=object)
-    interpretation = np.empty(len(df), dtype=object)
-    signal = np.empty(len(df), dtype=object)
-
-    sqzOn_prev = sqzOn.shift(1).fillna(False)
-
-    for i in range(len(df)):
-        if noSqz.iloc[i]:
-            dot_color[i] = "blue"
-            interpretation[i] = "No Squeeze"
-            signal[i] = "Neutral"
-        elif sqzOn.iloc[i]:
-            dot_color[i] = "black"
-            interpretation[i] = "Phase 1: Squeeze On (Market coiling - No trade)"
-            signal[i] = "Neutral"
-        elif sqzOff.iloc[i]:
-            dot_color[i] = "gray"
-            if sqzOn_prev.iloc[i]:
-                if hist_color[i] == "lime":
-                    interpretation[i] = "Phase 2 & 3: Squeeze Released + Bullish Expansion"
-                    signal[i] = "Bullish"
-                elif hist_color[i] == "red":
-                    interpretation[i] = "Phase 2 & 3: Squeeze Released + Bearish Expansion"
-                    signal[i] = "Bearish"
-                else:
-                    interpretation[i] = "Phase 2: Squeeze Released (Watch closely)"
-                    signal[i] = "Neutral"
-            else:
-                interpretation[i] = "In Motion (Expansion continues)"
-                signal[i] = "Neutral"
-        else:
-            dot_color[i] = "blue"
-            interpretation[i] = "No Squeeze"
-            signal[i] = "Neutral"
-
-    result = df.copy()
-    result['Momentum'] = val
-    result['HistColor'] = hist_color
-    result['DotColor'] = dot_color
-    result['Interpretation'] = interpretation
-    result['Signal'] = signal
-    result.dropna(subset=['Momentum'], inplace=True)
-    
-    return result
+                          np.where(val < val_prev, "red", "maroon")).astype(object)
+
+    released = sqzOff & sqzOn_prev
+    conditions = [
+        sqzOn,
+        released & (hist_color == "lime"),
+        released & (hist_color == "red"),
+        released,
+        sqzOff,
+    ]
+    dot_color = np.select(conditions, ["black", "gray", "gray", "gray", "gray"], "blue")
+    interpretation = np.select(conditions, [
+        "Phase 1: Squeeze On (Market coiling - No trade)",
+        "Phase 2 & 3: Squeeze Released + Bullish Expansion",
+        "Phase 2 & 3: Squeeze Released + Bearish Expansion",
+        "Phase 2: Squeeze Released (Watch closely)",
+        "In Motion (Expansion continues)",
+    ], "No Squeeze")
+    signal = np.select(conditions[:3], ["Neutral", "Bullish", "Bearish"], "Neutral")
+
+    if not panel:
+        result = df.copy()
+        result['Momentum'] = val[:, 0]
+        result['HistColor'] = hist_color[:, 0]
+        result['DotColor'] = dot_color[:, 0].astype(object)
+        result['Interpretation'] = interpretation[:, 0].astype(object)
+        result['Signal'] = signal[:, 0].astype(object)
+        result.dropna(subset=['Momentum'], inplace=True)
+        return result
+
+    symbols = close.columns
+    outputs = {
+        'Momentum': val, 'HistColor': hist_color, 'DotColor': dot_color.astype(object),
+        'Interpretation': interpretation.astype(object), 'Signal': signal.astype(object),
+    }
+    scored = pd.concat({k: pd.DataFrame(v, index=df.index, columns=symbols) for k, v in outputs.items()}, axis=1)
+    result = pd.concat([df, scored], axis=1)
+    return result[np.isfinite(val).any(axis=1)]
 
 def plot_squeeze(symbol, df, show_plot=True, save_plot=False):
     """Create interactive Plotly chart and save as PNG if requested."""
@@ -238,17 +202,12 @@ if __name__ == "__main__":
     show_plot               = False
     save_plot               = True
 
-    # Pre-load cache once
-    cache = {}
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'rb') as f:
-                cache = pickle.load(f)
-        except Exception as e:
-            print(f"Error loading cache: {e}")
+    # Shared per-symbol store (new downloads are written in batches)
+    store = OHLCVStore(interval=interval)
+    cached_symbols = store.symbols()
 
-    if PROCESS_ALL_CACHED and cache:
-        symbols = list(cache.keys())
+    if PROCESS_ALL_CACHED and cached_symbols:
+        symbols = cached_symbols
         print(f"Found {len(symbols)} symbols in cache. Processing all with tqdm...")
     else:
         symbols = manual_symbols
@@ -257,7 +216,7 @@ if __name__ == "__main__":
 
     # Process with tqdm progress bar
     for symbol in tqdm(symbols, desc="Processing Stocks", unit="stock"):
-        data = get_data(symbol, cache, interval, period)
+        data = store.get(symbol, period)
         if not data.empty:
             result = momentum_squeeze_vectorized(data)
             latest = result.iloc[-1]
@@ -281,6 +240,7 @@ if __name__ == "__main__":
                 msg_prefix = "[SIGNAL]" if is_breakout else "[MANUAL]"
                 tqdm.write(f"\n{msg_prefix} {symbol}: {latest['Signal']} | {latest['Interpretation']}")
                 plot_squeeze(symbol, result, show_plot=show_plot, save_plot=save_plot)
-    
+    store.flush()
+
     if all_details:
         save_to_csv(all_details)
@@ -1,55 +1,19 @@
 
 import os
-import yfinance as yf
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import pickle
 import shutil
-from datetime import datetime, timedelta
+from datetime import datetime
 from tqdm import tqdm
+from ohlcv_store import OHLCVStore
 
 pd.set_option('future.no_silent_downcasting', True)
 
 # Settings
-DATA_CACHE_DIR = "data_cache"
-CACHE_FILE = os.path.join(DATA_CACHE_DIR, "stock_data_max.pkl")
 OUTPUT_DIR = "outputs/Consolidation_Box"
 
-def get_data(symbol, cache, interval="1d", period="6mo"):
-    """Fetch data using pre-loaded cache: downloads 'max' if missing and slices by period."""
-    needs_download = False
-    if symbol not in cache:
-        needs_download = True
-    else:
-        last_date = cache[symbol].index[-1]
-        if datetime.now() - last_date > timedelta(days=1):
-            needs_download = True
-
-    if needs_download:
-        df = yf.download(symbol, interval=interval, period="max", auto_adjust=False, progress=False, multi_level_index=False)
-        if not df.empty:
-            cache[symbol] = df
-            if not os.path.exists(DATA_CACHE_DIR): os.makedirs(DATA_CACHE_DIR)
-            with open(CACHE_FILE, 'wb') as f:
-                pickle.dump(cache, f)
-        else:
-            return pd.DataFrame()
-
-    df = cache[symbol]
-    
-    period_map = {
-        "1mo": 30, "3mo": 90, "6mo": 180, "1y": 365, "2y": 730, "5y": 1825, "10y": 3650, "max": 99999
-    }
-    
-    if period in period_map:
-        days = period_map[period]
-        start_date = df.index[-1] - timedelta(days=days)
-        df = df[df.index >= start_date]
-    
-    return df
-
 def calculate_atr(df, length=14):
     high = df['High']
     low = df['Low']
@@ -62,77 +26,127 @@ def calculate_atr(df, length=14):
     ], axis=1).max(axis=1)
     return tr.rolling(length).mean()
 
-def detect_consolidation_boxes(symbol, df, range_len=10, cooldown_bars=13, atr_len=14, max_atr_mult=3.0, retest_bars=20, retest_gap_pct=1.0):
-    """Refactored Darvas Box logic with retest tracking and full history."""
-    df = df.copy()
-    df['ATR'] = calculate_atr(df, atr_len)
-    
-    historical_boxes = []
-    current_signal = "Neutral"
-    latest_active_box = None
+def _njit(fn):
+    """JIT-compiles the box state machine when numba is installed, else runs it as plain Python."""
+    try:
+        from numba import njit
+    except ImportError:
+        return fn
+    return njit(fn)
+
+@_njit
+def _box_state_machine(high, low, close, atr, hh, ll, range_len, cooldown_bars, max_atr_mult, retest_bars, retest_gap_pct):
+    """
+    Darvas box state machine over raw float64 arrays (hh/ll = max High / min Low of the
+    range_len bars *before* each bar). Returns box rows as parallel arrays plus the last
+    active box and whether the final bar is a breakout.
+    """
+    n = len(close)
+    box_start = np.empty(n, np.int64)
+    box_end = np.empty(n, np.int64)
+    box_hi = np.empty(n, np.float64)
+    box_lo = np.empty(n, np.float64)
+    box_up = np.empty(n, np.bool_)
+    box_retested = np.zeros(n, np.bool_)
+    n_boxes = 0
+
+    active = np.array([-1, -1], np.int64)          # start / end bar of the latest active box
+    active_hl = np.array([np.nan, np.nan])         # its high / low at that bar
+    last_bar_breakout = False
 
     phase = 0
-    box_high = box_low = start_idx = cooldown_start = None
-    breakout_type = is_retested = None
-    
-    for i in range(len(df)):
-        row = df.iloc[i]
-        
+    box_high = box_low = 0.0
+    start_idx = cooldown_start = 0
+    breakout_up = is_retested = False
+
+    for i in range(n):
         # PHASE 0: Look for new range
-        if phase == 0 and i >= range_len:
-            window = df.iloc[i - range_len:i]
-            hh, ll = window['High'].max(), window['Low'].min()
-            
-            if pd.notna(row['ATR']) and (hh - ll) <= row['ATR'] * max_atr_mult:
-                box_high, box_low, start_idx = hh, ll, i - range_len
+        if phase == 0:
+            if i >= range_len and (hh[i] - ll[i]) <= atr[i] * max_atr_mult:
+                box_high, box_low, start_idx = hh[i], ll[i], i - range_len
                 phase = 2
-                
+
         # PHASE 2: Monitor for breakout or extension
         elif phase == 2:
-            close = row['Close']
-            if close > box_high or close < box_low:
-                breakout_type = "UP" if close > box_high else "DOWN"
+            c = close[i]
+            if c > box_high or c < box_low:
+                breakout_up = c > box_high
                 is_retested = False
                 cooldown_start = i
-                
-                historical_boxes.append({
-                    "symbol": symbol,
-                    "start_date": df.index[start_idx].strftime('%d-%m-%y %H:%M'),
-                    "end_date": df.index[i].strftime('%d-%m-%y %H:%M'),
-                    "high": round(box_high, 2),
-                    "low": round(box_low, 2),
-                    "breakout": breakout_type,
-                    "retested": False
-                })
-                
-                if i == len(df) - 1: current_signal = f"Breakout {breakout_type}"
+                box_start[n_boxes], box_end[n_boxes] = start_idx, i
+                box_hi[n_boxes], box_lo[n_boxes] = box_high, box_low
+                box_up[n_boxes] = breakout_up
+                n_boxes += 1
+                if i == n - 1: last_bar_breakout = True
                 phase = 3
             else:
-                if row['High'] > box_high: box_high = row['High']
-                if row['Low'] < box_low: box_low = row['Low']
-                latest_active_box = {'start': df.index[start_idx], 'end': df.index[i], 'high': box_high, 'low': box_low}
+                if high[i] > box_high: box_high = high[i]
+                if low[i] < box_low: box_low = low[i]
+                active[0], active[1] = start_idx, i
+                active_hl[0], active_hl[1] = box_high, box_low
 
         # PHASE 3: Cooldown + Retest Check
         elif phase == 3:
             lookback = i - cooldown_start
             if not is_retested and lookback > 0:
-                safe_lb = min(retest_bars, lookback)
-                recent = df.iloc[i - safe_lb:i]
-                breakout_price = box_high if breakout_type == "UP" else box_low
+                first = i - min(retest_bars, lookback)
+                breakout_price = box_high if breakout_up else box_low
                 gap = breakout_price * retest_gap_pct / 100
-                
-                if breakout_type == "UP":
-                    if (breakout_price - gap) <= recent['Low'].min() < breakout_price:
-                        is_retested = True
-                        historical_boxes[-1]["retested"] = True
+
+                # NaN-skipping min/max of the bars since the breakout (as pandas .min/.max)
+                extreme = np.nan
+                for j in range(first, i):
+                    v = low[j] if breakout_up else high[j]
+                    if v == v and (extreme != extreme or (v < extreme if breakout_up else v > extreme)):
+                        extreme = v
+
+                if breakout_up:
+                    is_retested = (breakout_price - gap) <= extreme < breakout_price
                 else:
-                    if breakout_price < recent['High'].max() <= (breakout_price + gap):
-                        is_retested = True
-                        historical_boxes[-1]["retested"] = True
-            
+                    is_retested = breakout_price < extreme <= (breakout_price + gap)
+                if is_retested:
+                    box_retested[n_boxes - 1] = True
+
             if lookback >= cooldown_bars:
                 phase = 0
 
+    return (box_start[:n_boxes], box_end[:n_boxes], box_hi[:n_boxes], box_lo[:n_boxes],
+            box_up[:n_boxes], box_retested[:n_boxes], active, active_hl, last_bar_breakout)
+
+def detect_consolidation_boxes(symbol, df, range_len=10, cooldown_bars=13, atr_len=14, max_atr_mult=3.0, retest_bars=20, retest_gap_pct=1.0):
+    """Refactored Darvas Box logic with retest tracking and full history (single pass over NumPy arrays)."""
+    high = df['High'].to_numpy(dtype=np.float64)
+    low = df['Low'].to_numpy(dtype=np.float64)
+    close = df['Close'].to_numpy(dtype=np.float64)
+    atr = calculate_atr(df, atr_len).to_numpy(dtype=np.float64)
+
+    # Range of the range_len bars before each bar
+    hh = df['High'].rolling(range_len, min_periods=1).max().shift(1).to_numpy(dtype=np.float64)
+    ll = df['Low'].rolling(range_len, min_periods=1).min().shift(1).to_numpy(dtype=np.float64)
+
+    starts, ends, highs, lows, ups, retested, active, active_hl, last_bar_breakout = _box_state_machine(
+        high, low, close, atr, hh, ll, range_len, cooldown_bars, max_atr_mult, retest_bars, retest_gap_pct)
+
+    start_dates = df.index[starts].strftime('%d-%m-%y %H:%M')
+    end_dates = df.index[ends].strftime('%d-%m-%y %H:%M')
+    historical_boxes = [
+        {
+            "symbol": symbol,
+            "start_date": start_dates[k],
+            "end_date": end_dates[k],
+            "high": round(highs[k], 2),
+            "low": round(lows[k], 2),
+            "breakout": "UP" if ups[k] else "DOWN",
+            "retested": bool(retested[k])
+        }
+        for k in range(len(starts))
+    ]
+
+    latest_active_box = None
+    if active[0] >= 0:
+        latest_active_box = {'start': df.index[active[0]], 'end': df.index[active[1]], 'high': active_hl[0], 'low': active_hl[1]}
+
+    current_signal = f"Breakout {historical_boxes[-1]['breakout']}" if last_bar_breakout else "Neutral"
     return historical_boxes, latest_active_box, current_signal
 
 def plot_consolidation(symbol, df, boxes, current_box, signal, save=True, show=False):
@@ -173,11 +187,10 @@ if __name__ == "__main__":
     SHOW_ALL_MANUAL_PLOTS       = False # Set to True to show plots for all manual_symbols regardless of signal
     interval, period            = "1d", "1y"
 
-    cache = {}
-    if os.path.exists(CACHE_FILE):
-        with open(CACHE_FILE, 'rb') as f: cache = pickle.load(f)
+    store = OHLCVStore(interval=interval)
+    cached_symbols = store.symbols()
 
-    symbols = list(cache.keys()) if PROCESS_ALL_CACHED and cache else manual_symbols
+    symbols = cached_symbols if PROCESS_ALL_CACHED and cached_symbols else manual_symbols
     print(f"Scanning {len(symbols)} symbols for Consolidation Breakouts...")
 
     summary_results = []
@@ -185,7 +198,7 @@ if __name__ == "__main__":
     plotting_queue = []
 
     for symbol in tqdm(symbols, desc="Scanning for Breakouts", unit="stock"):
-        data = get_data(symbol, cache, interval, period)
+        data = store.get(symbol, period)
         if not data.empty:
             history, active_box, signal = detect_consolidation_boxes(symbol, data)
             
@@ -194,6 +207,7 @@ if __name__ == "__main__":
 
             if signal != "Neutral" or (symbol in manual_symbols and SHOW_ALL_MANUAL_PLOTS):
                 plotting_queue.append((symbol, data, history, active_box, signal))
+    store.flush()
 
     # Save CSVs first (Complete report)
     hist_csv = os.path.join(OUTPUT_DIR, "Historical_Consolidation_Boxes.csv")
@@ -0,0 +1,152 @@
+"""
+Parity check + benchmark for detect_consolidation_boxes (5. Price Consolidation Boxes.py)
+──────────────────────────────────────────────────────────────────────────────────────
+Runs the array/state-machine detector and the original row-by-row pandas version over a
+synthetic universe of daily bars, asserts they produce identical historical boxes, latest
+active box and signal for every symbol, then prints the timings. No network access needed.
+
+    python bench_consolidation_boxes.py                  # 500 symbols x 1000 daily bars
+    python bench_consolidation_boxes.py --symbols 50 --bars 2500
+"""
+
+import argparse
+import importlib.util
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+_spec = importlib.util.spec_from_file_location(
+    "consolidation_boxes", os.path.join(os.path.dirname(os.path.abspath(__file__)), "5. Price Consolidation Boxes.py"))
+boxes = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(boxes)
+
+
+def detect_consolidation_boxes_reference(symbol, df, range_len=10, cooldown_bars=13, atr_len=14, max_atr_mult=3.0, retest_bars=20, retest_gap_pct=1.0):
+    """Original pandas implementation (df.iloc per bar), kept as the parity reference."""
+    df = df.copy()
+    df['ATR'] = boxes.calculate_atr(df, atr_len)
+
+    historical_boxes = []
+    current_signal = "Neutral"
+    latest_active_box = None
+
+    phase = 0
+    box_high = box_low = start_idx = cooldown_start = None
+    breakout_type = is_retested = None
+
+    for i in range(len(df)):
+        row = df.iloc[i]
+
+        # PHASE 0: Look for new range
+        if phase == 0 and i >= range_len:
+            window = df.iloc[i - range_len:i]
+            hh, ll = window['High'].max(), window['Low'].min()
+
+            if pd.notna(row['ATR']) and (hh - ll) <= row['ATR'] * max_atr_mult:
+                box_high, box_low, start_idx = hh, ll, i - range_len
+                phase = 2
+
+        # PHASE 2: Monitor for breakout or extension
+        elif phase == 2:
+            close = row['Close']
+            if close > box_high or close < box_low:
+                breakout_type = "UP" if close > box_high else "DOWN"
+                is_retested = False
+                cooldown_start = i
+
+                historical_boxes.append({
+                    "symbol": symbol,
+                    "start_date": df.index[start_idx].strftime('%d-%m-%y %H:%M'),
+                    "end_date": df.index[i].strftime('%d-%m-%y %H:%M'),
+                    "high": round(box_high, 2),
+                    "low": round(box_low, 2),
+                    "breakout": breakout_type,
+                    "retested": False
+                })
+
+                if i == len(df) - 1: current_signal = f"Breakout {breakout_type}"
+                phase = 3
+            else:
+                if row['High'] > box_high: box_high = row['High']
+                if row['Low'] < box_low: box_low = row['Low']
+                latest_active_box = {'start': df.index[start_idx], 'end': df.index[i], 'high': box_high, 'low': box_low}
+
+        # PHASE 3: Cooldown + Retest Check
+        elif phase == 3:
+            lookback = i - cooldown_start
+            if not is_retested and lookback > 0:
+                safe_lb = min(retest_bars, lookback)
+                recent = df.iloc[i - safe_lb:i]
+                breakout_price = box_high if breakout_type == "UP" else box_low
+                gap = breakout_price * retest_gap_pct / 100
+
+                if breakout_type == "UP":
+                    if (breakout_price - gap) <= recent['Low'].min() < breakout_price:
+                        is_retested = True
+                        historical_boxes[-1]["retested"] = True
+                else:
+                    if breakout_price < recent['High'].max() <= (breakout_price + gap):
+                        is_retested = True
+                        historical_boxes[-1]["retested"] = True
+
+            if lookback >= cooldown_bars:
+                phase = 0
+
+    return historical_boxes, latest_active_box, current_signal
+
+
+def make_universe(n_symbols, bars, seed=0):
+    """Random-walk daily OHLC per symbol with quiet (consolidating) stretches and a few missing bars."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end="2025-12-31", periods=bars, name="Date")
+    universe = {}
+    for k in range(n_symbols):
+        vol = np.where(rng.random(bars) < 0.3, 0.2, 1.5)
+        close = 100 + np.cumsum(rng.normal(0, vol))
+        close = np.abs(close) + 5
+        spread = rng.uniform(0.1, 1.0, bars) * vol
+        df = pd.DataFrame({
+            "Open": close + rng.normal(0, 0.2, bars),
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(1_000, 100_000, bars),
+        }, index=index)
+        if k % 25 == 0:
+            df.iloc[rng.integers(0, bars, 3), :4] = np.nan
+        universe[f"SYM{k:03d}.NS"] = df
+    return universe
+
+
+def run(detector, universe):
+    start = time.perf_counter()
+    results = {symbol: detector(symbol, df) for symbol, df in universe.items()}
+    return results, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--bars", type=int, default=1000)
+    args = parser.parse_args()
+
+    universe = make_universe(args.symbols, args.bars)
+    print(f"Universe: {args.symbols} symbols x {args.bars} daily bars")
+
+    boxes.detect_consolidation_boxes("WARMUP", next(iter(universe.values())))   # JIT compile, if numba is installed
+    fast, t_fast = run(boxes.detect_consolidation_boxes, universe)
+    slow, t_slow = run(detect_consolidation_boxes_reference, universe)
+
+    mismatches = [symbol for symbol in universe if fast[symbol] != slow[symbol]]
+    n_boxes = sum(len(history) for history, _, _ in slow.values())
+    n_signals = sum(signal != "Neutral" for _, _, signal in slow.values())
+    print(f"Parity: {len(universe) - len(mismatches)}/{len(universe)} symbols identical "
+          f"({n_boxes} boxes, {n_signals} live signals)")
+
+    print(f"  reference (pandas iloc) : {t_slow:8.2f} s")
+    print(f"  array state machine     : {t_fast:8.2f} s   x{t_slow / t_fast:.1f}")
+
+    if mismatches:
+        raise SystemExit(f"Mismatch for: {', '.join(mismatches[:10])}")
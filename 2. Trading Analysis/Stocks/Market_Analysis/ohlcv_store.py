@@ -0,0 +1,169 @@
+"""
+Shared OHLCV store for the Market_Analysis scripts
+──────────────────────────────────────────────────
+✓ One file per symbol (data_cache/ohlcv/<interval>/<SYMBOL>.parquet, pickle if pyarrow is missing)
+✓ Downloads 'max' history only for missing / stale symbols
+✓ Batched flushes: new downloads are written every FLUSH_EVERY symbols, not after each one
+✓ One period slicer shared by every script
+
+Usage:
+    from ohlcv_store import OHLCVStore
+
+    with OHLCVStore(interval="1d") as store:
+        for symbol in store.symbols() or ["RELIANCE.NS"]:
+            df = store.get(symbol, period="6mo")
+"""
+
+import os
+import pickle
+from datetime import datetime, timedelta
+
+import pandas as pd
+import yfinance as yf
+
+try:
+    import pyarrow  # noqa: F401
+    STORE_FORMAT = "parquet"
+except ImportError:
+    STORE_FORMAT = "pkl"
+
+# ======================================================
+# 📂 CONFIGURATION
+# ======================================================
+DATA_CACHE_DIR = "data_cache"
+STORE_DIR      = os.path.join(DATA_CACHE_DIR, "ohlcv")
+LEGACY_CACHE   = os.path.join(DATA_CACHE_DIR, "stock_data_max.pkl")   # old shared {symbol: df} pickle
+MAX_AGE        = timedelta(days=1)     # Re-download when the last bar is older than this
+FLUSH_EVERY    = 25                    # Write pending downloads to disk after this many symbols
+
+# Calendar-day lookback per period (same windows the scripts used before)
+PERIOD_DAYS = {
+    "1mo": 30, "3mo": 90, "6mo": 180, "1y": 365, "2y": 730, "5y": 1825, "10y": 3650, "max": 99999
+}
+
+
+def slice_period(df, period):
+    """Returns the rows of df within `period` of its last bar."""
+    if df.empty or period not in PERIOD_DAYS:
+        return df
+    start_date = df.index[-1] - timedelta(days=PERIOD_DAYS[period])
+    return df[df.index >= start_date]
+
+
+class OHLCVStore:
+    """Per-symbol OHLCV cache shared by the Market_Analysis scripts."""
+
+    def __init__(self, interval="1d", root=STORE_DIR, max_age=MAX_AGE, flush_every=FLUSH_EVERY):
+        self.interval = interval
+        self.folder = os.path.join(root, interval)
+        self.max_age = max_age
+        self.flush_every = flush_every
+        self._frames = {}
+        self._dirty = set()
+        os.makedirs(self.folder, exist_ok=True)
+        if interval == "1d":
+            self._import_legacy()
+
+    # ── context manager: always flush pending downloads ──
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+    # ── paths / IO ──
+    def _path(self, symbol):
+        return os.path.join(self.folder, f"{symbol}.{STORE_FORMAT}")
+
+    def _read(self, symbol):
+        path = self._path(symbol)
+        if not os.path.exists(path):
+            return None
+        try:
+            if STORE_FORMAT == "parquet":
+                return pd.read_parquet(path)
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Warning: Could not read cached {symbol}: {e}")
+            return None
+
+    def _write(self, symbol, df):
+        if STORE_FORMAT == "parquet":
+            df.to_parquet(self._path(symbol))
+        else:
+            with open(self._path(symbol), 'wb') as f:
+                pickle.dump(df, f)
+
+    def _import_legacy(self):
+        """
+        Copies symbols from the old stock_data_max.pkl whose data is newer than
+        the store's. The pickle is left in place for the tools that still write it
+        and is only re-read when its mtime changes.
+        """
+        if not os.path.exists(LEGACY_CACHE):
+            return
+        marker = os.path.join(self.folder, ".legacy_mtime")
+        mtime = os.path.getmtime(LEGACY_CACHE)
+        if os.path.exists(marker) and os.path.getmtime(marker) >= mtime:
+            return
+        try:
+            with open(LEGACY_CACHE, 'rb') as f:
+                legacy = pickle.load(f)
+        except Exception as e:
+            print(f"Warning: Could not read legacy cache {LEGACY_CACHE}: {e}")
+            return
+        imported = 0
+        for symbol, df in legacy.items():
+            if df is None or df.empty:
+                continue
+            if isinstance(df.columns, pd.MultiIndex):
+                df = df.copy()
+                df.columns = df.columns.get_level_values(0)
+            current = self._read(symbol)
+            if current is None or current.index[-1] < df.index[-1]:
+                self._write(symbol, df)
+                imported += 1
+        with open(marker, 'w'):
+            pass
+        os.utime(marker, (mtime, mtime))
+        if imported:
+            print(f"Imported {imported} symbols from legacy cache {LEGACY_CACHE}.")
+
+    # ── public API ──
+    def symbols(self):
+        """Symbols available in the store."""
+        ext = f".{STORE_FORMAT}"
+        on_disk = {f[:-len(ext)] for f in os.listdir(self.folder) if f.endswith(ext)}
+        return sorted(on_disk | set(self._frames))
+
+    def _is_stale(self, df):
+        return datetime.now() - df.index[-1].to_pydatetime().replace(tzinfo=None) > self.max_age
+
+    def get(self, symbol, period="max"):
+        """
+        Returns the symbol's OHLCV sliced to `period`, downloading full ('max')
+        history if the symbol is missing or stale. Empty DataFrame if unavailable.
+        """
+        df = self._frames.get(symbol)
+        if df is None:
+            df = self._read(symbol)
+
+        if df is None or df.empty or self._is_stale(df):
+            fresh = yf.download(symbol, interval=self.interval, period="max", auto_adjust=False, progress=False, multi_level_index=False)
+            if not fresh.empty:
+                df = fresh
+                self._dirty.add(symbol)
+            elif df is None:
+                return pd.DataFrame()
+
+        self._frames[symbol] = df
+        if len(self._dirty) >= self.flush_every:
+            self.flush()
+        return slice_period(df, period)
+
+    def flush(self):
+        """Writes all pending downloads to disk."""
+        for symbol in list(self._dirty):
+            self._write(symbol, self._frames[symbol])
+        self._dirty.clear()
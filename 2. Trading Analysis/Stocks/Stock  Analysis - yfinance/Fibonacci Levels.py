@@ -134,7 +134,8 @@ def plot_fibonacci(df, symbol, swing_data, all_pivots, fib_levels, out_path):
     plt.savefig(out_path, dpi=150)
     plt.close()
 
-def run_analysis(tickers, data_dict=None):
+def reset_output_dirs():
+    """Creates OUTPUT_DIR and an empty Charts folder; returns the charts path."""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     charts_dir = os.path.join(OUTPUT_DIR, "Charts")
     
@@ -142,6 +143,10 @@ def run_analysis(tickers, data_dict=None):
     if os.path.exists(charts_dir):
         shutil.rmtree(charts_dir)
     os.makedirs(charts_dir, exist_ok=True)
+    return charts_dir
+
+def run_analysis(tickers, data_dict=None):
+    charts_dir = reset_output_dirs()
 
     if data_dict:
         data_map = data_dict
@@ -149,6 +154,11 @@ def run_analysis(tickers, data_dict=None):
         print(f"\n📥 Fetching data for {len(tickers)} stocks...")
         data_map = stock_data_manager.get_data(tickers, period=PERIOD, interval=INTERVAL)
     
+    results = analyze_tickers(tickers, data_map, charts_dir)
+    report_results(results)
+
+def analyze_tickers(tickers, data_map, charts_dir):
+    """Scans tickers for proximity to Fibonacci levels, saving charts; returns result rows."""
     results = []
     
     for ticker in tqdm(tickers, desc="🔍 Analyzing Fibonacci"):
@@ -204,6 +214,10 @@ def run_analysis(tickers, data_dict=None):
                 "Dist %": round(min_dist * 100, 2),
             })
 
+    return results
+
+def report_results(results):
+    """Prints the key-level table and saves Fibonacci_Results.csv."""
     if results:
         # Display top picks (Filtered for 50% and 61.8% as requested)
         from prettytable import PrettyTable
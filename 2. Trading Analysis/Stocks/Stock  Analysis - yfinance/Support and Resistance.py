@@ -162,7 +162,8 @@ def run_fractal_sr(tickers, period='6mo', interval='1d',
                    use_local=False, local_dir=None, out_dir='outputs/support_resistance/',
                    sensitivity=1.0, tolerance=0.005, plot=False,
                    save_charts=False, dist_range=0.3,
-                   batch_size=10, delay_per_batch=2.0, data_dict=None):
+                   batch_size=10, delay_per_batch=2.0, data_dict=None,
+                   clear_charts=True, save_csv=True):
     tickers = list(set(tickers))
     out_dir = Path(out_dir)
     out_dir.mkdir(exist_ok=True, parents=True)
@@ -170,9 +171,8 @@ def run_fractal_sr(tickers, period='6mo', interval='1d',
     all_levels = []
 
     # Delete existing Charts folder for a fresh start
-    chart_dir = out_dir / "Charts"
-    if chart_dir.exists() and chart_dir.is_dir():
-        shutil.rmtree(chart_dir)
+    if clear_charts:
+        clear_charts_dir(out_dir)
 
     # Single tqdm progress bar for all tickers
     with tqdm(total=len(tickers), desc="Processing tickers") as pbar:
@@ -270,15 +270,29 @@ def run_fractal_sr(tickers, period='6mo', interval='1d',
                  sleep_time = 0.01 if data_dict else delay_per_batch
                  time.sleep(sleep_time)
 
-    # Save CSVs
     df_levels = pd.DataFrame(all_levels)
-    df_levels.to_csv(out_dir / 'All_Levels.csv', index=False)
     df_sum = pd.DataFrame(summary)
-    df_sum.to_csv(out_dir / 'Summary.csv', index=False)
+    if save_csv:
+        save_sr_results(df_sum, df_levels, out_dir)
 
     return df_sum, df_levels
 
 
+def clear_charts_dir(out_dir='outputs/support_resistance/'):
+    """Deletes the Charts folder under out_dir."""
+    chart_dir = Path(out_dir) / "Charts"
+    if chart_dir.exists() and chart_dir.is_dir():
+        shutil.rmtree(chart_dir)
+
+
+def save_sr_results(df_sum, df_levels, out_dir='outputs/support_resistance/'):
+    """Writes the consolidated All_Levels.csv and Summary.csv."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(exist_ok=True, parents=True)
+    df_levels.to_csv(out_dir / 'All_Levels.csv', index=False)
+    df_sum.to_csv(out_dir / 'Summary.csv', index=False)
+
+
 # -------------------------------------------------
 # Example Execution
 # -------------------------------------------------
@@ -215,7 +215,7 @@ def save_summary_csv(all_stats, outpath):
     print(f"Saved summary: {outpath}")
 
 
-def run(data_dict=None):
+def run(data_dict=None, save_summary=True):
     ensure_dir(OUTDIR)
     timestamp = datetime.now().strftime("%Y-%m-%d")
 
@@ -262,10 +262,12 @@ def run(data_dict=None):
                 os.remove(plot_path)
             save_plot(t, stat, plot_path)
 
-    summary_path = os.path.join(OUTDIR, f"aa_summary_candle_gap_{timestamp}.csv")
-    save_summary_csv(summary_rows, summary_path)
+    if save_summary:
+        summary_path = os.path.join(OUTDIR, f"aa_summary_candle_gap_{timestamp}.csv")
+        save_summary_csv(summary_rows, summary_path)
+        print("\n✔ Analysis Complete.")
 
-    print("\n✔ Analysis Complete.")
+    return summary_rows
 
 if __name__ == "__main__":
     try:
@@ -1,10 +1,33 @@
 import importlib.util
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partialmethod
+import numpy as np
 import stock_data_manager
 import pandas as pd
 from tqdm import tqdm
 
+# ======================================================
+# 🧭 PIPELINE CONFIGURATION
+# ======================================================
+PIPELINE_MODE = "serial"                    # "serial" → one process (original flow)   "pool" → shard tickers across processes
+WORKERS       = max(1, (os.cpu_count() or 2) - 1)
+CHUNK_SIZE    = 25                          # Tickers per task sent to a worker
+SHARED_DIR    = os.path.join(stock_data_manager.CACHE_DIR, "shared")
+
+# Module files (loaded by path because of the spaces in their names)
+MODULE_FILES = {
+    "ltp_gaps": "LTP Near Gaps.py",
+    "support_resistance": "Support and Resistance.py",
+    "candle_analysis": "candle & gap analysis.py",
+    "fibonacci_analysis": "Fibonacci Levels.py",
+}
+SR_OUT_DIR = 'outputs/support_resistance/'
+
 def load_module_from_path(module_name, file_path):
     spec = importlib.util.spec_from_file_location(module_name, file_path)
     module = importlib.util.module_from_spec(spec)
@@ -12,88 +35,333 @@ def load_module_from_path(module_name, file_path):
     spec.loader.exec_module(module)
     return module
 
-def main():
-    print("🚀 Starting Combined Analysis...")
-    
-    # 1. Fetch Data (Checks cache first)
-    print("\n1️⃣  Fetching Stock Data (Local Cache or Fresh Download)...")
-    tickers = stock_data_manager.get_combined_ticker_list()
-    # For testing, you can limit tickers here. Comment out for production.
-    # tickers = tickers[:5] 
-    
-    # get_data handles cache checking and smart slicing automatically
-    LTP_Near_Gaps       = stock_data_manager.get_data(tickers, period="1y", interval="1d")
-    Support_Resistance  = stock_data_manager.get_data(tickers, period="1y", interval="1d")
-    Candle_Analysis     = stock_data_manager.get_data(tickers, period="1mo", interval="1d")
+# ======================================================
+# ⏱ TIMING
+# ======================================================
+TIMINGS = []
 
-    if not LTP_Near_Gaps:
-        print("❌ No data fetched. Exiting.")
+@contextmanager
+def timed(name, n_tickers):
+    """Records wall time and ticker throughput for one analysis module."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        TIMINGS.append((name, n_tickers, time.perf_counter() - start))
+
+def print_timings():
+    if not TIMINGS:
         return
+    print("\n⏱  Module Timings:")
+    print(f"   {'Module':<26}{'Tickers':>8}{'Wall (s)':>10}{'Tickers/s':>11}")
+    for name, n, secs in TIMINGS:
+        rate = n / secs if secs > 0 else float("inf")
+        print(f"   {name:<26}{n:>8}{secs:>10.2f}{rate:>11.1f}")
+    total = sum(secs for _, _, secs in TIMINGS)
+    print(f"   {'Total':<26}{'':>8}{total:>10.2f}")
+
+# ======================================================
+# 🧠 SHARED PRICE DATA (memory-mapped, for pool mode)
+# ======================================================
 
+def pack_data_dict(data_dict, name, folder=SHARED_DIR):
+    """
+    Packs {ticker: OHLCV DataFrame} into two memory-mapped .npy files
+    (float64 values and int64 ns timestamps) plus a small index of
+    per-ticker row ranges. Workers map the files read-only, so the price
+    data is written once instead of being pickled into every task.
+    """
+    os.makedirs(folder, exist_ok=True)
+    frames = {}
+    columns = []
+    for ticker, df in data_dict.items():
+        if df is None or df.empty:
+            continue
+        df = df.copy()
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = df.columns.get_level_values(0)
+        frames[ticker] = df
+        columns.extend(c for c in df.columns if c not in columns)
+
+    n_rows = sum(len(df) for df in frames.values())
+    values_path = os.path.join(folder, f"{name}_values.npy")
+    dates_path = os.path.join(folder, f"{name}_dates.npy")
+    values = np.lib.format.open_memmap(values_path, mode="w+", dtype=np.float64, shape=(n_rows, len(columns)))
+    dates = np.lib.format.open_memmap(dates_path, mode="w+", dtype=np.int64, shape=(n_rows,))
+
+    tickers = {}
+    tz, unit = None, None
+    pos = 0
+    for ticker, df in frames.items():
+        idx = pd.DatetimeIndex(df.index)
+        tz = tz or (str(idx.tz) if idx.tz is not None else None)
+        unit = unit or idx.unit
+        if idx.tz is not None:
+            idx = idx.tz_convert("UTC").tz_localize(None)
+        end = pos + len(df)
+        values[pos:end] = df.reindex(columns=columns).to_numpy(dtype=np.float64, na_value=np.nan)
+        dates[pos:end] = idx.as_unit("ns").asi8
+        tickers[ticker] = (pos, end, list(df.columns), {c: str(t) for c, t in df.dtypes.items()}, df.index.name)
+        pos = end
+    values.flush()
+    dates.flush()
+    del values, dates
+
+    return {"values": values_path, "dates": dates_path, "columns": columns, "tz": tz, "unit": unit, "tickers": tickers}
+
+def unpack_frame(shared, values, dates, ticker):
+    """Rebuilds one ticker's DataFrame from the mapped arrays."""
+    start, end, cols, dtypes, index_name = shared["tickers"][ticker]
+    idx = pd.DatetimeIndex(dates[start:end].astype("datetime64[ns]"), name=index_name).as_unit(shared["unit"] or "ns")
+    if shared["tz"]:
+        idx = idx.tz_localize("UTC").tz_convert(shared["tz"])
+    col_pos = [shared["columns"].index(c) for c in cols]
+    df = pd.DataFrame(np.asarray(values[start:end])[:, col_pos], index=idx, columns=cols)
+    for c, dtype in dtypes.items():
+        if dtype != "float64" and not df[c].isna().any():
+            df[c] = df[c].astype(dtype)
+    return df
+
+def release_shared(shared):
+    for key in ("values", "dates"):
+        try:
+            os.remove(shared[key])
+        except OSError:
+            pass
+
+# ======================================================
+# 👷 WORKER SIDE
+# ======================================================
+_WORKER_SHARED = {}
+_WORKER_MODULES = {}
+
+def _init_worker(shared_sets):
+    """Maps every shared dataset once per worker process."""
+    tqdm.__init__ = partialmethod(tqdm.__init__, disable=True)   # keep worker progress bars out of the console
+    for name, shared in shared_sets.items():
+        _WORKER_SHARED[name] = (
+            shared,
+            np.load(shared["values"], mmap_mode="r"),
+            np.load(shared["dates"], mmap_mode="r"),
+        )
+
+def _worker_module(key):
+    if key not in _WORKER_MODULES:
+        _WORKER_MODULES[key] = load_module_from_path(key, MODULE_FILES[key])
+    return _WORKER_MODULES[key]
+
+def _shard(dataset, tickers):
+    shared, values, dates = _WORKER_SHARED[dataset]
+    return {t: unpack_frame(shared, values, dates, t) for t in tickers if t in shared["tickers"]}
+
+def _run_task(task, dataset, tickers):
+    """Runs one module over one ticker shard and returns its raw results."""
+    data = _shard(dataset, tickers)
+    tickers = [t for t in tickers if t in data]
+    if not tickers:
+        return None
+    if task == "ltp_gaps":
+        return _worker_module(task).detect_gaps(data, tickers)
+    if task == "support_resistance":
+        return _worker_module(task).run_fractal_sr(
+            tickers, period="1y", interval="1d", data_dict=data,
+            save_charts=True, plot=False, out_dir=SR_OUT_DIR,
+            clear_charts=False, save_csv=False,
+        )
+    if task == "candle_analysis":
+        return _worker_module(task).run(data_dict=data, save_summary=False)
+    if task == "fibonacci_analysis":
+        fib = _worker_module(task)
+        return fib.analyze_tickers(tickers, data, os.path.join(fib.OUTPUT_DIR, "Charts"))
+    raise ValueError(f"Unknown task: {task}")
+
+def _map_shards(pool, task, dataset, tickers):
+    """Splits tickers into CHUNK_SIZE shards and returns worker results in order."""
+    chunks = [tickers[i:i + CHUNK_SIZE] for i in range(0, len(tickers), CHUNK_SIZE)]
+    futures = [pool.submit(_run_task, task, dataset, chunk) for chunk in chunks]
+    results = []
+    for fut in tqdm(futures, desc=f"⚙️  {task}", unit="shard"):
+        res = fut.result()
+        if res is not None:
+            results.append(res)
+    return results
+
+# ======================================================
+# 🚀 PIPELINES
+# ======================================================
+
+def run_serial(LTP_Near_Gaps, Support_Resistance, Candle_Analysis):
     # 2. Run LTP Near Gaps
     print("\n2️⃣  Running LTP Near Gaps Analysis...")
     try:
-        ltp_module = load_module_from_path("ltp_gaps", "LTP Near Gaps.py")
-        
+        ltp_module = load_module_from_path("ltp_gaps", MODULE_FILES["ltp_gaps"])
+
         # Run for each group defined in the module
         groups = ltp_module.groups
-        for group_name, group_tickers in groups.items():
-            print(f"   > Processing Group: {group_name}...")
-            # Filter tickers that are in data_map
-            valid_tickers = [t for t in group_tickers if t in LTP_Near_Gaps]
-            
-            if valid_tickers:
-                gaps = ltp_module.detect_gaps(LTP_Near_Gaps, valid_tickers)
-                ltp_module.save_to_csv(gaps, filename=f"gaps_{group_name}.csv")
-            else:
-                print(f"     No valid data for group {group_name}")
-                
+        with timed("LTP Near Gaps", len(LTP_Near_Gaps)):
+            for group_name, group_tickers in groups.items():
+                print(f"   > Processing Group: {group_name}...")
+                # Filter tickers that are in data_map
+                valid_tickers = [t for t in group_tickers if t in LTP_Near_Gaps]
+
+                if valid_tickers:
+                    gaps = ltp_module.detect_gaps(LTP_Near_Gaps, valid_tickers)
+                    ltp_module.save_to_csv(gaps, filename=f"gaps_{group_name}.csv")
+                else:
+                    print(f"     No valid data for group {group_name}")
+
     except Exception as e:
         print(f"❌ Error running LTP Near Gaps: {e}")
 
     # 3. Run Support and Resistance
     print("\n3️⃣  Running Support & Resistance Analysis...")
     try:
-        sr_module = load_module_from_path("support_resistance", "Support and Resistance.py")
-        
+        sr_module = load_module_from_path("support_resistance", MODULE_FILES["support_resistance"])
+
         # Pass all tickers or a specific list. Passing all unique available tickers.
         all_available_tickers = list(Support_Resistance.keys())
-        
-        sr_module.run_fractal_sr(
-            all_available_tickers, 
-            period="1y", 
-            interval="1d", 
-            data_dict=Support_Resistance,
-            save_charts=True,
-            plot=False,
-            out_dir='outputs/support_resistance/' # separate folder to distinguish
-        )
-        
+
+        with timed("Support & Resistance", len(all_available_tickers)):
+            sr_module.run_fractal_sr(
+                all_available_tickers,
+                period="1y",
+                interval="1d",
+                data_dict=Support_Resistance,
+                save_charts=True,
+                plot=False,
+                out_dir=SR_OUT_DIR # separate folder to distinguish
+            )
+
     except Exception as e:
         print(f"❌ Error running Support and Resistance: {e}")
 
     # 4. Candle & Gap Analysis
     print("\n4️⃣  Running Candle & Gap Analysis...")
     try:
-        candle_module = load_module_from_path("candle_analysis", "candle & gap analysis.py")
-        candle_module.run(data_dict=Candle_Analysis)
-        
+        candle_module = load_module_from_path("candle_analysis", MODULE_FILES["candle_analysis"])
+        with timed("Candle & Gap", len(Candle_Analysis)):
+            candle_module.run(data_dict=Candle_Analysis)
+
     except Exception as e:
         print(f"❌ Error running Candle & Gap Analysis: {e}")
 
     # 5. Fibonacci Levels Analysis
     print("\n5️⃣  Running Fibonacci Levels Analysis...")
     try:
-        fib_module = load_module_from_path("fibonacci_analysis", "Fibonacci Levels.py")
-        
+        fib_module = load_module_from_path("fibonacci_analysis", MODULE_FILES["fibonacci_analysis"])
+
         # Use a group for analysis (e.g., nifty_500 as default or whatever is in stock_data_manager)
         all_tickers = stock_data_manager.get_combined_ticker_list()
-        
-        fib_module.run_analysis(all_tickers, data_dict=Support_Resistance) # Re-using Support_Resistance cache (1y data)
-        
+
+        with timed("Fibonacci", len([t for t in all_tickers if t in Support_Resistance])):
+            fib_module.run_analysis(all_tickers, data_dict=Support_Resistance) # Re-using Support_Resistance cache (1y data)
+
     except Exception as e:
         print(f"❌ Error running Fibonacci Analysis: {e}")
 
+def run_pool(LTP_Near_Gaps, Support_Resistance, Candle_Analysis):
+    """
+    Same modules and outputs as run_serial, with tickers sharded across a
+    process pool. Price data is shared through memory-mapped arrays; only
+    ticker lists go out and per-ticker results come back, which are merged
+    here and written to the usual CSVs.
+    """
+    print(f"\n⚙️  Pool mode: {WORKERS} workers, {CHUNK_SIZE} tickers per shard")
+    # LTP_Near_Gaps and Support_Resistance are the same 1y cache, so it is shared once
+    year_data = LTP_Near_Gaps
+    shared_sets = {}
+    try:
+        shared_sets["1y"] = pack_data_dict(year_data, "1y")
+        if Candle_Analysis is not year_data:
+            shared_sets["1mo"] = pack_data_dict(Candle_Analysis, "1mo")
+        year_tickers = list(shared_sets["1y"]["tickers"])
+        month_tickers = list(shared_sets.get("1mo", shared_sets["1y"])["tickers"])
+
+        with ProcessPoolExecutor(max_workers=WORKERS, initializer=_init_worker, initargs=(shared_sets,)) as pool:
+            # 2. LTP Near Gaps – scan every ticker once, then split by group
+            print("\n2️⃣  Running LTP Near Gaps Analysis...")
+            try:
+                ltp_module = load_module_from_path("ltp_gaps", MODULE_FILES["ltp_gaps"])
+                with timed("LTP Near Gaps", len(year_tickers)):
+                    gaps = {}
+                    for part in _map_shards(pool, "ltp_gaps", "1y", year_tickers):
+                        gaps.update(part)
+                    for group_name, group_tickers in ltp_module.groups.items():
+                        print(f"   > Processing Group: {group_name}...")
+                        if any(t in year_data for t in group_tickers):
+                            group_gaps = {t: gaps[t] for t in group_tickers if t in gaps}
+                            ltp_module.save_to_csv(group_gaps, filename=f"gaps_{group_name}.csv")
+                        else:
+                            print(f"     No valid data for group {group_name}")
+            except Exception as e:
+                print(f"❌ Error running LTP Near Gaps: {e}")
+
+            # 3. Support and Resistance
+            print("\n3️⃣  Running Support & Resistance Analysis...")
+            try:
+                sr_module = load_module_from_path("support_resistance", MODULE_FILES["support_resistance"])
+                sr_tickers = list(Support_Resistance.keys())
+                with timed("Support & Resistance", len(sr_tickers)):
+                    sr_module.clear_charts_dir(SR_OUT_DIR)
+                    parts = _map_shards(pool, "support_resistance", "1y", sr_tickers)
+                    df_sum = pd.concat([p[0] for p in parts], ignore_index=True) if parts else pd.DataFrame()
+                    df_levels = pd.concat([p[1] for p in parts], ignore_index=True) if parts else pd.DataFrame()
+                    sr_module.save_sr_results(df_sum, df_levels, SR_OUT_DIR)
+            except Exception as e:
+                print(f"❌ Error running Support and Resistance: {e}")
+
+            # 4. Candle & Gap Analysis
+            print("\n4️⃣  Running Candle & Gap Analysis...")
+            try:
+                candle_module = load_module_from_path("candle_analysis", MODULE_FILES["candle_analysis"])
+                candle_dataset = "1mo" if "1mo" in shared_sets else "1y"
+                with timed("Candle & Gap", len(month_tickers)):
+                    candle_module.ensure_dir(candle_module.OUTDIR)
+                    rows = [row for part in _map_shards(pool, "candle_analysis", candle_dataset, month_tickers) for row in part]
+                    summary_path = os.path.join(candle_module.OUTDIR, f"aa_summary_candle_gap_{datetime.now().strftime('%Y-%m-%d')}.csv")
+                    candle_module.save_summary_csv(rows, summary_path)
+            except Exception as e:
+                print(f"❌ Error running Candle & Gap Analysis: {e}")
+
+            # 5. Fibonacci Levels Analysis
+            print("\n5️⃣  Running Fibonacci Levels Analysis...")
+            try:
+                fib_module = load_module_from_path("fibonacci_analysis", MODULE_FILES["fibonacci_analysis"])
+                fib_tickers = [t for t in stock_data_manager.get_combined_ticker_list() if t in Support_Resistance]
+                with timed("Fibonacci", len(fib_tickers)):
+                    fib_module.reset_output_dirs()
+                    rows = [row for part in _map_shards(pool, "fibonacci_analysis", "1y", fib_tickers) for row in part]
+                    fib_module.report_results(rows)
+            except Exception as e:
+                print(f"❌ Error running Fibonacci Analysis: {e}")
+    finally:
+        for shared in shared_sets.values():
+            release_shared(shared)
+
+def main():
+    print("🚀 Starting Combined Analysis...")
+
+    # 1. Fetch Data (Checks cache first)
+    print("\n1️⃣  Fetching Stock Data (Local Cache or Fresh Download)...")
+    tickers = stock_data_manager.get_combined_ticker_list()
+    # For testing, you can limit tickers here. Comment out for production.
+    # tickers = tickers[:5]
+
+    # get_data handles cache checking and smart slicing automatically
+    LTP_Near_Gaps       = stock_data_manager.get_data(tickers, period="1y", interval="1d")
+    Support_Resistance  = stock_data_manager.get_data(tickers, period="1y", interval="1d")
+    Candle_Analysis     = stock_data_manager.get_data(tickers, period="1mo", interval="1d")
+
+    if not LTP_Near_Gaps:
+        print("❌ No data fetched. Exiting.")
+        return
+
+    if PIPELINE_MODE == "pool":
+        run_pool(LTP_Near_Gaps, Support_Resistance, Candle_Analysis)
+    else:
+        run_serial(LTP_Near_Gaps, Support_Resistance, Candle_Analysis)
+
+    print_timings()
     print("\n✅ All Analyses Completed Successfully!")
 
 if __name__ == "__main__":
@@ -6,6 +6,9 @@ import pickle
 from datetime import datetime, timedelta
 from tqdm import tqdm
 import warnings
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
 
 # Suppress warnings from yfinance
 warnings.filterwarnings("ignore")
@@ -17,6 +20,12 @@ CACHE_DIR = "data_cache"
 CACHE_EXPIRY_HOURS = 4  # Refresh data every 4 hours
 BATCH_SIZE = 50         # Stocks per batch
 BATCH_DELAY = 1.0       # Delay between batches (API safety)
+MAX_INFLIGHT_BATCHES = 2        # Batches downloading at the same time
+DOWNLOAD_THREADS = 8            # Concurrent symbol requests inside one batch
+MAX_TICKER_RETRIES = 2          # Re-queue a failed symbol this many times before giving up
+BACKOFF_MAX = 30.0              # Upper bound (s) for the adaptive pause after failed batches
+INCREMENTAL_UPDATE = True       # Top up expired caches with only the new bars
+ADJUSTMENT_TOLERANCE = 1e-4     # Relative change on an already-cached bar that signals a split/dividend re-adjustment
 
 # Period hierarchy for smart cache selection
 PERIOD_ORDER = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
@@ -53,11 +62,23 @@ def get_combined_ticker_list():
 # ======================================================
 # 📥 CACHING LOGIC
 # ======================================================
+# One file per ticker under data_cache/stock_data_{period}/ (Parquet when
+# pyarrow is available, pickle otherwise). Tickers are validated and loaded
+# individually, so a script that needs 10 tickers never reads the other 490.
+
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = "parquet"
+except ImportError:
+    CACHE_FORMAT = "pkl"
 
 def get_cache_path(period):
-    """Returns the absolute path for a cache file based on the period."""
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    return os.path.join(CACHE_DIR, f"stock_data_{period}.pkl")
+    """Returns the cache folder for a period (one file per ticker inside)."""
+    return os.path.join(CACHE_DIR, f"stock_data_{period}")
+
+def get_ticker_cache_path(period, ticker):
+    """Returns the cache file path for one ticker of a period."""
+    return os.path.join(get_cache_path(period), f"{ticker}.{CACHE_FORMAT}")
 
 def is_cache_valid(cache_path):
     """Checks if the cache file exists and is not expired."""
@@ -65,24 +86,150 @@ def is_cache_valid(cache_path):
         return False
     
     file_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(cache_path))
-    if file_age > timedelta(hours=CACHE_EXPIRY_HOURS):
-        print(f"⚠️ Cache expired ({file_age.total_seconds() / 3600:.1f} hours old).")
-        return False
-        
-    return True
+    return file_age <= timedelta(hours=CACHE_EXPIRY_HOURS)
 
-def save_to_cache(data, period):
-    path = get_cache_path(period)
-    with open(path, 'wb') as f:
-        pickle.dump(data, f)
-    print(f"💾 Data saved to local cache: {path}")
+def flatten_columns(df):
+    """Drops the ticker level from yfinance MultiIndex columns, keeping Open/High/Low/Close/..."""
+    if not isinstance(df.columns, pd.MultiIndex):
+        return df
+    level = next((i for i in range(df.columns.nlevels) if "Close" in df.columns.get_level_values(i)), 0)
+    df = df.copy()
+    df.columns = df.columns.get_level_values(level)
+    return df
 
-def load_from_cache(period):
-    path = get_cache_path(period)
+def _write_frame(df, path):
+    df = flatten_columns(df)
+    if CACHE_FORMAT == "parquet":
+        df.to_parquet(path)
+    else:
+        with open(path, 'wb') as f:
+            pickle.dump(df, f)
+
+def _read_frame(path, columns=None):
+    if CACHE_FORMAT == "parquet":
+        return pd.read_parquet(path, columns=columns)
     with open(path, 'rb') as f:
-        data = pickle.load(f)
-    print(f"📖 Loaded data from local cache: {path}")
-    return data
+        df = pickle.load(f)
+    if columns:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+def save_to_cache(data, period):
+    """Writes each ticker's DataFrame to its own cache file."""
+    os.makedirs(get_cache_path(period), exist_ok=True)
+    for ticker, df in data.items():
+        if df is not None and not df.empty:
+            _write_frame(df, get_ticker_cache_path(period, ticker))
+    print(f"💾 {len(data)} stocks saved to local cache: {get_cache_path(period)}")
+
+def load_from_cache(period, tickers=None, columns=None):
+    """
+    Returns a lazy {ticker: DataFrame} view of the valid cache files for a period.
+    Frames are read from disk on first access only.
+    """
+    _migrate_legacy_pickle(period)
+    if tickers is None:
+        ext = f".{CACHE_FORMAT}"
+        folder = get_cache_path(period)
+        files = os.listdir(folder) if os.path.isdir(folder) else []
+        tickers = [f[:-len(ext)] for f in files if f.endswith(ext)]
+    sources = {}
+    for t in tickers:
+        path = get_ticker_cache_path(period, t)
+        if is_cache_valid(path):
+            sources[t] = (path, period)
+    return LazyPriceDict(sources, period, columns)
+
+def _migrate_legacy_pickle(period):
+    """Splits an old whole-dict stock_data_{period}.pkl into per-ticker files once."""
+    legacy = os.path.join(CACHE_DIR, f"stock_data_{period}.pkl")
+    if not os.path.exists(legacy):
+        return
+    if is_cache_valid(legacy):
+        mtime = os.path.getmtime(legacy)
+        with open(legacy, 'rb') as f:
+            data = pickle.load(f)
+        os.makedirs(get_cache_path(period), exist_ok=True)
+        for ticker, df in data.items():
+            if df is not None and not df.empty:
+                path = get_ticker_cache_path(period, ticker)
+                _write_frame(df, path)
+                os.utime(path, (mtime, mtime))   # keep the original download time for expiry
+        print(f"📦 Migrated legacy cache {legacy} ({len(data)} stocks) to per-ticker files.")
+    os.remove(legacy)
+
+class LazyPriceDict(Mapping):
+    """
+    Read-only {ticker: DataFrame} mapping backed by per-ticker cache files.
+
+    Each frame is loaded (optionally only ``columns``) and sliced to ``period``
+    on first access and kept in memory afterwards. Frames that were just
+    downloaded can be passed in ``loaded`` to skip the disk read.
+    """
+
+    def __init__(self, sources, period, columns=None, loaded=None):
+        self._sources = dict(sources)          # ticker -> (path, cached period)
+        self._period = period
+        self._columns = list(columns) if columns else None
+        self._loaded = {}
+        for ticker, df in (loaded or {}).items():
+            self._loaded[ticker] = self._project(df)
+            self._sources.setdefault(ticker, (None, period))
+
+    def _project(self, df):
+        if self._columns:
+            df = df[[c for c in self._columns if c in df.columns]]
+        return df
+
+    def __getitem__(self, ticker):
+        if ticker not in self._loaded:
+            path, cached_period = self._sources[ticker]
+            df = _read_frame(path, self._columns)
+            if cached_period != self._period:
+                df = slice_frame(df, self._period)
+            self._loaded[ticker] = df
+        return self._loaded[ticker]
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def __len__(self):
+        return len(self._sources)
+
+def slice_frame(df, period):
+    """
+    Slices one DataFrame to match the requested period.
+    """
+    if df.empty or period == "max":
+        return df
+    
+    # Determine the start date for the slice
+    last_date = df.index.max()
+    
+    if period == "1d":
+        return df.tail(1)
+    elif period == "5d":
+        # For 5d, we skip time-based slicing and just take last 5 trading days 
+        # as it's more reliable for small sessions
+        return df.tail(5)
+    elif period == "1mo":
+        start_date = last_date - pd.DateOffset(months=1)
+    elif period == "3mo":
+        start_date = last_date - pd.DateOffset(months=3)
+    elif period == "6mo":
+        start_date = last_date - pd.DateOffset(months=6)
+    elif period == "1y":
+        start_date = last_date - pd.DateOffset(years=1)
+    elif period == "2y":
+        start_date = last_date - pd.DateOffset(years=2)
+    elif period == "5y":
+        start_date = last_date - pd.DateOffset(years=5)
+    elif period == "ytd":
+        start_date = datetime(last_date.year, 1, 1)
+    else:
+        # Fallback for others (2y, 5y, etc.)
+        return df
+    return df[df.index >= start_date]
 
 def slice_data_dict(data_dict, period):
     """
@@ -90,146 +237,231 @@ def slice_data_dict(data_dict, period):
     """
     if not data_dict or period == "max":
         return data_dict
-    
-    sliced_dict = {}
-    for ticker, df in data_dict.items():
-        if df.empty:
-            sliced_dict[ticker] = df
-            continue
-            
-        # Determine the start date for the slice
-        last_date = df.index.max()
-        
-        if period == "1d":
-            sliced_dict[ticker] = df.tail(1)
-        elif period == "5d":
-            # For 5d, we skip time-based slicing and just take last 5 trading days 
-            # as it's more reliable for small sessions
-            sliced_dict[ticker] = df.tail(5)
-        elif period == "1mo":
-            start_date = last_date - pd.DateOffset(months=1)
-            sliced_dict[ticker] = df[df.index >= start_date]
-        elif period == "3mo":
-            start_date = last_date - pd.DateOffset(months=3)
-            sliced_dict[ticker] = df[df.index >= start_date]
-        elif period == "6mo":
-            start_date = last_date - pd.DateOffset(months=6)
-            sliced_dict[ticker] = df[df.index >= start_date]
-        elif period == "1y":
-            start_date = last_date - pd.DateOffset(years=1)
-            sliced_dict[ticker] = df[df.index >= start_date]
-        elif period == "2y":
-            start_date = last_date - pd.DateOffset(years=2)
-            sliced_dict[ticker] = df[df.index >= start_date]
-        elif period == "5y":
-            start_date = last_date - pd.DateOffset(years=5)
-            sliced_dict[ticker] = df[df.index >= start_date]
-        elif period == "ytd":
-            start_date = datetime(last_date.year, 1, 1)
-            sliced_dict[ticker] = df[df.index >= start_date]
-        else:
-            # Fallback for others (2y, 5y, etc.)
-            sliced_dict[ticker] = df
-            
-    return sliced_dict
+    return {ticker: slice_frame(df, period) for ticker, df in data_dict.items()}
 
 # ======================================================
 # 📥 DATA FETCHING
 # ======================================================
 
-def fetch_all_data(tickers, period="1y", interval="1d"):
+def yfinance_downloader(tickers, interval="1d", period=None, start=None):
+    """
+    Default data source: returns {ticker: OHLCV DataFrame} for one batch.
+
+    Uses one Ticker.history call per symbol (DOWNLOAD_THREADS at a time)
+    rather than yf.download, which keeps its results in module-level globals
+    and is not safe to run for several batches at once. Symbols that fail or
+    come back empty are simply absent from the result.
+    """
+    window = {"start": start} if start is not None else {"period": period}
+
+    def one(ticker):
+        df = yf.Ticker(ticker).history(**window, interval=interval, auto_adjust=False, actions=False)
+        df = flatten_columns(df).dropna(how='all')
+        # Match yf.download: daily and longer bars carry tz-naive dates
+        if interval[-1] not in "mh" and isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+            df.index = df.index.tz_localize(None)
+        df.index.name = "Date" if interval[-1] not in "mh" else "Datetime"
+        return df
+
+    data = {}
+    with ThreadPoolExecutor(max_workers=min(DOWNLOAD_THREADS, len(tickers))) as pool:
+        futures = {pool.submit(one, t): t for t in tickers}
+        for fut in as_completed(futures):
+            try:
+                df = fut.result()
+            except Exception:
+                continue
+            if not df.empty:
+                data[futures[fut]] = df
+    return data
+
+# Pluggable source: any callable(tickers, interval=, period=, start=) -> {ticker: DataFrame}
+DOWNLOADER = yfinance_downloader
+
+def fetch_all_data(tickers, period="1y", interval="1d", start=None, downloader=None):
     """
     Fetches data for all provided tickers with batching and progress tracking.
+    If start is given, only bars from that date onwards are downloaded.
+
+    Up to MAX_INFLIGHT_BATCHES batches run concurrently. A batch that errors
+    or returns nothing doubles the pause before the next submission (up to
+    BACKOFF_MAX); successful batches ease it back to BATCH_DELAY. Tickers
+    missing from a batch result are re-queued, up to MAX_TICKER_RETRIES times.
+    ``downloader`` (default DOWNLOADER) can be swapped for a fake source.
     """
+    downloader = downloader or DOWNLOADER
     data_dict = {}
-    print(f"\n📥 [StockDataManager] Fetching data for {len(tickers)} stocks (Period: {period}, Interval: {interval})...")
+    span = f"Start: {start}" if start is not None else f"Period: {period}"
+    print(f"\n📥 [StockDataManager] Fetching data for {len(tickers)} stocks ({span}, Interval: {interval})...")
 
-    # Use a progress bar for batches
-    num_batches = (len(tickers) + BATCH_SIZE - 1) // BATCH_SIZE
-    
-    with tqdm(total=len(tickers), desc="📥 Downloading Data", unit="stock") as pbar:
-        for i in range(0, len(tickers), BATCH_SIZE):
-            chunk = tickers[i:i + BATCH_SIZE]
-            try:
-                # Bulk download using yfinance
-                df_bulk = yf.download(chunk, period=period, interval=interval, group_by='ticker', auto_adjust=False, actions=False, threads=True, progress=False)
-                
-                # Normalize handling for single vs multi-stock chunks
-                if len(chunk) == 1:
-                    ticker = chunk[0]
-                    if not df_bulk.empty:
-                        data_dict[ticker] = df_bulk
+    queue = deque(tickers[i:i + BATCH_SIZE] for i in range(0, len(tickers), BATCH_SIZE))
+    attempts = {}
+    dropped = []
+    delay = BATCH_DELAY
+    submitted = 0
+
+    with ThreadPoolExecutor(max_workers=MAX_INFLIGHT_BATCHES) as pool, \
+         tqdm(total=len(tickers), desc="📥 Downloading Data", unit="stock") as pbar:
+        pending = {}
+        while queue or pending:
+            while queue and len(pending) < MAX_INFLIGHT_BATCHES:
+                # API rate limit safety
+                if submitted:
+                    time.sleep(delay)
+                chunk = queue.popleft()
+                pending[pool.submit(downloader, chunk, interval=interval, period=period, start=start)] = chunk
+                submitted += 1
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                chunk = pending.pop(fut)
+                try:
+                    result = fut.result() or {}
+                    error = None
+                except Exception as e:
+                    result, error = {}, e
+                got = {t: df for t, df in result.items() if t in chunk and df is not None and not df.empty}
+                data_dict.update(got)
+
+                # Adaptive back-off
+                if error is not None or not got:
+                    delay = min(max(delay * 2, 1.0), BACKOFF_MAX)
+                    if error is not None:
+                        print(f"⚠️ Error in batch ({len(chunk)} stocks): {error}")
                 else:
-                    for ticker in chunk:
-                        try:
-                            df_stock = df_bulk[ticker].copy()
-                            df_stock.dropna(how='all', inplace=True)
-                            if not df_stock.empty:
-                                data_dict[ticker] = df_stock
-                        except KeyError:
-                            pass
-                            
-            except Exception as e:
-                print(f"⚠️ Error in batch {i//BATCH_SIZE + 1}: {e}")
-            
-            pbar.update(len(chunk))
-            
-            # API rate limit safety
-            if i + BATCH_SIZE < len(tickers):
-                time.sleep(BATCH_DELAY)
+                    delay = max(BATCH_DELAY, delay / 2)
+
+                # Re-queue individual failures
+                retry = []
+                for t in chunk:
+                    if t in got:
+                        continue
+                    attempts[t] = attempts.get(t, 0) + 1
+                    if attempts[t] <= MAX_TICKER_RETRIES:
+                        retry.append(t)
+                    else:
+                        dropped.append(t)
+                for i in range(0, len(retry), BATCH_SIZE):
+                    queue.append(retry[i:i + BATCH_SIZE])
+                pbar.update(len(chunk) - len(retry))
 
     print(f"\n✅ [StockDataManager] Successfully fetched {len(data_dict)} stocks.")
+    if dropped:
+        print(f"⚠️ No data after {MAX_TICKER_RETRIES + 1} attempts for {len(dropped)} stocks: {', '.join(dropped[:10])}{' ...' if len(dropped) > 10 else ''}")
     return data_dict
 
-def get_data(tickers=None, period="1y", interval="1d", force_refresh=False):
+def _adjustment_detected(cached, fresh):
     """
-    Main entry point for retrieving data. Check cache first, then larger caches, then fetch.
+    True if the re-downloaded reference bar (second-last cached bar) no longer
+    matches the cache, i.e. yfinance has re-adjusted history for a split or
+    dividend. The last cached bar is not used because it may have been a
+    partial intraday bar.
     """
-    cache_path = get_cache_path(period)
-    
-    # 1. Check if exact period cache exists and is valid
-    if not force_refresh and is_cache_valid(cache_path):
-        data = load_from_cache(period)
-        return _prepare_return_data(data, tickers, period, interval)
+    ref = cached.index[-2]
+    if ref not in fresh.index:
+        return True
+    for col in ("Close", "Adj Close"):
+        if col in cached.columns and col in fresh.columns:
+            old, new = cached.at[ref, col], fresh.at[ref, col]
+            if pd.notna(old) and pd.notna(new) and old and abs(new / old - 1) > ADJUSTMENT_TOLERANCE:
+                return True
+    return False
 
-    # 2. Check if a larger period cache exists and is valid
-    if not force_refresh:
-        try:
-            req_idx = PERIOD_ORDER.index(period)
-            # Look at all periods larger than the requested one
-            for p in PERIOD_ORDER[req_idx + 1:]:
-                larger_path = get_cache_path(p)
-                if is_cache_valid(larger_path):
-                    print(f"💡 Larger valid cache found ({p}). Slicing for {period}...")
-                    data = load_from_cache(p)
-                    data = slice_data_dict(data, period)
-                    return _prepare_return_data(data, tickers, period, interval)
-        except ValueError:
-            pass # period not in PERIOD_ORDER
-
-    # 3. Fresh fetch required
+def top_up_cache(tickers, period="1y", interval="1d"):
+    """
+    Appends only the bars after each ticker's cached data instead of
+    re-downloading the whole period. Tickers are grouped by their restart
+    date so each group is one batched download; the overlapping bar is
+    compared with the cache and any ticker whose history was re-adjusted
+    is left out (for a full refresh by the caller).
+
+    Returns {ticker: updated DataFrame} for the tickers that were topped up.
+    """
+    cached = {}
+    for ticker in tickers:
+        path = get_ticker_cache_path(period, ticker)
+        if os.path.exists(path):
+            df = _read_frame(path)
+            if len(df) >= 2:
+                cached[ticker] = df
+
+    # Restart from the second-last cached bar: it is re-checked, the last one is replaced
+    by_start = {}
+    for ticker, df in cached.items():
+        by_start.setdefault(df.index[-2], []).append(ticker)
+
+    updated, adjusted, new_bars = {}, [], 0
+    for start, group in by_start.items():
+        fresh = fetch_all_data(group, period, interval, start=start.strftime("%Y-%m-%d"))
+        for ticker in group:
+            new = fresh.get(ticker)
+            if new is None or new.empty:
+                continue
+            old = cached[ticker]
+            if _adjustment_detected(old, new):
+                adjusted.append(ticker)
+                continue
+            merged = pd.concat([old[old.index < start], new])
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+            new_bars += len(merged) - len(old)
+            updated[ticker] = slice_frame(merged, period)
+
+    if updated:
+        save_to_cache(updated, period)
+        print(f"🔄 Topped up {len(updated)} stocks with {new_bars} new bars.")
+    if adjusted:
+        print(f"⚠️ Split/dividend adjustment detected for {len(adjusted)} stocks: {', '.join(adjusted[:10])}{' ...' if len(adjusted) > 10 else ''}")
+    return updated
+
+def get_data(tickers=None, period="1y", interval="1d", force_refresh=False, columns=None):
+    """
+    Main entry point for retrieving data. Each ticker is served from its own
+    valid cache file (exact period first, then larger periods sliced down);
+    expired tickers are topped up with only their new bars, and only tickers
+    with no cache (or re-adjusted history) are downloaded in full.
+
+    Returns a lazy {ticker: DataFrame} mapping; pass ``columns`` (e.g.
+    ["Close", "Volume"]) to read only those columns from disk.
+    """
     if tickers is None:
         tickers = get_combined_ticker_list()
-        
-    data = fetch_all_data(tickers, period, interval)
-    if data:
-        save_to_cache(data, period)
-    return data
+    tickers = list(dict.fromkeys(tickers))
 
-def _prepare_return_data(data, tickers, period, interval):
-    """Helper to filter by tickers and handle missing data."""
-    if not tickers:
-        return data
-        
-    filtered_data = {t: data[t] for t in tickers if t in data}
-    
-    # If we are missing more than 20% of requested tickers, refetch
-    missing = set(tickers) - set(data.keys())
-    if missing and len(missing) > len(tickers) * 0.2:
-        print(f"⚠️ Cache missing {len(missing)} stocks. Refetching...")
-        return get_data(tickers, period, interval, force_refresh=True)
-    
-    return filtered_data
+    # 1. Per-ticker lookup: exact period cache, then larger period caches
+    sources = {}
+    if not force_refresh:
+        candidates = [period]
+        if period in PERIOD_ORDER:
+            candidates += PERIOD_ORDER[PERIOD_ORDER.index(period) + 1:]
+        for p in candidates:
+            _migrate_legacy_pickle(p)
+        for ticker in tickers:
+            for p in candidates:
+                path = get_ticker_cache_path(p, ticker)
+                if is_cache_valid(path):
+                    sources[ticker] = (path, p)
+                    break
+        sliced = sum(1 for _, p in sources.values() if p != period)
+        if sources:
+            print(f"📖 {len(sources)} stocks served from local cache ({sliced} sliced from larger periods).")
+
+    # 2. Expired tickers: append only the new bars where possible
+    missing = [t for t in tickers if t not in sources]
+    fresh = {}
+    if missing and INCREMENTAL_UPDATE and not force_refresh:
+        fresh = top_up_cache(missing, period, interval)
+        missing = [t for t in missing if t not in fresh]
+
+    # 3. Full download for missing tickers and re-adjusted histories
+    if missing:
+        if sources or fresh:
+            print(f"⚠️ {len(missing)} stocks missing, expired or re-adjusted. Fetching full period...")
+        full = fetch_all_data(missing, period, interval)
+        if full:
+            save_to_cache(full, period)
+        fresh.update(full)
+
+    return LazyPriceDict(sources, period, columns, loaded=fresh)
 
 if __name__ == "__main__":
     # Test fetch (first 10 stocks)
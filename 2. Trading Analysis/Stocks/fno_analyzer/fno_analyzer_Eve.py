@@ -2,29 +2,13 @@ import NseKit
 import pandas as pd
 import datetime
 import os
-import time
 import shutil
 import glob
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-
-def get_option_history(get, symbol, strike, opt_type, trade_date, expiry):
-    """Fetches historical option data with safety and formatting."""
-    print(f"   Fetching history for {symbol} {strike}{opt_type}...")
-    try:
-        # User requested: get.option_price_volume_data(symbol, instrument, strike, type, date, expiry)
-        # Using TRADE_DATE as requested.
-        df_hist = get.option_price_volume_data(symbol, "Stock Options", str(strike), opt_type, trade_date, expiry=expiry)
-        if df_hist is not None and not df_hist.empty:
-            # Clean and ensure numeric
-            needed_cols = ['FH_OPEN_INT', 'FH_CHANGE_IN_OI', 'FH_TIMESTAMP', 'FH_UNDERLYING_VALUE']
-            for col in needed_cols:
-                if col in df_hist.columns and col != 'FH_TIMESTAMP':
-                    df_hist[col] = pd.to_numeric(df_hist[col], errors='coerce')
-            return df_hist
-    except Exception as e:
-        print(f"      Error fetching history: {e}")
-    return None
+from fno_analyzer_Live import (
+    compute_sr_levels, sr_levels_dict, classify_tickers, chart_contract, get_option_histories, history_key
+)
 
 def plot_option_charts(df_hist, symbol, strike, opt_type, plot_flag, save_flag, ranking_metric, s1=None, s2=None, r1=None, r2=None, ltp_val=None, ltp_date=None):
     """Plots dual-subplot interactive charts with horizontal S/R dotted lines and conditional coloring."""
@@ -279,84 +263,36 @@ def fno_analysis(ranking_metric, df_bhav, df_live, target_expiry, trade_date, pl
     
     df_filtered = df_bhav[df_bhav['xpry_dt'] == target_expiry].copy()
 
-    # 3. Calculate Support/Resistance
-    sr_levels = {}
-    symbols = df_filtered['ticker'].unique()
-    
-    for symbol in symbols:
-        ticker_df = df_filtered[df_filtered['ticker'] == symbol]
-        
-        # CE -> Resistance (Rank by metric, then pick top 2)
-        ce_df = ticker_df[ticker_df['optn_tp'] == 'CE'].sort_values(by=sort_column, ascending=False).head(2)
-        r_list = []
-        for _, r in ce_df.iterrows():
-            r_list.append({'strike': r['strk_prc'], 'val': r['strk_prc'] + r['high_prc'], 'm': r[sort_column]})
-            
-        # PE -> Support (Rank by metric, then pick top 2)
-        pe_df = ticker_df[ticker_df['optn_tp'] == 'PE'].sort_values(by=sort_column, ascending=False).head(2)
-        s_list = []
-        for _, r in pe_df.iterrows():
-            s_list.append({'strike': r['strk_prc'], 'val': r['strk_prc'] - r['high_prc'], 'm': r[sort_column]})
-            
-        if r_list or s_list:
-            # Assign strictly by Rank (as requested: First High is R1/S1)
-            sr_levels[symbol] = {
-                'R1': r_list[0]['val'] if len(r_list) > 0 else None,
-                'R2': r_list[1]['val'] if len(r_list) > 1 else None,
-                'S1': s_list[0]['val'] if len(s_list) > 0 else None,
-                'S2': s_list[1]['val'] if len(s_list) > 1 else None,
-                'R1_Metric': r_list[0]['m'] if len(r_list) > 0 else 0,
-                'S1_Metric': s_list[0]['m'] if len(s_list) > 0 else 0,
-                'R2_Metric': r_list[1]['m'] if len(r_list) > 1 else 0,
-                'S2_Metric': s_list[1]['m'] if len(s_list) > 1 else 0,
-                'R1_Strike': r_list[0]['strike'] if len(r_list) > 0 else None,
-                'R2_Strike': r_list[1]['strike'] if len(r_list) > 1 else None,
-                'S1_Strike': s_list[0]['strike'] if len(s_list) > 0 else None,
-                'S2_Strike': s_list[1]['strike'] if len(s_list) > 1 else None
-            }
+    # 3. Calculate Support/Resistance (all tickers in one grouped pass)
+    sr_levels = sr_levels_dict(compute_sr_levels(df_filtered, sort_column))
 
     # 5. Analyze Relationship
     results = []
     trend_results = []
-    match_count = 0
-    
-    for ticker, sr in sr_levels.items():
-        if ticker not in df_live.index: continue
-        try:
-            ltp = float(df_live.loc[ticker, 'lastPrice'])
-        except: continue
-        match_count += 1
-
+    levels = classify_tickers(sr_levels, df_live)
+    match_count = len(levels)
+
+    # Chart histories for every Near S1/R1 contract, fetched in one bulk call
+    histories = {}
+    if plot_charts or save_charts:
+        # Expiry format for history: DD-MM-YYYY (target_expiry is YYYY-MM-DD from config)
+        exp_formatted = datetime.datetime.strptime(target_expiry, '%Y-%m-%d').strftime('%d-%m-%Y')
+        contracts = [
+            (ticker, *chart_contract(status, sr_levels[ticker]), "Stock Options")
+            for ticker, (ltp, status, is_opp) in levels.items() if chart_contract(status, sr_levels[ticker])
+        ]
+        histories = get_option_histories(get, contracts, trade_date, exp_formatted, from_bhav=True)
+
+    for ticker, (ltp, status, is_opp) in levels.items():
+        sr = sr_levels[ticker]
         s1, s2 = sr.get('S1'), sr.get('S2')
         r1, r2 = sr.get('R1'), sr.get('R2')
-        
-        # Calculate zone range (since R1 may be > R2 or vice versa based on rank)
-        s_min, s_max = (min(s1, s2), max(s1, s2)) if s1 and s2 else (None, None)
-        r_min, r_max = (min(r1, r2), max(r1, r2)) if r1 and r2 else (None, None)
-
-        status = "Range Bound"
-        is_opp = False
-        
-        # Zone check (Correctly handle range regardless of which rank had higher price)
-        if s_min and s_max and s_min <= ltp <= s_max:
-            status, is_opp = "Inside Support Zone (S1-S2)", True
-        elif r_min and r_max and r_min <= ltp <= r_max:
-            status, is_opp = "Inside Resistance Zone (R1-R2)", True
-        elif s1 and abs(ltp - s1) / s1 <= 0.005: status, is_opp = "Near Support (S1)", True
-        elif r1 and abs(ltp - r1) / r1 <= 0.005: status, is_opp = "Near Resistance (R1)", True
-        elif r1 and ltp > r1: status = "Above Resistance"
-        elif s1 and ltp < s1: status = "Below Support"
 
         # Chart Generation for Near S1/R1
-        if (plot_charts or save_charts) and status in ["Near Support (S1)", "Near Resistance (R1)"]:
-            s_type = "PE" if "Support" in status else "CE"
-            s_strike = sr.get('S1_Strike') if "Support" in status else sr.get('R1_Strike')
-            # Expiry format for history: DD-MM-YYYY (Match target_expiry if it's already in that format)
-            # target_expiry is YYYY-MM-DD from config, let's fix it
-            exp_obj = datetime.datetime.strptime(target_expiry, '%Y-%m-%d')
-            exp_formatted = exp_obj.strftime('%d-%m-%Y')
-            
-            df_hist = get_option_history(get, ticker, s_strike, s_type, trade_date, exp_formatted)
+        chart = chart_contract(status, sr) if (plot_charts or save_charts) else None
+        if chart:
+            s_strike, s_type = chart
+            df_hist = histories.get(history_key(ticker, s_strike, s_type))
             if df_hist is not None:
                 plot_option_charts(
                     df_hist, ticker, s_strike, s_type, plot_charts, save_charts, ranking_metric,
@@ -376,9 +312,7 @@ def fno_analysis(ranking_metric, df_bhav, df_live, target_expiry, trade_date, pl
                     'OI_Chng_Prev2': last_3[-3] if len(last_3) >= 3 else 0,
                 })
                 # -----------------------
-                
-                time.sleep(1) # Rate limit delay
-            
+
         results.append({
             'Symbol': ticker, 'LTP': ltp, 
             'S2_Strike': sr.get('S2_Strike'), 'S2': s2, 
@@ -3,29 +3,81 @@ import pandas as pd
 import numpy as np
 import datetime
 import os
-import time
 import shutil
 import glob
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-def get_option_history(get, symbol, strike, opt_type, trade_date, expiry, instrument="Stock Options"):
-    """Fetches historical option data with safety and formatting."""
-    print(f"   Fetching history for {symbol} {strike}{opt_type} ({instrument})...")
+CONTRACT_COLS = ['Symbol', 'Instrument', 'Expiry', 'Strike', 'OptionType']
+
+def get_option_histories(get, contracts, trade_date, expiry, from_bhav=False):
+    """
+    Fetches historical option data for many (symbol, strike, opt_type, instrument) contracts
+    in one bulk call (one request per symbol/expiry). Returns {(symbol, strike, opt_type): df}.
+    from_bhav=True rebuilds the history from locally archived F&O bhavcopies instead
+    (only trade dates not yet archived are downloaded).
+    """
+    if not contracts: return {}
+    print(f"   Fetching history for {len(contracts)} contracts ({'bhavcopy archive' if from_bhav else 'bulk'})...")
     try:
         # Using TRADE_DATE as requested.
-        df_hist = get.option_price_volume_data(symbol, instrument, str(strike), opt_type, trade_date, expiry=expiry)
-        if df_hist is not None and not df_hist.empty:
-            # Clean and ensure numeric
-            needed_cols = ['FH_OPEN_INT', 'FH_CHANGE_IN_OI', 'FH_TIMESTAMP', 'FH_UNDERLYING_VALUE']
-            for col in needed_cols:
-                if col in df_hist.columns and col != 'FH_TIMESTAMP':
-                    df_hist[col] = pd.to_numeric(df_hist[col], errors='coerce')
-            return df_hist
+        fetch = get.fno_eod_contract_history if from_bhav else get.option_price_volume_data_many
+        df_all = fetch(
+            [(symbol, instrument, strike, opt_type, expiry) for symbol, strike, opt_type, instrument in contracts],
+            from_date=trade_date)
     except Exception as e:
         print(f"      Error fetching history: {e}")
+        return {}
+    if df_all is None or df_all.empty: return {}
+
+    # Clean and ensure numeric
+    for col in ['FH_OPEN_INT', 'FH_CHANGE_IN_OI', 'FH_UNDERLYING_VALUE']:
+        if col in df_all.columns:
+            df_all[col] = pd.to_numeric(df_all[col], errors='coerce')
+    return {
+        (symbol, strike, opt_type): grp.drop(columns=CONTRACT_COLS).reset_index(drop=True)
+        for (symbol, strike, opt_type), grp in df_all.groupby(['Symbol', 'Strike', 'OptionType'], sort=False)
+    }
+
+def history_key(symbol, strike, opt_type):
+    """Key of a contract in get_option_histories' result."""
+    return (symbol, round(float(strike), 2), opt_type)
+
+def classify_level(ltp, sr):
+    """Relation of LTP to the S1/S2/R1/R2 levels -> (status, is_opportunity)."""
+    s1, s2 = sr.get('S1'), sr.get('S2')
+    r1, r2 = sr.get('R1'), sr.get('R2')
+
+    # Calculate zone range (since R1 may be > R2 or vice versa based on rank)
+    s_min, s_max = (min(s1, s2), max(s1, s2)) if s1 and s2 else (None, None)
+    r_min, r_max = (min(r1, r2), max(r1, r2)) if r1 and r2 else (None, None)
+
+    # Zone check (Correctly handle range regardless of which rank had higher price)
+    if s_min and s_max and s_min <= ltp <= s_max: return "Inside Support Zone (S1-S2)", True
+    if r_min and r_max and r_min <= ltp <= r_max: return "Inside Resistance Zone (R1-R2)", True
+    if s1 and abs(ltp - s1) / s1 <= 0.005: return "Near Support (S1)", True
+    if r1 and abs(ltp - r1) / r1 <= 0.005: return "Near Resistance (R1)", True
+    if r1 and ltp > r1: return "Above Resistance", False
+    if s1 and ltp < s1: return "Below Support", False
+    return "Range Bound", False
+
+def chart_contract(status, sr):
+    """(strike, option type) charted for a Near S1/R1 status, else None."""
+    if status == "Near Support (S1)": return sr.get('S1_Strike'), "PE"
+    if status == "Near Resistance (R1)": return sr.get('R1_Strike'), "CE"
     return None
 
+def classify_tickers(sr_levels, df_live):
+    """{ticker: (ltp, status, is_opp)} for every S/R ticker with a live price."""
+    levels = {}
+    for ticker, sr in sr_levels.items():
+        if ticker not in df_live.index: continue
+        try:
+            ltp = float(df_live.loc[ticker, 'lastPrice'])
+        except: continue
+        levels[ticker] = (ltp, *classify_level(ltp, sr))
+    return levels
+
 def plot_option_charts(df_hist, symbol, strike, opt_type, plot_flag, save_flag, ranking_metric, s1=None, s2=None, r1=None, r2=None, ltp_val=None, ltp_date=None):
     """Plots dual-subplot interactive charts with horizontal S/R dotted lines and conditional coloring."""
     if df_hist is None or df_hist.empty: return
@@ -295,6 +347,57 @@ def fetch_and_clean_data(trade_date, use_live=True, ltp_date=None):
 
     return df_bhav, df_live
 
+def _wide_col(wide, field, label, tickers):
+    """Returns the ``field``/``label`` column of a pivoted S/R frame, aligned to ``tickers``."""
+    return wide[field].get(label, pd.Series(dtype=float)).reindex(tickers).to_numpy()
+
+
+def compute_sr_levels(df_filtered, sort_column, top_n=2):
+    """Ranks CE/PE strikes for every ticker at once and returns one S/R frame.
+
+    CE strikes give resistance (strike + high), PE strikes give support
+    (strike - high); rank 1 by ``sort_column`` is R1/S1, rank 2 is R2/S2.
+    The result is indexed by ticker with R/S levels, _Metric, _Strike and
+    instrm_type columns, in the ticker order of ``df_filtered``.  The sort
+    is stable: strikes tied on ``sort_column`` keep their input order.
+    """
+    opts = df_filtered[df_filtered['optn_tp'].isin(['CE', 'PE'])]
+    ranked = (opts.sort_values(sort_column, ascending=False, kind='mergesort')
+                  .groupby(['ticker', 'optn_tp'], sort=False, observed=True).head(top_n))
+    rank = ranked.groupby(['ticker', 'optn_tp'], sort=False, observed=True).cumcount() + 1
+    is_ce = (ranked['optn_tp'] == 'CE').to_numpy()
+    strike = ranked['strk_prc'].to_numpy(dtype=float)
+    high = ranked['high_prc'].to_numpy(dtype=float)
+
+    long = pd.DataFrame({
+        'ticker': ranked['ticker'].astype(object).to_numpy(),
+        'label': np.where(is_ce, 'R', 'S').astype(object) + rank.astype(str).to_numpy(dtype=object),
+        'val': np.where(is_ce, strike + high, strike - high),
+        'Metric': ranked[sort_column].to_numpy(dtype=float),
+        'Strike': strike,
+        'n': 1,
+    })
+    wide = long.pivot(index='ticker', columns='label', values=['val', 'Metric', 'Strike', 'n'])
+
+    tickers = pd.unique(opts['ticker'].astype(object))
+    levels = pd.DataFrame(index=pd.Index(tickers, name='ticker'))
+    for side in ('R', 'S'):
+        for i in range(1, top_n + 1):
+            label = f"{side}{i}"
+            present = pd.notna(_wide_col(wide, 'n', label, tickers))
+            levels[label] = _wide_col(wide, 'val', label, tickers)
+            # Missing ranks report a metric of 0, as the per-ticker loop did
+            levels[f"{label}_Metric"] = np.where(present, _wide_col(wide, 'Metric', label, tickers), 0)
+            levels[f"{label}_Strike"] = _wide_col(wide, 'Strike', label, tickers)
+    levels['instrm_type'] = df_filtered.groupby('ticker', sort=False, observed=True)['instrm_type'].first().astype(object).reindex(tickers).to_numpy()
+    return levels
+
+
+def sr_levels_dict(levels):
+    """Converts a compute_sr_levels frame to {ticker: {...}} with None for missing levels."""
+    return levels.astype(object).where(levels.notna(), None).to_dict('index')
+
+
 def fno_analysis(ranking_metric, df_bhav, df_live, df_lots, target_expiry, trade_date, plot_charts=False, save_charts=False, ltp_date=None, is_live_oi_mode=False):
     if df_bhav is None or df_live is None:
         print(f"Skipping {ranking_metric} run due to missing data.")
@@ -318,88 +421,39 @@ def fno_analysis(ranking_metric, df_bhav, df_live, df_lots, target_expiry, trade
     
     df_filtered = df_bhav[df_bhav['xpry_dt'] == target_expiry].copy()
 
-    # 3. Calculate Support/Resistance
-    sr_levels = {}
-    symbols = df_filtered['ticker'].unique()
-    
-    for symbol in symbols:
-        ticker_df = df_filtered[df_filtered['ticker'] == symbol]
-        
-        # CE -> Resistance (Rank by metric, then pick top 2)
-        ce_df = ticker_df[ticker_df['optn_tp'] == 'CE'].sort_values(by=sort_column, ascending=False).head(2)
-        r_list = []
-        for _, r in ce_df.iterrows():
-            r_list.append({'strike': r['strk_prc'], 'val': r['strk_prc'] + r['high_prc'], 'm': r[sort_column]})
-            
-        # PE -> Support (Rank by metric, then pick top 2)
-        pe_df = ticker_df[ticker_df['optn_tp'] == 'PE'].sort_values(by=sort_column, ascending=False).head(2)
-        s_list = []
-        for _, r in pe_df.iterrows():
-            s_list.append({'strike': r['strk_prc'], 'val': r['strk_prc'] - r['high_prc'], 'm': r[sort_column]})
-            
-        if r_list or s_list:
-            # Assign strictly by Rank (as requested: First High is R1/S1)
-            sr_levels[symbol] = {
-                'R1': r_list[0]['val'] if len(r_list) > 0 else None,
-                'R2': r_list[1]['val'] if len(r_list) > 1 else None,
-                'S1': s_list[0]['val'] if len(s_list) > 0 else None,
-                'S2': s_list[1]['val'] if len(s_list) > 1 else None,
-                'R1_Metric': r_list[0]['m'] if len(r_list) > 0 else 0,
-                'S1_Metric': s_list[0]['m'] if len(s_list) > 0 else 0,
-                'R2_Metric': r_list[1]['m'] if len(r_list) > 1 else 0,
-                'S2_Metric': s_list[1]['m'] if len(s_list) > 1 else 0,
-                'R1_Strike': r_list[0]['strike'] if len(r_list) > 0 else None,
-                'R2_Strike': r_list[1]['strike'] if len(r_list) > 1 else None,
-                'S1_Strike': s_list[0]['strike'] if len(s_list) > 0 else None,
-                'S2_Strike': s_list[1]['strike'] if len(s_list) > 1 else None,
-                'instrm_type': ticker_df['instrm_type'].iloc[0]
-            }
+    # 3. Calculate Support/Resistance (all tickers in one grouped pass)
+    sr_levels = sr_levels_dict(compute_sr_levels(df_filtered, sort_column))
 
     # 5. Analyze Relationship
     results = []
     trend_results = []
-    match_count = 0
-    
-    for ticker, sr in sr_levels.items():
-        if ticker not in df_live.index: continue
-        try:
-            ltp = float(df_live.loc[ticker, 'lastPrice'])
-        except: continue
-        match_count += 1
-
+    levels = classify_tickers(sr_levels, df_live)
+    match_count = len(levels)
+
+    # Chart histories for every Near S1/R1 contract, fetched in one bulk call
+    histories = {}
+    if plot_charts or save_charts:
+        # Expiry format for history: DD-MM-YYYY (target_expiry is YYYY-MM-DD from config)
+        exp_formatted = datetime.datetime.strptime(target_expiry, '%Y-%m-%d').strftime('%d-%m-%Y')
+        contracts = []
+        for ticker, (ltp, status, is_opp) in levels.items():
+            chart = chart_contract(status, sr_levels[ticker])
+            if chart:
+                # Determine instrument type
+                inst_type = "Index Options" if sr_levels[ticker].get('instrm_type') == 'IDO' else "Stock Options"
+                contracts.append((ticker, *chart, inst_type))
+        histories = get_option_histories(get, contracts, trade_date, exp_formatted)
+
+    for ticker, (ltp, status, is_opp) in levels.items():
+        sr = sr_levels[ticker]
         s1, s2 = sr.get('S1'), sr.get('S2')
         r1, r2 = sr.get('R1'), sr.get('R2')
-        
-        # Calculate zone range (since R1 may be > R2 or vice versa based on rank)
-        s_min, s_max = (min(s1, s2), max(s1, s2)) if s1 and s2 else (None, None)
-        r_min, r_max = (min(r1, r2), max(r1, r2)) if r1 and r2 else (None, None)
-
-        status = "Range Bound"
-        is_opp = False
-        
-        # Zone check (Correctly handle range regardless of which rank had higher price)
-        if s_min and s_max and s_min <= ltp <= s_max:
-            status, is_opp = "Inside Support Zone (S1-S2)", True
-        elif r_min and r_max and r_min <= ltp <= r_max:
-            status, is_opp = "Inside Resistance Zone (R1-R2)", True
-        elif s1 and abs(ltp - s1) / s1 <= 0.005: status, is_opp = "Near Support (S1)", True
-        elif r1 and abs(ltp - r1) / r1 <= 0.005: status, is_opp = "Near Resistance (R1)", True
-        elif r1 and ltp > r1: status = "Above Resistance"
-        elif s1 and ltp < s1: status = "Below Support"
 
         # Chart Generation for Near S1/R1
-        if (plot_charts or save_charts) and status in ["Near Support (S1)", "Near Resistance (R1)"]:
-            s_type = "PE" if "Support" in status else "CE"
-            s_strike = sr.get('S1_Strike') if "Support" in status else sr.get('R1_Strike')
-            # Expiry format for history: DD-MM-YYYY (Match target_expiry if it's already in that format)
-            # target_expiry is YYYY-MM-DD from config, let's fix it
-            exp_obj = datetime.datetime.strptime(target_expiry, '%Y-%m-%d')
-            exp_formatted = exp_obj.strftime('%d-%m-%Y')
-            
-            # Determine instrument type
-            inst_type = "Index Options" if sr.get('instrm_type') == 'IDO' else "Stock Options"
-            
-            df_hist = get_option_history(get, ticker, s_strike, s_type, trade_date, exp_formatted, instrument=inst_type)
+        chart = chart_contract(status, sr) if (plot_charts or save_charts) else None
+        if chart:
+            s_strike, s_type = chart
+            df_hist = histories.get(history_key(ticker, s_strike, s_type))
             if df_hist is not None:
                 # If using live data, append the current LTP as the latest point for the chart
                 plot_ltp_date = ltp_date
@@ -420,8 +474,10 @@ def fno_analysis(ranking_metric, df_bhav, df_live, df_lots, target_expiry, trade
                     # --- Fetch Live OI/OI Change ONLY if is_live_oi_mode is True ---
                     live_oi, live_oi_chng = None, None
                     if is_live_mode: # This is the local is_live_mode for determining if we should even consider live (False if ltp_date passed)
-                        # 1. Weekend Check (Sat=5, Sun=6)
-                        if target_date_obj.weekday() >= 5:
+                        # 1. Weekend / Holiday Check (offline trading calendar)
+                        calendar = get.trading_calendar()
+                        is_trading_day = calendar.is_trading_day(target_date_obj) if calendar is not None else target_date_obj.weekday() < 5
+                        if not is_trading_day:
                             is_fetch_allowed = False
                         else:
                             is_fetch_allowed = is_live_oi_mode # Use the global control passed to the function
@@ -509,9 +565,7 @@ def fno_analysis(ranking_metric, df_bhav, df_live, df_lots, target_expiry, trade
                     'OI_Chng_Prev2': last_3[-3] if len(last_3) >= 3 else 0,
                 })
                 # -----------------------
-                
-                time.sleep(1) # Rate limit delay
-            
+
         results.append({
             'Symbol': ticker, 'LTP': ltp, 
             'S2_Strike': sr.get('S2_Strike'), 'S2': s2, 